@@ -9,6 +9,11 @@ import random
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
+from ..config import Config
+from ..utils.client_registry import get_requests_session
+from ..utils.rate_limiter import get_request_limiter
+from ..utils.error_handler import get_retry_engine
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -73,6 +78,13 @@ class IdeaCollector:
         logger.info(f"Collected {len(top_ideas)} trending topics")
         return top_ideas
     
+    def _fetch_feed(self, rss_url: str):
+        """피드 1회 요청 - 공유 세션으로 피드 간 커넥션 재사용 (프로세스 간 공유 속도 제한)"""
+        get_request_limiter('feeds', Config.FEEDS_RPM).acquire()
+        response = get_requests_session('feeds').get(rss_url, timeout=(10, 30))
+        response.raise_for_status()
+        return response
+
     def _collect_from_rss(self) -> List[Dict[str, Any]]:
         """RSS 피드에서 아이디어 수집"""
         ideas = []
@@ -80,7 +92,8 @@ class IdeaCollector:
         for rss_url in self.rss_sources:
             try:
                 logger.info(f"Fetching RSS feed: {rss_url}")
-                feed = feedparser.parse(rss_url)
+                response = get_retry_engine('http').call(self._fetch_feed, rss_url)
+                feed = feedparser.parse(response.content, response_headers={k.lower(): v for k, v in response.headers.items()})
                 
                 if feed.bozo:
                     logger.warning(f"RSS feed parsing warning for {rss_url}: {feed.bozo_exception}")
@@ -14,6 +14,15 @@ class Config:
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     NEWS_API_KEY = os.getenv('NEWS_API_KEY')
     
+    # OpenAI 계정 속도 한도 (분당 요청 수 / 분당 토큰 수)
+    OPENAI_RPM = int(os.getenv('OPENAI_RPM', 500))
+    OPENAI_TPM = int(os.getenv('OPENAI_TPM', 200000))
+    
+    # 외부 요청 속도 한도 (분당 요청 수), 같은 호스트의 프로세스 간 공유 여부
+    NEWS_API_RPM = int(os.getenv('NEWS_API_RPM', 30))
+    FEEDS_RPM = int(os.getenv('FEEDS_RPM', 60))
+    RATE_LIMIT_SHARED = os.getenv('RATE_LIMIT_SHARED', 'true').lower() == 'true'
+    
     # Git Configuration
     GIT_USER_NAME = os.getenv('GIT_USER_NAME', 'AutoBot')
     GIT_USER_EMAIL = os.getenv('GIT_USER_EMAIL', 'bot@example.com')
@@ -33,6 +42,64 @@ class Config:
     TOPICS_FILE = APP_DIR / 'topics' / 'topics.yml'
     PROMPTS_DIR = APP_DIR / 'prompts'
     POSTS_DIR = SITE_DIR / '_posts'
+    CACHE_DIR = Path(os.getenv('AUTOBLOG_CACHE_DIR', PROJECT_ROOT / '.cache'))
+    
+    # NewsAPI 할당량 설정 (무료 플랜: 하루 100회)
+    NEWS_API_DAILY_QUOTA = int(os.getenv('NEWS_API_DAILY_QUOTA', 100))
+    NEWS_API_CACHE_TTL_HOURS = float(os.getenv('NEWS_API_CACHE_TTL_HOURS', 12))
+    NEWS_API_PRIORITY_THRESHOLD = int(os.getenv('NEWS_API_PRIORITY_THRESHOLD', 80))
+    
+    # 프롬프트에 포함할 리서치 요약 토큰 예산
+    RESEARCH_TOKEN_BUDGET = int(os.getenv('RESEARCH_TOKEN_BUDGET', 600))
+    
+    # 호출 유형별 토큰 예산 (입력 프롬프트 / 최대 출력)
+    PROMPT_TOKEN_BUDGET_BODY = int(os.getenv('PROMPT_TOKEN_BUDGET_BODY', 4000))
+    PROMPT_TOKEN_BUDGET_SEO_META = int(os.getenv('PROMPT_TOKEN_BUDGET_SEO_META', 1500))
+    COMPLETION_TOKENS_BODY = int(os.getenv('COMPLETION_TOKENS_BODY', 2500))
+    # SEO 메타 출력 한도는 메타 설명(~250토큰)과 숨은 추론 토큰을 함께 감안
+    # (AUXILIARY_REASONING_EFFORT=minimal 기준, 추론 강도를 높이면 함께 늘릴 것)
+    COMPLETION_TOKENS_SEO_META = int(os.getenv('COMPLETION_TOKENS_SEO_META', 1000))
+    
+    # 호출 유형별 모델 라우팅 (본문 / 메타·분류·요약 등 짧은 보조 호출) 및 요청 타임아웃(초)
+    MODEL_BODY = os.getenv('MODEL_BODY', 'gpt-5-mini')
+    MODEL_AUXILIARY = os.getenv('MODEL_AUXILIARY', 'gpt-5-nano')
+    TIMEOUT_BODY = float(os.getenv('TIMEOUT_BODY', 120))
+    TIMEOUT_AUXILIARY = float(os.getenv('TIMEOUT_AUXILIARY', 30))
+    # 보조 호출의 gpt-5 계열 추론 강도 (minimal/low/medium/high, 빈 값이면 모델 기본값)
+    AUXILIARY_REASONING_EFFORT = os.getenv('AUXILIARY_REASONING_EFFORT', 'minimal')
+    
+    # 생성 방식: single(한 번에 전체 본문) / sections(개요 생성 후 섹션 병렬 생성)
+    GENERATION_MODE = os.getenv('GENERATION_MODE', 'single')
+    SECTION_WORKERS = int(os.getenv('SECTION_WORKERS', 4))
+    COMPLETION_TOKENS_SECTION = int(os.getenv('COMPLETION_TOKENS_SECTION', 900))
+    
+    # 레거시 모드: 본문 + SEO 메타데이터를 한 번의 JSON 응답으로 생성
+    COMBINED_SEO_GENERATION = os.getenv('COMBINED_SEO_GENERATION', 'false').lower() == 'true'
+    
+    # 추출 요약 메타 설명의 최소 품질 점수 (미만이면 AI로 생성)
+    META_EXTRACTIVE_MIN_SCORE = float(os.getenv('META_EXTRACTIVE_MIN_SCORE', 0.6))
+    
+    # 학습된 카테고리 분류 모델 (scripts/train_categorizer.py) 및 최소 확률 (미만이면 키워드 규칙)
+    CATEGORY_MODEL_PATH = Path(os.getenv('CATEGORY_MODEL_PATH', CACHE_DIR / 'category_model.npz'))
+    CATEGORY_MIN_CONFIDENCE = float(os.getenv('CATEGORY_MIN_CONFIDENCE', 0.5))
+    
+    # 중복 체크용 포스트 인덱스: _posts 디렉터리 변경이 없어도 파일별 mtime/크기를 다시 확인하는 주기(초)
+    POST_INDEX_RESCAN_SECONDS = float(os.getenv('POST_INDEX_RESCAN_SECONDS', 60))
+    
+    # 리서치 아티팩트 저장 및 오프라인 재현(replay)
+    RESEARCH_ARTIFACTS_ENABLED = os.getenv('RESEARCH_ARTIFACTS_ENABLED', 'true').lower() == 'true'
+    RESEARCH_REPLAY = os.getenv('RESEARCH_REPLAY', 'false').lower() == 'true'
+    
+    # 스트리밍 생성 (초안 파일 기록 + 점진 검증 후 조기 중단)
+    OPENAI_STREAMING = os.getenv('OPENAI_STREAMING', 'false').lower() == 'true'
+    
+    # OpenAI Batch API (seed/대량 생성)
+    OPENAI_BATCH_POLL_SECONDS = float(os.getenv('OPENAI_BATCH_POLL_SECONDS', 30))
+    OPENAI_BATCH_TIMEOUT_HOURS = float(os.getenv('OPENAI_BATCH_TIMEOUT_HOURS', 24))
+    
+    # LLM 응답 캐시 (rw: 읽기/쓰기, ro: 읽기 전용 재현, off: 사용 안 함)
+    LLM_CACHE_MODE = os.getenv('LLM_CACHE_MODE', 'off')
+    LLM_CACHE_MAX_MB = int(os.getenv('LLM_CACHE_MAX_MB', 200))
     
     # Git Configuration (추가)
     GIT_COMMIT_TEMPLATE = os.getenv('GIT_COMMIT_TEMPLATE', 'feat: 새 블로그 글 발행 - {title}')
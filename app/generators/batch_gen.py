@@ -0,0 +1,255 @@
+"""
+OpenAI Batch API 생성 모듈
+시드/대량 생성 요청을 JSONL 배치 파일로 제출하고 완료 후 결과를 수집 (실시간 호출 대비 저렴하고 속도 제한 부담 없음)
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..config import Config
+from ..utils.error_handler import get_retry_engine
+from .content_gen import ContentGenerator
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+
+class BatchGenerator:
+    """OpenAI Batch API 기반 대량 콘텐츠 생성기"""
+
+    def __init__(self, content_generator: ContentGenerator, batch_dir: Optional[Path] = None,
+                 poll_interval: Optional[float] = None, timeout: Optional[float] = None):
+        """
+        BatchGenerator 초기화
+
+        Args:
+            content_generator (ContentGenerator): 요청 구성·클라이언트·응답 캐시를 공유할 생성기
+            batch_dir (Path, optional): 배치 입력 파일 저장 디렉터리
+            poll_interval (float, optional): 상태 확인 간격(초)
+            timeout (float, optional): 최대 대기 시간(초)
+        """
+        self.content_generator = content_generator
+        self.client = content_generator.client
+        self.response_cache = content_generator.response_cache
+        self.batch_dir = Path(batch_dir or Config.CACHE_DIR / 'batches')
+        self.poll_interval = poll_interval if poll_interval is not None else Config.OPENAI_BATCH_POLL_SECONDS
+        self.timeout = timeout if timeout is not None else Config.OPENAI_BATCH_TIMEOUT_HOURS * 3600
+        self.retry_engine = get_retry_engine('openai')
+
+    def write_batch_file(self, requests: Dict[str, Dict[str, Any]]) -> Path:
+        """
+        요청들을 Batch API 입력 형식(JSONL)으로 저장
+
+        Args:
+            requests (Dict): custom_id -> Chat Completion 요청 인자
+
+        Returns:
+            Path: 배치 입력 파일 경로
+        """
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        batch_file = self.batch_dir / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        with open(batch_file, 'w', encoding='utf-8') as f:
+            for custom_id, api_kwargs in requests.items():
+                line = {'custom_id': custom_id, 'method': 'POST', 'url': BATCH_ENDPOINT, 'body': api_kwargs}
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+        return batch_file
+
+    def submit(self, batch_file: Path) -> str:
+        """
+        배치 파일 업로드 후 배치 작업 생성
+
+        Args:
+            batch_file (Path): 배치 입력 파일
+
+        Returns:
+            str: 배치 ID
+        """
+        with open(batch_file, 'rb') as f:
+            uploaded = self.retry_engine.call(self.client.files.create, file=f, purpose='batch')
+        batch = self.retry_engine.call(
+            self.client.batches.create,
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window='24h',
+            metadata={'source': 'autoblog-pipe', 'file': batch_file.name}
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} ({batch_file.name})")
+        return batch.id
+
+    def cancel(self, batch_id: str):
+        """
+        배치 취소 (대기를 포기한 배치가 계속 처리·과금되지 않도록, 실패해도 예외를 올리지 않음)
+
+        Args:
+            batch_id (str): 배치 ID
+        """
+        try:
+            self.retry_engine.call(self.client.batches.cancel, batch_id)
+            logger.warning(f"Cancelled OpenAI batch {batch_id}")
+        except Exception as e:
+            logger.error(f"Could not cancel OpenAI batch {batch_id}: {e}")
+
+    def wait(self, batch_id: str):
+        """
+        배치가 종료 상태가 될 때까지 폴링
+
+        Args:
+            batch_id (str): 배치 ID
+
+        Returns:
+            Batch: 종료된 배치 객체
+
+        Raises:
+            TimeoutError: 최대 대기 시간 초과
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            batch = self.retry_engine.call(self.client.batches.retrieve, batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                logger.info(f"OpenAI batch {batch_id} finished with status '{batch.status}'")
+                return batch
+
+            counts = getattr(batch, 'request_counts', None)
+            if counts is not None:
+                logger.info(f"OpenAI batch {batch_id} {batch.status}: {counts.completed}/{counts.total} done")
+            if time.monotonic() + self.poll_interval > deadline:
+                raise TimeoutError(f"OpenAI batch {batch_id} did not finish within {self.timeout:.0f}s")
+            time.sleep(self.poll_interval)
+
+    def collect(self, batch) -> Dict[str, Optional[str]]:
+        """
+        배치 결과 파일에서 요청별 생성 본문 추출
+
+        Args:
+            batch: 종료된 배치 객체
+
+        Returns:
+            Dict: custom_id -> 생성 본문 (실패한 요청은 None)
+        """
+        results: Dict[str, Optional[str]] = {}
+
+        if batch.output_file_id:
+            output = self.retry_engine.call(self.client.files.content, batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get('response') or {}
+                content = None
+                if response.get('status_code') == 200:
+                    choices = response.get('body', {}).get('choices') or [{}]
+                    content = ((choices[0].get('message') or {}).get('content') or '').strip() or None
+                if content is None:
+                    logger.warning(f"Batch request {record.get('custom_id')} returned no content: {record.get('error')}")
+                results[record.get('custom_id')] = content
+
+        if getattr(batch, 'error_file_id', None):
+            errors = self.retry_engine.call(self.client.files.content, batch.error_file_id)
+            for line in errors.text.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                    results.setdefault(record.get('custom_id'), None)
+
+        return results
+
+    def generate(self, requests: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        """
+        요청들을 배치로 생성 (응답 캐시에 있는 요청은 제출하지 않음)
+
+        Args:
+            requests (Dict): custom_id -> Chat Completion 요청 인자
+
+        Returns:
+            Dict: custom_id -> 생성 본문 (실패한 요청은 None)
+
+        Raises:
+            TimeoutError: 최대 대기 시간 초과 (배치는 취소됨)
+        """
+        results: Dict[str, Optional[str]] = {}
+        cache_keys = {custom_id: self.response_cache.make_key(api_kwargs) for custom_id, api_kwargs in requests.items()}
+        pending = {}
+        for custom_id, api_kwargs in requests.items():
+            cached_text = self.response_cache.get(cache_keys[custom_id])
+            if cached_text is not None:
+                results[custom_id] = cached_text
+            else:
+                pending[custom_id] = api_kwargs
+
+        if not pending:
+            return results
+
+        batch_file = self.write_batch_file(pending)
+        batch_id = self.submit(batch_file)
+        try:
+            batch = self.wait(batch_id)
+        except TimeoutError:
+            self.cancel(batch_id)
+            raise
+        if batch.status != 'completed':
+            logger.error(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+        # 만료·취소된 배치도 완료된 요청의 결과는 수집
+        batch_results = self.collect(batch)
+        for custom_id in pending:
+            content = batch_results.get(custom_id)
+            if content:
+                self.response_cache.put(cache_keys[custom_id], content, model=pending[custom_id].get('model'))
+            results[custom_id] = content
+
+        succeeded = sum(1 for content in results.values() if content)
+        logger.info(f"Batch generation finished: {succeeded}/{len(requests)} posts generated")
+        return results
+
+    def generate_posts(self, topics: list) -> Dict[str, Optional[str]]:
+        """
+        레거시 주제 목록의 본문을 배치로 생성
+
+        Args:
+            topics (list): 주제 정보 목록 (title, post_type 필수)
+
+        Returns:
+            Dict: 주제 제목 -> 생성 본문 (실패한 주제는 None)
+        """
+        requests = {}
+        titles = {}
+        for index, topic in enumerate(topics):
+            custom_id = f"post-{index}"
+            requests[custom_id] = self.content_generator.build_post_request(topic)
+            titles[custom_id] = topic['title']
+
+        contents = self.generate(requests)
+        for custom_id, content in contents.items():
+            if content and not self.content_generator.validate_content(content):
+                logger.warning(f"Batch content for '{titles[custom_id]}' failed validation, but proceeding...")
+        return {titles[custom_id]: contents.get(custom_id) for custom_id in requests}
+
+
+def test_batch_generator():
+    """BatchGenerator 테스트 함수 (실제 OpenAI Batch API 사용)"""
+    try:
+        generator = BatchGenerator(ContentGenerator(), poll_interval=30)
+        topic = {'title': 'AI 글쓰기 도구 비교', 'post_type': 'guide', 'category': 'AI',
+                 'keywords': ['AI', '글쓰기'], 'word_count': 800}
+
+        contents = generator.generate_posts([topic])
+        content = contents.get(topic['title'])
+        print(f"Batch generation result: {len(content or '')} characters")
+        return bool(content)
+
+    except Exception as e:
+        print(f"BatchGenerator test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_batch_generator()
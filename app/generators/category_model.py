@@ -0,0 +1,249 @@
+"""
+카테고리 분류 모델 모듈
+_posts Front Matter의 기존 카테고리로 학습한 다항 나이브 베이즈 분류기 (압축 .npz 모델 파일, 벡터화된 일괄 예측)
+"""
+
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import yaml
+
+from ..config import Config
+from ..utils.front_matter import read_post
+from .keyword_engine import extract_terms, strip_front_matter
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_labeled_posts(posts_dir: Optional[Path] = None) -> Tuple[List[str], List[str]]:
+    """
+    _posts에서 (제목 + 본문, 첫 번째 카테고리) 학습 데이터 로드
+
+    Args:
+        posts_dir (Path, optional): 포스트 디렉터리
+
+    Returns:
+        Tuple[List[str], List[str]]: (문서 목록, 라벨 목록)
+    """
+    documents, labels = [], []
+    for path in sorted(Path(posts_dir or Config.POSTS_DIR).glob('*.md')):
+        try:
+            front_matter, body = read_post(path)
+        except yaml.YAMLError as e:
+            logger.warning(f"Skipping {path.name}: invalid front matter ({e})")
+            continue
+        categories = front_matter.get('categories') or []
+        if isinstance(categories, str):
+            categories = [categories]
+        if not categories:
+            continue
+        documents.append(f"# {front_matter.get('title', '')}\n{body}")
+        labels.append(str(categories[0]))
+    return documents, labels
+
+
+class NaiveBayesCategorizer:
+    """다항 나이브 베이즈 카테고리 분류기"""
+
+    def __init__(self, alpha: float = 0.5, max_features: int = 20000):
+        """
+        NaiveBayesCategorizer 초기화
+
+        Args:
+            alpha (float): 라플라스 평활 계수
+            max_features (int): 최대 어휘 수 (코퍼스 빈도 상위)
+        """
+        self.alpha = alpha
+        self.max_features = max_features
+        self.classes: np.ndarray = np.array([], dtype=str)
+        self.vocabulary: Dict[str, int] = {}
+        self.log_prior: np.ndarray = np.zeros(0)
+        self.feature_log_prob: np.ndarray = np.zeros((0, 0))
+
+    @property
+    def is_trained(self) -> bool:
+        return len(self.classes) > 0
+
+    def _vectorize(self, documents: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """문서들을 (문서 번호, 어휘 번호, 빈도) 희소 좌표로 변환"""
+        rows, cols, counts = [], [], []
+        for row, document in enumerate(documents):
+            terms, _ = extract_terms(strip_front_matter(document))
+            for term, count in Counter(terms).items():
+                col = self.vocabulary.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+                    counts.append(count)
+        return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), np.array(counts, dtype=np.float64)
+
+    def fit(self, documents: List[str], labels: List[str]) -> 'NaiveBayesCategorizer':
+        """
+        학습
+
+        Args:
+            documents (List[str]): 문서 목록
+            labels (List[str]): 문서별 카테고리
+
+        Returns:
+            NaiveBayesCategorizer: self
+        """
+        if not documents or len(documents) != len(labels):
+            raise ValueError("Training requires the same number of documents and labels (at least one)")
+
+        term_counts = Counter()
+        for document in documents:
+            term_counts.update(extract_terms(strip_front_matter(document))[0])
+        self.vocabulary = {term: i for i, (term, _) in enumerate(term_counts.most_common(self.max_features))}
+
+        self.classes = np.array(sorted(set(labels)))
+        label_index = {label: i for i, label in enumerate(self.classes)}
+        y = np.array([label_index[label] for label in labels])
+
+        rows, cols, counts = self._vectorize(documents)
+        class_term_counts = np.zeros((len(self.classes), len(self.vocabulary)))
+        np.add.at(class_term_counts, (y[rows], cols), counts)
+
+        smoothed = class_term_counts + self.alpha
+        self.feature_log_prob = np.log(smoothed / smoothed.sum(axis=1, keepdims=True))
+        self.log_prior = np.log(np.bincount(y, minlength=len(self.classes)) / len(y))
+        logger.info(f"Trained categorizer: {len(documents)} posts, {len(self.classes)} categories, "
+                    f"{len(self.vocabulary)} features")
+        return self
+
+    def predict_proba(self, documents: List[str]) -> np.ndarray:
+        """
+        카테고리별 확률 (모든 문서를 한 번의 벡터 연산으로 계산)
+
+        Args:
+            documents (List[str]): 문서 목록
+
+        Returns:
+            np.ndarray: (문서 수, 카테고리 수) 확률 행렬
+        """
+        rows, cols, counts = self._vectorize(documents)
+        scores = np.tile(self.log_prior, (len(documents), 1))
+        np.add.at(scores, rows, (self.feature_log_prob[:, cols] * counts).T)
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+    def predict_batch(self, documents: List[str]) -> List[Tuple[str, float]]:
+        """
+        일괄 예측 (백필용)
+
+        Args:
+            documents (List[str]): 문서 목록
+
+        Returns:
+            List[Tuple[str, float]]: 문서별 (카테고리, 확률)
+        """
+        if not documents:
+            return []
+        probabilities = self.predict_proba(documents)
+        best = probabilities.argmax(axis=1)
+        return [(str(self.classes[i]), float(probabilities[row, i])) for row, i in enumerate(best)]
+
+    def predict(self, document: str) -> Tuple[str, float]:
+        """문서 하나의 (카테고리, 확률)"""
+        return self.predict_batch([document])[0]
+
+    def save(self, path: Path):
+        """압축 .npz 모델 파일로 저장 (임시 파일 후 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.tmp.npz")
+        np.savez_compressed(
+            tmp_path,
+            classes=self.classes,
+            vocabulary=np.array(list(self.vocabulary), dtype=str),
+            log_prior=self.log_prior,
+            feature_log_prob=self.feature_log_prob.astype(np.float32),
+        )
+        tmp_path.replace(path)
+        logger.info(f"Saved categorizer model to {path} ({path.stat().st_size / 1024:.1f} KB)")
+
+    @classmethod
+    def load(cls, path: Path) -> 'NaiveBayesCategorizer':
+        """모델 파일 로드"""
+        with np.load(path, allow_pickle=False) as data:
+            model = cls()
+            model.classes = data['classes']
+            model.vocabulary = {term: i for i, term in enumerate(data['vocabulary'].tolist())}
+            model.log_prior = data['log_prior']
+            model.feature_log_prob = data['feature_log_prob'].astype(np.float64)
+        return model
+
+
+def load_categorizer(path: Optional[Path] = None) -> Optional[NaiveBayesCategorizer]:
+    """
+    학습된 분류기 로드 (모델 파일이 없거나 읽을 수 없으면 None)
+
+    Args:
+        path (Path, optional): 모델 파일. None이면 CATEGORY_MODEL_PATH
+
+    Returns:
+        NaiveBayesCategorizer: 분류기 또는 None
+    """
+    path = Path(path or Config.CATEGORY_MODEL_PATH)
+    if not path.exists():
+        logger.info(f"No categorizer model at {path}, using keyword rules (run scripts/train_categorizer.py)")
+        return None
+    try:
+        return NaiveBayesCategorizer.load(path)
+    except Exception as e:
+        logger.warning(f"Could not load categorizer model {path}: {e}")
+        return None
+
+
+def test_category_model():
+    """NaiveBayesCategorizer 테스트 함수"""
+    import tempfile
+    import time
+
+    try:
+        documents = [
+            "# New LLM release\nThe language model improves reasoning with machine learning and neural networks.",
+            "# AI agents\nMachine learning agents automate tasks with a language model.",
+            "# Best camping gadgets\nA portable fan and solar charger are gadgets for outdoor camping.",
+            "# Smartwatch review\nThis wearable gadget tracks outdoor hikes with long battery life.",
+            "# Green data centers\nRenewable energy and recycling reduce carbon emissions for sustainability.",
+            "# Circular economy\nSustainability means recycling materials and cutting carbon waste.",
+        ]
+        labels = ['AI_Trends', 'AI_Trends', 'Gadgets', 'Gadgets', 'Sustainability', 'Sustainability']
+        model = NaiveBayesCategorizer().fit(documents, labels)
+
+        queries = [
+            "# Open-source language model\nA new neural machine learning model for reasoning.",
+            "# Outdoor tech\nA rugged solar charger gadget for camping trips.",
+            "# Carbon footprint\nRecycling and renewable energy support sustainability goals.",
+        ]
+        start = time.perf_counter()
+        predictions = model.predict_batch(queries * 100)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print("Testing NaiveBayesCategorizer...")
+        print(f"  Batch of {len(queries) * 100} predicted in {elapsed_ms:.1f}ms")
+        for query, (label, probability) in zip(queries, predictions):
+            print(f"  {query.splitlines()[0]} -> {label} ({probability:.2f})")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = Path(tmp_dir) / 'category_model.npz'
+            model.save(model_path)
+            reloaded = NaiveBayesCategorizer.load(model_path)
+            same = [label for label, _ in reloaded.predict_batch(queries)] == [label for label, _ in predictions[:3]]
+
+        return [label for label, _ in predictions[:3]] == ['AI_Trends', 'Gadgets', 'Sustainability'] and same
+
+    except Exception as e:
+        print(f"NaiveBayesCategorizer test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_category_model()
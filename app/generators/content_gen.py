@@ -4,11 +4,13 @@ OpenAI API를 활용한 블로그 글 자동 생성
 """
 
 import os
+import re
 import time
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List
 
 try:
     from openai import OpenAI
@@ -18,7 +20,19 @@ except ImportError:
 
 from ..config import Config
 from ..research.content_researcher import ContentResearcher
+from ..research.research_ranker import ResearchRanker
 from ..utils.content_deduplicator import ContentDeduplicator
+from ..utils.client_registry import get_openai_client
+from ..utils.error_handler import get_retry_engine
+from ..utils.logger import get_logger
+from .response_cache import LLMResponseCache
+from .prompt_builder import PromptBuilder
+from .prompt_budget import PromptBudgetEnforcer
+from .model_router import ModelRouter, ModelRoute
+from ..utils.token_counter import count_message_tokens
+from .stream_validator import StreamValidator, StreamAbortedError
+from .structured_post import OUTPUT_INSTRUCTIONS, RESPONSE_FORMAT, parse_structured_post
+from ..utils.rate_limiter import get_openai_rate_limiter, parse_reset_duration
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -27,30 +41,46 @@ logger = logging.getLogger(__name__)
 class ContentGenerator:
     """AI 기반 콘텐츠 생성기"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[OpenAI] = None,
+                 response_cache: Optional[LLMResponseCache] = None):
         """
         ContentGenerator 초기화
         
         Args:
             api_key (str, optional): OpenAI API 키. None이면 환경변수에서 로드
+            client (OpenAI, optional): 사용할 OpenAI 클라이언트. None이면 프로세스 공유 클라이언트 사용
+            response_cache (LLMResponseCache, optional): 응답 캐시. None이면 설정(LLM_CACHE_MODE)에 따라 생성
         """
         self.api_key = api_key or Config.OPENAI_API_KEY
-        if not self.api_key:
+        if not self.api_key and client is None:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = client or get_openai_client(self.api_key)
         self.prompts_dir = Config.PROMPTS_DIR
+        self.prompt_builder = PromptBuilder(self.prompts_dir)
+        # 호출 유형별 모델·토큰 한도·타임아웃 (짧은 보조 호출은 저렴하고 빠른 모델)
+        self.model_router = ModelRouter()
+        self.prompt_budget = PromptBudgetEnforcer(self.prompt_builder, self.model_router.prompt_budgets(),
+                                                  self.model_router.completion_budgets())
 
-        self.default_model = "gpt-5-mini"
-        self.default_max_tokens = 2500
+        self.default_model = self.model_router.route('body').model
+        self.default_max_tokens = Config.COMPLETION_TOKENS_BODY
         self.default_temperature = 0.7
-        self.max_retries = 3
-        self.retry_delay = 1
+        self.retry_engine = get_retry_engine('openai', retry_on=(ValueError,))
+        self.response_cache = response_cache or LLMResponseCache()
+        self.streaming = Config.OPENAI_STREAMING
+        self.drafts_dir = Config.CACHE_DIR / 'drafts'
+        self.generation_mode = Config.GENERATION_MODE
+        self.section_workers = Config.SECTION_WORKERS
+        self.last_call_metrics: Dict[str, Any] = {}
+        self.research_ranker = ResearchRanker()
+        self.rate_limiter = get_openai_rate_limiter()
         
         logger.info("ContentGenerator initialized successfully")
 
-    def generate_post_with_research(self, topic_title: str, category: str = 'Tech', keywords: List[str] = []) -> Optional[str]:
-        """리서치 기반으로 블로그 글을 생성하는 전체 파이프라인"""
+    def generate_post_with_research(self, topic_title: str, category: str = 'Tech', keywords: List[str] = [],
+                                    priority: Optional[float] = None) -> Optional[str]:
+        """리서치 기반으로 블로그 글을 생성하는 전체 파이프라인 (priority: 아이디어 점수, 외부 API 할당량 우선순위)"""
         logger.info(f"--- Starting research-based generation for: {topic_title} ---")
 
         # 1. 중복 체크
@@ -61,26 +91,29 @@ class ContentGenerator:
 
         # 2. 리서치 수행
         researcher = ContentResearcher()
-        research_data = researcher.research_topic(topic_title)
+        research_data = researcher.research_topic(topic_title, priority=priority)
 
         if not research_data.get('key_facts') and not research_data.get('recent_developments'):
             logger.error(f"Not enough research data found for '{topic_title}'. Skipping generation.")
             return None
 
         # 3. 프롬프트 준비
-        summarized_research = self._summarize_research_data(research_data)
+        # 재현 모드면 저장된 요약 사용, 아니면 새로 요약해 요약이 없는 번들에만 기록
+        summarized_research = research_data.get('_artifact_summary')
+        if summarized_research is None:
+            summarized_research = self._summarize_research_data(research_data)
+            if research_data.get('artifact_key'):
+                researcher.artifact_store.attach_summary(research_data['artifact_key'], summarized_research)
 
-        topic = {
-            'title': topic_title,
-            'research_data': summarized_research
-        }
-        
         try:
-            template = self.load_prompt_template('researched')
-            formatted_prompt = self.format_prompt(template, topic)
-
-            # 4. AI 콘텐츠 생성
-            generated_content = self.call_openai_api(formatted_prompt, topic_title=topic_title, summarized_research=summarized_research)
+            # 4. AI 콘텐츠 생성 (고정 템플릿 뒤에 주제·리서치 배치)
+            if self.generation_mode == 'sections':
+                generated_content = self.generate_sectioned(topic_title, summarized_research)
+            else:
+                generated_content = self.generate_from_template('researched', {
+                    'title': topic_title,
+                    'research_data': summarized_research
+                })
 
             # 5. 품질 검증
             if not self.validate_content(generated_content):
@@ -94,101 +127,331 @@ class ContentGenerator:
             raise
 
     def _summarize_research_data(self, research_data: Dict[str, Any]) -> str:
-        """리서치 데이터를 LLM이 이해하기 쉬운 자연어 요약으로 변환합니다."""
-        summary_parts = []
-
-        if research_data.get('key_facts'):
-            summary_parts.append("Key Facts:")
-            for fact in research_data['key_facts']:
-                summary_parts.append(f"- {fact}")
-
-        if research_data.get('recent_developments'):
-            summary_parts.append("\nRecent Developments:")
-            for dev in research_data['recent_developments']:
-                title = dev.get('title', 'N/A')
-                source = dev.get('source', 'N/A')
-                summary_parts.append(f"- {title} (Source: {source})")
-
-        return "\n".join(summary_parts)
-    
-    def load_prompt_template(self, post_type: str) -> str:
-        """프롬프트 템플릿 파일 로드"""
-        template_file = self.prompts_dir / f"post_{post_type}.txt"
-        if not template_file.exists():
-            raise FileNotFoundError(f"Prompt template not found: {template_file}")
+        """리서치 데이터를 주제 관련도(BM25) 순으로 토큰 예산 안에서 자연어 요약으로 변환합니다."""
+        return self.research_ranker.pack(research_data.get('topic', ''), research_data)
+
+    def generate_sectioned(self, topic_title: str, research_summary: str) -> str:
+        """
+        개요(H2 섹션 목록)를 먼저 만든 뒤 섹션을 병렬 생성하여 하나의 마크다운 문서로 합침
         
-        try:
-            with open(template_file, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except Exception as e:
-            logger.error(f"Error loading prompt template {post_type}: {e}")
-            raise
-    
-    def format_prompt(self, template: str, topic: Dict[str, Any]) -> str:
-        """프롬프트 템플릿에 주제 정보를 채워넣어 실제 프롬프트 생성"""
-        topic_data = {
-            'title': topic.get('title', '제목 없음'),
-            'category': topic.get('category', '일반'),
-            'keywords': ', '.join(topic.get('keywords', [])),
-            'word_count': topic.get('word_count', 800),
-            'content': topic.get('content', ''),
-            'research_data': topic.get('research_data', '{}')
-        }
+        단일 장문 호출 대신 짧은 호출 여러 개를 동시에 실행하므로 소요 시간이 가장 긴 섹션 수준으로 줄어듦
+        
+        Args:
+            topic_title (str): 글 제목
+            research_summary (str): 모든 섹션이 공유하는 리서치 요약
         
+        Returns:
+            str: 합쳐진 본문
+        """
         try:
-            return template.format(**topic_data)
-        except KeyError as e:
-            logger.error(f"Missing template variable: {e}")
-            raise ValueError(f"Template formatting failed: missing variable {e}")
+            sections = self.parse_outline(self.generate_from_template('outline', {
+                'title': topic_title,
+                'research_data': research_summary
+            }, call_type='outline'))
+        except Exception as e:
+            # 개요는 보조 호출일 뿐이므로 실패(빈/잘린 응답, 타임아웃, 재시도 소진)해도 단일 호출로 계속 진행
+            logger.warning(f"Outline generation for '{topic_title}' failed ({e}), falling back to single completion")
+            sections = []
+        if len(sections) < 2:
+            logger.warning(f"Outline for '{topic_title}' has {len(sections)} sections, falling back to single completion")
+            return self.generate_from_template('researched', {'title': topic_title, 'research_data': research_summary})
+
+        outline = '\n'.join(f"## {section}" for section in sections)
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.section_workers, len(sections)))) as pool:
+            futures = [
+                pool.submit(self.generate_from_template, 'section', {
+                    'title': topic_title,
+                    'section': section,
+                    'position': f"{i}/{len(sections)}" + (" (last section)" if i == len(sections) else ""),
+                    'outline': outline,
+                    'research_data': research_summary
+                }, call_type='section')
+                for i, section in enumerate(sections, 1)
+            ]
+            bodies = [future.result() for future in futures]
+
+        logger.info(f"Generated {len(sections)} sections in parallel in {time.monotonic() - start_time:.1f}s")
+        return self.stitch_sections(topic_title, sections, bodies)
+
+    @staticmethod
+    def parse_outline(outline_text: str, max_sections: int = 8) -> List[str]:
+        """개요 응답에서 H2 섹션 제목 목록 추출 (목록/번호 형식도 허용)"""
+        sections = []
+        for line in outline_text.splitlines():
+            match = re.match(r'^\s*(?:##\s+|[-*]\s+|\d+[.)]\s+)(.+)$', line)
+            if not match or line.lstrip().startswith('###'):
+                continue
+            heading = re.sub(r'^\d+[.)]\s*', '', match.group(1).strip().strip('*').strip())
+            if heading and heading not in sections:
+                sections.append(heading)
+        return sections[:max_sections]
+
+    @staticmethod
+    def stitch_sections(topic_title: str, sections: List[str], bodies: List[str]) -> str:
+        """섹션 본문을 제목 아래 순서대로 합치고, 태그 줄은 문서 끝에 한 번만 배치"""
+        parts = [f"# {topic_title}"]
+        tags_line = None
+        for heading, body in zip(sections, bodies):
+            lines = []
+            for line in body.strip().splitlines():
+                if re.match(r'^#\s', line):
+                    # 섹션에 붙은 H1 제목은 제거 (문서 제목은 하나)
+                    continue
+                if line.strip().startswith('Tags:'):
+                    tags_line = line.strip()
+                    continue
+                lines.append(line)
+            text = '\n'.join(lines).strip()
+            if not text.startswith('## '):
+                text = f"## {heading}\n\n{text}"
+            parts.append(text)
+        if tags_line:
+            parts.append(tags_line)
+        return '\n\n'.join(parts)
     
     def call_openai_api(self, prompt: str, topic_title: str, summarized_research: str,
                         max_tokens: Optional[int] = None, temperature: Optional[float] = None) -> str:
+        """완성된 프롬프트로 호출 (프롬프트가 고정 지시문, 주제·리서치가 가변 데이터)"""
+        return self.generate_from_instructions(prompt, {
+            'title': topic_title,
+            'research_data': summarized_research
+        }, max_tokens=max_tokens, temperature=temperature)
+
+    def generate_from_template(self, template_name: str, variables: Dict[str, Any], call_type: str = 'body',
+                               max_tokens: Optional[int] = None, temperature: Optional[float] = None) -> str:
+        """
+        프롬프트 템플릿으로 생성 (고정 템플릿이 앞, 가변 데이터가 뒤에 오도록 구성)
+        
+        Args:
+            template_name (str): 템플릿 이름 (post_<name>.txt)
+            variables (Dict): 템플릿 자리표시자에 해당하는 가변 데이터
+            call_type (str): 라우팅·토큰 예산 유형 ('body', 'seo_meta', 'categorization', 'summary')
+            max_tokens (int, optional): 최대 생성 토큰. None이면 호출 유형 예산
+            temperature (float, optional): 샘플링 온도
+        
+        Returns:
+            str: 생성된 텍스트
+        """
+        return self.generate_from_instructions(self.prompt_builder.load_template(template_name), variables,
+                                               call_type=call_type, max_tokens=max_tokens, temperature=temperature)
+
+    def generate_from_instructions(self, instructions: str, variables: Dict[str, Any], call_type: str = 'body',
+                                   max_tokens: Optional[int] = None, temperature: Optional[float] = None) -> str:
+        """고정 지시문 + 가변 데이터로 호출 인자를 구성(토큰 예산 적용)하여 생성"""
+        return self.complete(self.build_budgeted_kwargs(instructions, variables, call_type, max_tokens, temperature),
+                             call_type=call_type)
+
+    def build_budgeted_kwargs(self, instructions: str, variables: Dict[str, Any], call_type: str = 'body',
+                              max_tokens: Optional[int] = None, temperature: Optional[float] = None) -> Dict[str, Any]:
+        """호출 유형별 모델과 입력/출력 토큰 예산을 적용한 요청 인자 구성"""
+        messages, _ = self.prompt_budget.build(call_type, instructions, variables)
+        max_tokens = max_tokens or self.prompt_budget.completion_budget(call_type)
+        route = self.model_router.route(call_type)
+        return self.build_api_kwargs(messages, max_tokens, temperature, model=route.model,
+                                     reasoning_effort=route.reasoning_effort)
+
+    def build_api_kwargs(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None,
+                         temperature: Optional[float] = None, model: Optional[str] = None,
+                         reasoning_effort: Optional[str] = None) -> Dict[str, Any]:
+        """Chat Completion 요청 인자 구성 (실시간 호출과 Batch API가 같은 요청 본문 사용)"""
+        model = model or self.default_model
         max_tokens = max_tokens or self.default_max_tokens
         # ⭐ gpt-5 계열에선 temperature를 기본적으로 보내지 않도록 None 권장
-        if self.default_model.startswith("gpt-5"):
+        if model.startswith("gpt-5"):
             temperature = None
+        else:
+            # 추론 강도는 gpt-5 계열에만 전송
+            reasoning_effort = None
 
-        for attempt in range(self.max_retries):
-            try:
-                api_kwargs = dict(
-                    model=self.default_model,
-                    messages=[
-                        {"role": "system", "content": (
-                            "당신은 전문 블로그 작가입니다... (생략)\n"
-                            f"주제: {topic_title}\n\n리서치 데이터:\n{summarized_research}"
-                        )},
-                        {"role": "user", "content": prompt},
-                    ],
-                    # ✅ gpt-5 계열: max_tokens → max_completion_tokens
-                    max_completion_tokens=max_tokens,
-                )
-                if temperature is not None:
-                    api_kwargs["temperature"] = temperature
-
-                response = self.client.chat.completions.create(**api_kwargs)
-
-                generated_text = response.choices[0].message.content.strip()
-                if not generated_text:
-                    raise ValueError("Empty response from OpenAI API")
-                return generated_text
-
-            except Exception as e:
-                msg = str(e)
-                # 🔁 모델이 temperature 미지원이면 제거하고 1회 재시도
-                if "temperature" in msg and "Only the default (1) value is supported" in msg and "temperature" in api_kwargs:
-                    api_kwargs.pop("temperature", None)
-                    response = self.client.chat.completions.create(**api_kwargs)
-                    text = response.choices[0].message.content.strip()
-                    if not text:
-                        raise ValueError("Empty response from OpenAI API")
-                    return text
-
-                logger.error(f"OpenAI API error on attempt {attempt + 1}: {e}")
-                if attempt == self.max_retries - 1:
-                    raise
-                time.sleep(self.retry_delay)
+        api_kwargs = dict(
+            model=model,
+            messages=messages,
+            # ✅ gpt-5 계열: max_tokens → max_completion_tokens
+            max_completion_tokens=max_tokens,
+        )
+        if temperature is not None:
+            api_kwargs["temperature"] = temperature
+        if reasoning_effort:
+            api_kwargs["reasoning_effort"] = reasoning_effort
+        return api_kwargs
+
+    def complete(self, api_kwargs: Dict[str, Any], call_type: str = 'body',
+                 validate: Optional[Callable[[str], Any]] = None) -> str:
+        """
+        캐시·재시도를 거쳐 Chat Completion 실행 후 본문 반환
+        
+        Args:
+            api_kwargs (Dict): Chat Completion 요청 인자
+            call_type (str): 라우팅 유형 (타임아웃·지연시간/비용 집계 단위)
+            validate (Callable, optional): 응답 검증 함수. ValueError를 내면 재시도하며 캐시에 저장하지 않음
+        
+        Returns:
+            str: 생성된 텍스트
+        """
+        route = self.model_router.route(call_type)
+        # 동일 요청(모델·메시지·파라미터)은 캐시된 응답 재사용
+        cache_key = self.response_cache.make_key(api_kwargs)
+        cached_text = self.response_cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
+        # 재시도(백오프·Retry-After·실행 단위 예산)는 공용 재시도 엔진이 담당, 빈 응답도 재시도 대상
+        # 스트리밍 검증(제목으로 시작하는 본문)은 마크다운 본문 생성에만 적용
+        streaming = self.streaming and call_type == 'body' and 'response_format' not in api_kwargs
+        draft_path = self.drafts_dir / f"{cache_key[:16]}.md" if streaming else None
+        generated_text = self.retry_engine.call(self._complete_text, api_kwargs, route, draft_path, validate)
+        self.response_cache.put(cache_key, generated_text, model=api_kwargs['model'])
+        return generated_text
+
+    def _complete_text(self, api_kwargs: Dict[str, Any], route: ModelRoute, draft_path: Optional[Path] = None,
+                       validate: Optional[Callable[[str], Any]] = None) -> str:
+        """Chat Completion 1회 호출 후 본문 반환 (temperature 미지원 모델이면 제거 후 즉시 재호출)"""
+        try:
+            generated_text = self._generate_once(api_kwargs, route, draft_path)
+        except openai.BadRequestError as e:
+            msg = str(e)
+            if "temperature" in msg and "Only the default (1) value is supported" in msg and "temperature" in api_kwargs:
+                api_kwargs.pop("temperature", None)
+                generated_text = self._generate_once(api_kwargs, route, draft_path)
+            else:
+                raise
+
+        generated_text = generated_text.strip()
+        if not generated_text:
+            raise ValueError("Empty response from OpenAI API")
+        if validate is not None:
+            validate(generated_text)
+        return generated_text
+
+    def _generate_once(self, api_kwargs: Dict[str, Any], route: ModelRoute, draft_path: Optional[Path] = None) -> str:
+        """초안 경로가 있으면 스트리밍, 없으면 일반 Chat Completion 1회 실행"""
+        if draft_path is not None:
+            return self._stream_completion(api_kwargs, route, draft_path)
+
+        start_time = time.monotonic()
+        response = self._create_completion(api_kwargs, timeout=route.timeout)
+        usage = getattr(response, 'usage', None)
+        self._record_call_metrics(start_time, route, streamed=False, usage=usage,
+                                  estimated_prompt_tokens=count_message_tokens(api_kwargs['messages']))
+        choice = response.choices[0]
+        content = choice.message.content or ""
+        if not content.strip() and getattr(choice, 'finish_reason', None) == 'length':
+            # 출력 한도를 (대부분 숨은 추론 토큰으로) 다 써서 본문이 비어 있음 - 재시도해도 같은 결과일 가능성이 높음
+            reasoning_tokens = getattr(getattr(usage, 'completion_tokens_details', None), 'reasoning_tokens', None)
+            logger.warning(f"[ROUTE] {route.call_type} -> {route.model} returned empty content at "
+                           f"max_completion_tokens={api_kwargs.get('max_completion_tokens')} "
+                           f"(finish_reason=length, reasoning tokens: {reasoning_tokens}); "
+                           f"raise the route's completion cap or lower its reasoning effort")
+        return content
+
+    def _open_completion(self, api_kwargs: Dict[str, Any], **extra_kwargs):
+        """RPM/TPM 리미터로 속도를 조절하며 Chat Completion 요청 전송 (raw 응답, 추정 토큰 반환)"""
+        estimated_tokens = self.rate_limiter.estimate_tokens(api_kwargs['messages'], api_kwargs.get('max_completion_tokens', 0))
+        self.rate_limiter.acquire(estimated_tokens)
+
+        try:
+            raw_response = self.client.chat.completions.with_raw_response.create(**api_kwargs, **extra_kwargs)
+        except openai.RateLimitError as e:
+            retry_after = e.response.headers.get('retry-after') if e.response is not None else None
+            self.rate_limiter.on_rate_limited(parse_reset_duration(retry_after))
+            raise
+        return raw_response, estimated_tokens
+
+    def _create_completion(self, api_kwargs: Dict[str, Any], **extra_kwargs):
+        """RPM/TPM 리미터로 속도를 조절하며 Chat Completion 호출"""
+        raw_response, estimated_tokens = self._open_completion(api_kwargs, **extra_kwargs)
+
+        response = raw_response.parse()
+        usage = getattr(response, 'usage', None)
+        self.rate_limiter.reconcile(estimated_tokens, getattr(usage, 'total_tokens', None))
+        # 서버가 알려준 남은 한도로 버킷 보정 (서버 값이 더 보수적이면 우선)
+        self.rate_limiter.update_from_headers(raw_response.headers)
+        return response
+
+    def _stream_completion(self, api_kwargs: Dict[str, Any], route: ModelRoute, draft_path: Path) -> str:
+        """
+        스트리밍으로 생성하며 초안 파일에 바로 기록하고 구조를 점진 검증
+        
+        Args:
+            api_kwargs (Dict): Chat Completion 요청 인자
+            route (ModelRoute): 라우팅 설정 (타임아웃, 지표 집계)
+            draft_path (Path): 초안 파일 경로
+        
+        Returns:
+            str: 생성된 본문
+        
+        Raises:
+            StreamAbortedError: 제목 누락·거부 응답 등으로 조기 중단한 경우 (남은 토큰은 생성하지 않음)
+        """
+        start_time = time.monotonic()
+        raw_response, estimated_tokens = self._open_completion(
+            api_kwargs, stream=True, stream_options={"include_usage": True}, timeout=route.timeout
+        )
+        self.rate_limiter.update_from_headers(raw_response.headers)
+        stream = raw_response.parse()
+
+        validator = StreamValidator()
+        ttfb = None
+        usage = None
+        abort_reason = None
+
+        try:
+            draft_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(draft_path, 'w', encoding='utf-8') as draft:
+                for chunk in stream:
+                    if getattr(chunk, 'usage', None) is not None:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    if ttfb is None:
+                        ttfb = time.monotonic() - start_time
+
+                    draft.write(delta)
+                    abort_reason = validator.feed(delta)
+                    if abort_reason:
+                        break
+        finally:
+            # 항상 응답을 닫아 연결을 풀에 반환 (조기 중단 시에는 서버가 남은 토큰을 생성하지 않도록 연결을 끊음)
+            stream.close()
+            self.rate_limiter.reconcile(estimated_tokens, getattr(usage, 'total_tokens', None))
+            self._record_call_metrics(start_time, route, streamed=True, ttfb=ttfb, aborted=abort_reason, usage=usage,
+                                      estimated_prompt_tokens=count_message_tokens(api_kwargs['messages']))
+
+        if abort_reason:
+            logger.warning(f"Streaming aborted after {len(validator.content)} chars ({abort_reason}), draft kept at {draft_path}")
+            raise StreamAbortedError(abort_reason, validator.content)
+
+        draft_path.unlink(missing_ok=True)
+        return validator.content
+
+    def _record_call_metrics(self, start_time: float, route: ModelRoute, streamed: bool, ttfb: Optional[float] = None,
+                             aborted: Optional[str] = None, usage: Any = None,
+                             estimated_prompt_tokens: Optional[int] = None):
+        """OpenAI 호출 지표 기록 (경로·모델, 소요 시간, 첫 토큰까지 시간, 추정/실제 입력 토큰, 캐시 적중 토큰, 비용)"""
+        duration = time.monotonic() - start_time
+        prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached_tokens = getattr(details, 'cached_tokens', None)
+        if prompt_tokens:
+            logger.info(f"Prompt tokens: estimated ~{estimated_prompt_tokens} vs actual {prompt_tokens} "
+                        f"({cached_tokens or 0} cached), completion {completion_tokens}")
+
+        cost = self.model_router.record(route, duration, usage)
+
+        self.last_call_metrics = {'route': route.call_type, 'model': route.model, 'cost': cost,
+                                  'duration': duration, 'ttfb': ttfb, 'streamed': streamed, 'aborted': aborted,
+                                  'estimated_prompt_tokens': estimated_prompt_tokens, 'prompt_tokens': prompt_tokens,
+                                  'cached_tokens': cached_tokens, 'completion_tokens': completion_tokens}
+        get_logger().log_api_call('OpenAI', aborted is None, duration, model=route.model, route=route.call_type, cost=cost,
+                                  ttfb=ttfb, streamed=streamed, aborted=aborted,
+                                  estimated_prompt_tokens=estimated_prompt_tokens, prompt_tokens=prompt_tokens,
+                                  cached_tokens=cached_tokens, completion_tokens=completion_tokens)
 
-    
     def validate_content(self, content: str, min_length: int = 500) -> bool:
         """생성된 콘텐츠 품질 검증"""
         if not content or len(content.strip()) < min_length:
@@ -205,23 +468,66 @@ class ContentGenerator:
         
         return True
     
-    def generate_post(self, topic: Dict[str, Any]) -> str:
-        """주제 정보를 바탕으로 블로그 글 생성 (레거시)""" # Legacy method
+    def build_post_request(self, topic: Dict[str, Any], structured: bool = False) -> Dict[str, Any]:
+        """
+        주제 정보로 레거시 포스트 생성 요청 인자 구성
+        
+        Args:
+            topic (Dict): 주제 정보
+            structured (bool): True면 본문 + SEO 메타데이터를 JSON 스키마 응답으로 요청
+        
+        Returns:
+            Dict: Chat Completion 요청 인자
+        """
         required_fields = ['title', 'post_type']
         for field in required_fields:
             if field not in topic:
                 raise ValueError(f"Missing required field: {field}")
         
-        post_type = topic['post_type']
-        template = self.load_prompt_template(post_type)
-        formatted_prompt = self.format_prompt(template, topic)
-        generated_content = self.call_openai_api(formatted_prompt, topic_title=topic['title'], summarized_research="") # summarized_research is not used in legacy mode
+        instructions = self.prompt_builder.load_template(topic['post_type'])
+        max_tokens = None
+        if structured:
+            instructions = f"{instructions}\n\n{OUTPUT_INSTRUCTIONS}"
+            max_tokens = self.prompt_budget.completion_budget('body') + self.prompt_budget.completion_budget('seo_meta')
+        
+        api_kwargs = self.build_budgeted_kwargs(instructions, {
+            'title': topic['title'],
+            'category': topic.get('category', '일반'),
+            'keywords': topic.get('keywords', []),
+            'word_count': topic.get('word_count', 800)
+        }, max_tokens=max_tokens)
+        if structured:
+            api_kwargs['response_format'] = RESPONSE_FORMAT
+        return api_kwargs
+    
+    def generate_post(self, topic: Dict[str, Any]) -> str:
+        """주제 정보를 바탕으로 블로그 글 생성 (레거시)""" # Legacy method
+        generated_content = self.complete(self.build_post_request(topic))
         
         if not self.validate_content(generated_content):
             logger.warning("Generated content failed validation, but proceeding...")
         
         return generated_content
 
+    def generate_post_with_metadata(self, topic: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        한 번의 호출로 본문과 SEO 메타데이터 생성 (본문 + 메타 설명 2회 호출 대체)
+        
+        Args:
+            topic (Dict): 주제 정보
+        
+        Returns:
+            Dict: content, meta_description, tags, category (스키마 검증 완료)
+        """
+        # 스키마에 맞지 않는 응답은 재시도 대상이며 캐시에 남지 않음
+        response_text = self.complete(self.build_post_request(topic, structured=True), validate=parse_structured_post)
+        post = parse_structured_post(response_text)
+        
+        if not self.validate_content(post['content']):
+            logger.warning("Generated content failed validation, but proceeding...")
+        
+        return post
+
 def test_generate_post_with_research():
     """ContentGenerator의 리서치 기반 생성 테스트 함수"""
     try:
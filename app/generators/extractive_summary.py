@@ -0,0 +1,230 @@
+"""
+추출 요약 모듈
+글 앞부분 문장들을 TextRank(문장 중심성)로 순위화하고 키워드 가중치를 더해 API 호출 없이 메타 설명 생성
+"""
+
+import logging
+import re
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..research.research_ranker import tokenize
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 문장 분리 (마침표·물음표·느낌표 뒤 공백, 또는 줄바꿈)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+
+def strip_markdown(text: str) -> str:
+    """요약 대상이 아닌 마크다운 요소(코드 블록, 제목, 표, 태그 줄, 링크 주소, 강조 기호) 제거"""
+    text = re.sub(r'```.*?```', ' ', text, flags=re.DOTALL)
+    lines = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith(('#', '|', '>', 'Tags:')):
+            continue
+        stripped = re.sub(r'^(?:[-*+]|\d+[.)])\s+', '', stripped)
+        lines.append(stripped)
+    text = '\n'.join(lines)
+    text = re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = re.sub(r'[*_`]+', '', text)
+    return text
+
+
+def leading_sections(content: str, max_sections: int) -> str:
+    """첫 H2 섹션 몇 개(도입부 포함)만 반환"""
+    parts = re.split(r'(?m)^(?=##\s)', content)
+    # parts[0]은 첫 H2 이전(제목·도입부)
+    return ''.join(parts[:max_sections + 1])
+
+
+class ExtractiveSummarizer:
+    """TextRank 기반 메타 설명 추출기"""
+
+    def __init__(self, max_length: int = 160, max_sections: int = 3, damping: float = 0.85,
+                 keyword_boost: float = 1.0):
+        """
+        ExtractiveSummarizer 초기화
+
+        Args:
+            max_length (int): 최대 글자 수
+            max_sections (int): 요약 대상 H2 섹션 수 (도입부 외)
+            damping (float): TextRank 감쇠 계수
+            keyword_boost (float): 키워드 포함 문장 가중치
+        """
+        self.max_length = max_length
+        self.max_sections = max_sections
+        self.damping = damping
+        self.keyword_boost = keyword_boost
+
+    def split_sentences(self, content: str) -> List[str]:
+        """앞부분 섹션의 본문 문장 목록"""
+        text = strip_markdown(leading_sections(content, self.max_sections))
+        sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(text)]
+        # 너무 짧은 조각(소제목 잔여, 콜론 목록 머리말)과 반복 문장은 제외
+        return list(dict.fromkeys(s for s in sentences if len(s) >= 20 and not s.endswith(':')))
+
+    def rank(self, sentences: List[str], keywords: List[str]) -> np.ndarray:
+        """
+        문장 점수 (TextRank 중심성 × 키워드 가중치)
+
+        Args:
+            sentences (List[str]): 문장 목록
+            keywords (List[str]): 가중할 키워드
+
+        Returns:
+            np.ndarray: 문장별 점수 (합계 1 기준)
+        """
+        tokens = [tokenize(sentence) for sentence in sentences]
+        vocabulary = {term: i for i, term in enumerate(sorted({t for sentence in tokens for t in sentence}))}
+        n = len(sentences)
+
+        # 문장-단어 빈도 행렬 → 코사인 유사도 그래프
+        matrix = np.zeros((n, max(1, len(vocabulary))))
+        for i, sentence in enumerate(tokens):
+            for term in sentence:
+                matrix[i, vocabulary[term]] += 1
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        normalized = matrix / np.where(norms == 0, 1, norms)
+        similarity = normalized @ normalized.T
+        np.fill_diagonal(similarity, 0.0)
+
+        # 행 정규화 후 PageRank 반복 (연결 없는 문장은 균등 분배)
+        row_sums = similarity.sum(axis=1, keepdims=True)
+        transition = np.where(row_sums > 0, similarity / np.where(row_sums == 0, 1, row_sums), 1.0 / n)
+        scores = np.full(n, 1.0 / n)
+        for _ in range(50):
+            updated = (1 - self.damping) / n + self.damping * transition.T @ scores
+            if np.abs(updated - scores).sum() < 1e-6:
+                scores = updated
+                break
+            scores = updated
+
+        # 키워드를 포함한 문장 가중
+        keyword_tokens = [set(tokenize(keyword)) for keyword in keywords]
+        keyword_tokens = [kw for kw in keyword_tokens if kw]
+        if keyword_tokens:
+            coverage = np.array([
+                sum(1 for kw in keyword_tokens if kw <= set(sentence)) / len(keyword_tokens)
+                for sentence in tokens
+            ])
+            scores = scores * (1 + self.keyword_boost * coverage)
+        return scores / scores.sum()
+
+    def summarize(self, content: str, title: str = '', keywords: Optional[List[str]] = None) -> Tuple[str, float]:
+        """
+        메타 설명 추출
+
+        Args:
+            content (str): 글 본문 (마크다운)
+            title (str): 글 제목 (키워드로 함께 사용)
+            keywords (List[str], optional): 키워드 리스트
+
+        Returns:
+            Tuple[str, float]: (메타 설명, 품질 점수 0~1). 추출할 문장이 없으면 ("", 0.0)
+        """
+        sentences = self.split_sentences(content)
+        if not sentences:
+            return "", 0.0
+
+        keywords = list(keywords or [])
+        scores = self.rank(sentences, keywords + ([title] if title else []))
+
+        # 점수 순으로 길이 한도 안에 들어가는 문장을 고르고 원래 순서로 배치
+        chosen: List[int] = []
+        length = 0
+        for index in np.argsort(-scores, kind='stable'):
+            sentence_length = len(sentences[index]) + (1 if chosen else 0)
+            if length + sentence_length <= self.max_length:
+                chosen.append(int(index))
+                length += sentence_length
+
+        if chosen:
+            description = ' '.join(sentences[i] for i in sorted(chosen))
+        else:
+            # 최상위 문장도 길면 단어 경계에서 자름
+            chosen = [int(np.argmax(scores))]
+            cut = sentences[chosen[0]][:self.max_length - 3]
+            description = (cut.rsplit(' ', 1)[0] if ' ' in cut else cut).rstrip(',;:') + "..."
+
+        return description, self.score(description, scores[chosen].sum(), keywords, title)
+
+    def score(self, description: str, centrality: float, keywords: List[str], title: str) -> float:
+        """
+        추출 결과 품질 점수 (길이 적합도, 키워드 포함률, 선택 문장 중심성의 평균)
+
+        Args:
+            description (str): 추출된 메타 설명
+            centrality (float): 선택 문장 점수 합
+            keywords (List[str]): 키워드 리스트
+            title (str): 글 제목
+
+        Returns:
+            float: 0~1 점수
+        """
+        # 검색 결과에 잘리지 않으면서 충분한 정보량 (한도의 절반 이상)
+        length_fit = min(1.0, len(description) / (self.max_length * 0.5))
+        if description.endswith('...'):
+            length_fit *= 0.7
+
+        targets = [set(tokenize(keyword)) for keyword in keywords] or [set(tokenize(title))]
+        targets = [target for target in targets if target]
+        description_tokens = set(tokenize(description))
+        if targets:
+            coverage = sum(1 for target in targets if target & description_tokens) / len(targets)
+        else:
+            coverage = 1.0
+
+        return round((length_fit + coverage + min(1.0, centrality * 2)) / 3, 3)
+
+
+def test_extractive_summary():
+    """ExtractiveSummarizer 테스트 함수"""
+    try:
+        content = """# Remote Work Productivity Guide
+
+Remote work productivity depends on clear routines and the right collaboration tools.
+
+## Why Remote Work Is Different
+
+Working from home removes the commute but blurs the line between work and rest.
+Teams that document decisions in shared tools stay aligned across time zones.
+
+## Essential Tools
+
+- **Async chat** keeps remote teams connected without constant meetings.
+- Time tracking apps reveal where productive hours actually go.
+
+```python
+print("not a sentence")
+```
+
+## Conclusion
+
+Small routine changes compound into large productivity gains for remote teams.
+
+Tags: [remote work, productivity]
+"""
+        summarizer = ExtractiveSummarizer()
+        description, score = summarizer.summarize(content, 'Remote Work Productivity Guide',
+                                                  ['remote work', 'productivity'])
+        print("Testing ExtractiveSummarizer...")
+        print(f"  Description ({len(description)} chars, score {score}): {description}")
+
+        empty_description, empty_score = summarizer.summarize("# Title\n\n## Heading\n")
+        print(f"  Empty content score: {empty_score}")
+
+        return 0 < len(description) <= 160 and score > 0.5 and 'print' not in description and empty_score == 0.0
+
+    except Exception as e:
+        print(f"ExtractiveSummarizer test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_extractive_summary()
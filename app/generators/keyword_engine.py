@@ -0,0 +1,302 @@
+"""
+TF-IDF 키워드 추출 모듈
+_posts 전체의 문서 빈도(DF) 통계를 미리 계산해 증분 저장하고, 글 하나의 키워드는 NumPy 벡터 연산으로 추출 (단어 + 바이그램)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import Config
+from ..research.research_ranker import STOP_WORDS
+from ..utils.client_registry import get_client
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATS_VERSION = 1
+
+# 키워드로 쓰기 어려운 일반 단어 (BM25 불용어에 추가)
+KEYWORD_STOP_WORDS = STOP_WORDS | {
+    'about', 'also', 'all', 'any', 'more', 'most', 'other', 'some', 'such', 'than', 'then', 'there',
+    'their', 'they', 'them', 'we', 'our', 'you', 'your', 'not', 'no', 'so', 'if', 'into', 'out',
+    'up', 'can', 'could', 'would', 'should', 'may', 'might', 'must', 'one', 'two', 'new', 'like',
+    'just', 'over', 'only', 'while', 'which', 'who', 'when', 'where', 'each', 'many', 'much', 'very',
+    'make', 'makes', 'made', 'use', 'used', 'using', 'well', 'way', 'ways', 'do', 'does', 'did',
+    'get', 'gets', 'getting', 'start', 'started', 'still', 'even', 'instead', 'uses', 'keep', 'keeps',
+    'try', 'offer', 'offers', 'through', 'because', 'however', 'here', 'now', 'first', 'last',
+    'my', 'me', 'his', 'her', 'he', 'she', 'us',
+    'tags', 'conclusion', 'introduction', 'overview', 'section',
+}
+
+_FRONT_MATTER_RE = re.compile(r'\A---\s*\n.*?\n---\s*\n', re.DOTALL)
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#'-]*[A-Za-z0-9+#]|[A-Za-z]|[가-힣]{2,}")
+
+
+def strip_front_matter(text: str) -> str:
+    """Front Matter 제거"""
+    return _FRONT_MATTER_RE.sub('', text, count=1)
+
+
+def extract_terms(text: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    본문에서 키워드 후보(단어, 인접 단어 바이그램) 추출
+
+    제목·소제목 줄의 단어는 두 번 세어 가중하고, 바이그램은 불용어·문장 부호·줄 경계를 넘지 않음
+
+    Args:
+        text (str): 마크다운 본문 (Front Matter 제외)
+
+    Returns:
+        Tuple[List[str], Dict[str, str]]: (정규화된 후보 목록, 후보 -> 처음 나온 표기)
+    """
+    text = re.sub(r'```.*?```', ' ', text, flags=re.DOTALL)
+    terms: List[str] = []
+    surface: Dict[str, str] = {}
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('Tags:'):
+            continue
+        weight = 2 if stripped.startswith('#') else 1
+        # 문장 부호에서 바이그램 연결을 끊음
+        for chunk in re.split(r'[.,;:!?()\[\]"]', stripped):
+            previous: Optional[Tuple[str, str]] = None
+            for match in _WORD_RE.finditer(chunk):
+                word = match.group(0).strip("'-")
+                normalized = word.lower()
+                if normalized in KEYWORD_STOP_WORDS or len(normalized) < 2 or normalized.isdigit():
+                    previous = None
+                    continue
+                terms.extend([normalized] * weight)
+                surface.setdefault(normalized, word)
+                if previous is not None:
+                    # 바이그램은 실제 등장 횟수로만 셈 (소제목 한 번으로 후보가 되지 않도록)
+                    bigram = f"{previous[0]} {normalized}"
+                    terms.append(bigram)
+                    surface.setdefault(bigram, f"{previous[1]} {word}")
+                previous = (normalized, word)
+    return terms, surface
+
+
+class KeywordEngine:
+    """코퍼스 기반 TF-IDF 키워드 추출기"""
+
+    def __init__(self, posts_dir: Optional[Path] = None, stats_path: Optional[Path] = None):
+        """
+        KeywordEngine 초기화
+
+        Args:
+            posts_dir (Path, optional): 코퍼스 디렉터리 (_posts)
+            stats_path (Path, optional): DF 통계 저장 파일
+        """
+        self.posts_dir = Path(posts_dir or Config.POSTS_DIR)
+        self.stats_path = Path(stats_path or Config.CACHE_DIR / 'keyword_stats.json')
+        self.n_docs = 0
+        self.df: Dict[str, int] = {}
+        self.files: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._load()
+        self.refresh()
+
+    def _load(self):
+        """저장된 통계 로드 (없거나 버전이 다르면 빈 통계)"""
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+            if stats.get('version') == STATS_VERSION:
+                self.n_docs = stats['n_docs']
+                self.df = stats['df']
+                self.files = stats['files']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable keyword stats {self.stats_path}: {e}")
+
+    def _save(self):
+        """통계 저장 (임시 파일 후 교체)"""
+        try:
+            self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.stats_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': STATS_VERSION, 'n_docs': self.n_docs, 'df': self.df, 'files': self.files},
+                          f, ensure_ascii=False)
+            tmp_path.replace(self.stats_path)
+        except Exception as e:
+            logger.warning(f"Error writing keyword stats {self.stats_path}: {e}")
+
+    @staticmethod
+    def _fingerprint(path: Path) -> List[float]:
+        stat = path.stat()
+        return [stat.st_mtime, stat.st_size]
+
+    def _add_path(self, path: Path):
+        """문서 하나의 후보 집합을 DF에 반영 (잠금 보유 상태에서 호출)"""
+        terms, _ = extract_terms(strip_front_matter(path.read_text(encoding='utf-8')))
+        for term in set(terms):
+            self.df[term] = self.df.get(term, 0) + 1
+        self.n_docs += 1
+        self.files[path.name] = self._fingerprint(path)
+
+    def refresh(self) -> int:
+        """
+        코퍼스와 통계 동기화 (새 글만 증분 반영, 수정·삭제된 글이 있으면 전체 재계산)
+
+        Returns:
+            int: 새로 반영한 문서 수
+        """
+        if not self.posts_dir.exists():
+            return 0
+
+        with self._lock:
+            current = {path.name: path for path in self.posts_dir.glob('*.md')}
+            stale = [name for name, fingerprint in self.files.items()
+                     if name not in current or self._fingerprint(current[name]) != fingerprint]
+            if stale:
+                logger.info(f"Rebuilding keyword stats ({len(stale)} posts changed or removed)")
+                self.n_docs, self.df, self.files = 0, {}, {}
+
+            added = 0
+            for name, path in sorted(current.items()):
+                if name not in self.files:
+                    self._add_path(path)
+                    added += 1
+
+            if added or stale:
+                self._save()
+                logger.info(f"Keyword stats: {self.n_docs} posts, {len(self.df)} terms (+{added})")
+            return added
+
+    def add_post(self, path: Path):
+        """
+        발행된 글을 통계에 반영
+
+        Args:
+            path (Path): 저장된 포스트 파일
+        """
+        path = Path(path)
+        with self._lock:
+            known = self.files.get(path.name)
+            if known == self._fingerprint(path):
+                return
+            if known is None:
+                self._add_path(path)
+                self._save()
+                return
+        # 같은 파일이 바뀐 경우 이전 후보를 알 수 없으므로 전체 동기화 (잠금 해제 후)
+        self.refresh()
+
+    def extract(self, content: str, top_k: int = 8, exclude: Optional[List[str]] = None) -> List[str]:
+        """
+        TF-IDF 상위 키워드 추출
+
+        Args:
+            content (str): 마크다운 본문 (Front Matter 포함 가능)
+            top_k (int): 최대 키워드 수
+            exclude (List[str], optional): 이미 있는 키워드 (대소문자 무시)
+
+        Returns:
+            List[str]: 키워드 (원문 표기)
+        """
+        terms, surface = extract_terms(strip_front_matter(content))
+        if not terms:
+            return []
+
+        counts = Counter(terms)
+        vocabulary = list(counts)
+        tf = np.fromiter((counts[term] for term in vocabulary), dtype=np.float64, count=len(vocabulary))
+        with self._lock:
+            n_docs = self.n_docs
+            df = np.fromiter((self.df.get(term, 0) for term in vocabulary), dtype=np.float64, count=len(vocabulary))
+
+        # 로그 정규화 TF × 평활 IDF (현재 글 포함)
+        is_bigram = np.fromiter((' ' in term for term in vocabulary), dtype=bool, count=len(vocabulary))
+        scores = (1 + np.log(tf)) * (np.log((n_docs + 1) / (df + 1)) + 1)
+        # 바이그램은 두 번 이상 나온 경우만 후보, 구 단위 키워드 가중
+        scores = np.where(is_bigram, np.where(tf >= 2, scores * 1.5, 0.0), scores)
+
+        excluded = {keyword.lower() for keyword in exclude or []}
+        keywords: List[str] = []
+        covered = set()
+        for index in np.argsort(-scores, kind='stable'):
+            if len(keywords) >= top_k or scores[index] <= 0:
+                break
+            term = vocabulary[index]
+            if term in excluded or term in covered:
+                continue
+            words = term.split()
+            if len(words) > 1:
+                # 바이그램이 앞서 고른 단어를 포함하면 단어 대신 바이그램 유지
+                keywords = [keyword for keyword in keywords if keyword.lower() not in words]
+            keywords.append(surface[term])
+            covered.update(words)
+            covered.add(term)
+        return keywords
+
+
+def get_keyword_engine() -> KeywordEngine:
+    """프로세스 공유 키워드 엔진 (통계는 처음 사용할 때 한 번 로드·동기화)"""
+    return get_client('keyword_engine', KeywordEngine)
+
+
+def test_keyword_engine():
+    """KeywordEngine 테스트 함수"""
+    import tempfile
+    import time
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            posts_dir = Path(tmp_dir) / '_posts'
+            posts_dir.mkdir()
+            stats_path = Path(tmp_dir) / 'keyword_stats.json'
+            for i, topic in enumerate(['Cloud Gaming', 'Electric Vehicles', 'Remote Work']):
+                (posts_dir / f"2025-01-0{i + 1}-post.md").write_text(
+                    f"---\ntitle: {topic}\n---\n\n# {topic}\n\nTechnology changes how people live and work. "
+                    f"{topic} is part of that technology story.\n", encoding='utf-8')
+
+            engine = KeywordEngine(posts_dir, stats_path)
+            print("Testing KeywordEngine...")
+            print(f"  Corpus: {engine.n_docs} posts, {len(engine.df)} terms")
+
+            content = """# Quantum Computing for Developers
+
+Quantum computing uses qubits instead of bits. Quantum computing technology is still early.
+
+## How Qubits Work
+
+Qubits rely on superposition and entanglement. Error correction keeps qubits stable.
+
+## Getting Started
+
+Developers can try quantum computing through cloud platforms. Technology companies offer simulators.
+"""
+            start = time.perf_counter()
+            keywords = engine.extract(content, top_k=6, exclude=['Qubits'])
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"  Keywords ({elapsed_ms:.2f}ms): {keywords}")
+
+            new_post = posts_dir / "2025-01-04-quantum.md"
+            new_post.write_text(content, encoding='utf-8')
+            engine.add_post(new_post)
+            reloaded = KeywordEngine(posts_dir, stats_path)
+            print(f"  After publish: {reloaded.n_docs} posts, df('quantum computing') = {reloaded.df.get('quantum computing')}")
+
+            return (keywords[0].lower() == 'quantum computing' and 'technology' not in [k.lower() for k in keywords]
+                    and 'qubits' not in [k.lower() for k in keywords] and reloaded.n_docs == 4)
+
+    except Exception as e:
+        print(f"KeywordEngine test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_keyword_engine()
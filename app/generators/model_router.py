@@ -0,0 +1,183 @@
+"""
+모델 라우팅 모듈
+호출 유형(본문, 메타, 분류, 요약, 개요, 섹션)별로 모델·토큰 한도·타임아웃을 정하고 경로별 지연시간과 비용을 집계
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+from ..config import Config
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 모델별 100만 토큰당 가격 (USD): (입력, 캐시된 입력, 출력)
+MODEL_PRICES = {
+    'gpt-5': (1.25, 0.125, 10.00),
+    'gpt-5-mini': (0.25, 0.025, 2.00),
+    'gpt-5-nano': (0.05, 0.005, 0.40),
+    'gpt-4o': (2.50, 1.25, 10.00),
+    'gpt-4o-mini': (0.15, 0.075, 0.60),
+}
+
+
+class ModelRoute:
+    """호출 유형 하나의 라우팅 설정"""
+
+    def __init__(self, call_type: str, model: str, max_prompt_tokens: int, max_completion_tokens: int,
+                 timeout: float, reasoning_effort: Optional[str] = None):
+        self.call_type = call_type
+        self.model = model
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_completion_tokens = max_completion_tokens
+        self.timeout = timeout
+        # gpt-5 계열 추론 강도 (None이면 모델 기본값). 숨은 추론 토큰도 max_completion_tokens에 포함됨
+        self.reasoning_effort = reasoning_effort
+
+    def __repr__(self):
+        effort = f", effort={self.reasoning_effort}" if self.reasoning_effort else ""
+        return (f"ModelRoute({self.call_type!r} -> {self.model!r}, prompt<={self.max_prompt_tokens}, "
+                f"completion<={self.max_completion_tokens}{effort})")
+
+
+def estimate_cost(model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int],
+                  cached_tokens: Optional[int] = None) -> Optional[float]:
+    """
+    호출 비용 추정 (USD)
+
+    Args:
+        model (str): 모델 이름
+        prompt_tokens (int): 입력 토큰
+        completion_tokens (int): 출력 토큰
+        cached_tokens (int, optional): 입력 중 캐시 적중 토큰
+
+    Returns:
+        float: 비용. 가격 정보가 없으면 None
+    """
+    prices = MODEL_PRICES.get(model)
+    if prices is None or prompt_tokens is None:
+        return None
+    input_price, cached_price, output_price = prices
+    cached = cached_tokens or 0
+    return ((prompt_tokens - cached) * input_price + cached * cached_price
+            + (completion_tokens or 0) * output_price) / 1_000_000
+
+
+class ModelRouter:
+    """호출 유형별 모델 라우팅 테이블"""
+
+    def __init__(self, routes: Optional[Dict[str, ModelRoute]] = None):
+        """
+        ModelRouter 초기화
+
+        Args:
+            routes (Dict, optional): 호출 유형 -> 라우팅 설정. None이면 설정값으로 구성
+        """
+        self.routes = routes or self.default_routes()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_routes() -> Dict[str, ModelRoute]:
+        """
+        설정(Config) 기반 기본 라우팅 테이블 - 짧은 보조 호출은 가장 저렴하고 빠른 모델 사용
+
+        보조 경로는 추론 강도를 낮추고(AUXILIARY_REASONING_EFFORT), 출력 한도는 추론 토큰까지 감안해 잡음
+        (한도가 출력 길이에 딱 맞으면 추론만 하다 빈 응답으로 끝날 수 있음)
+        """
+        effort = Config.AUXILIARY_REASONING_EFFORT or None
+        return {
+            'body': ModelRoute('body', Config.MODEL_BODY, Config.PROMPT_TOKEN_BUDGET_BODY,
+                               Config.COMPLETION_TOKENS_BODY, Config.TIMEOUT_BODY),
+            'seo_meta': ModelRoute('seo_meta', Config.MODEL_AUXILIARY, Config.PROMPT_TOKEN_BUDGET_SEO_META,
+                                   Config.COMPLETION_TOKENS_SEO_META, Config.TIMEOUT_AUXILIARY, effort),
+            'categorization': ModelRoute('categorization', Config.MODEL_AUXILIARY, 1000, 400,
+                                         Config.TIMEOUT_AUXILIARY, effort),
+            'summary': ModelRoute('summary', Config.MODEL_AUXILIARY, 3000, 1200, Config.TIMEOUT_AUXILIARY, effort),
+            # 개요는 짧은 보조 호출, 섹션은 본문 모델로 병렬 생성
+            'outline': ModelRoute('outline', Config.MODEL_AUXILIARY, Config.PROMPT_TOKEN_BUDGET_BODY, 1000,
+                                  Config.TIMEOUT_AUXILIARY, effort),
+            'section': ModelRoute('section', Config.MODEL_BODY, Config.PROMPT_TOKEN_BUDGET_BODY,
+                                  Config.COMPLETION_TOKENS_SECTION, Config.TIMEOUT_BODY),
+        }
+
+    def route(self, call_type: str) -> ModelRoute:
+        """호출 유형의 라우팅 설정 (모르는 유형은 본문 경로)"""
+        return self.routes.get(call_type) or self.routes['body']
+
+    def prompt_budgets(self) -> Dict[str, int]:
+        return {name: route.max_prompt_tokens for name, route in self.routes.items()}
+
+    def completion_budgets(self) -> Dict[str, int]:
+        return {name: route.max_completion_tokens for name, route in self.routes.items()}
+
+    def record(self, route: ModelRoute, duration: float, usage: Any = None) -> Optional[float]:
+        """
+        경로별 지연시간·비용 기록
+
+        Args:
+            route (ModelRoute): 사용한 경로
+            duration (float): 호출 소요 시간
+            usage: OpenAI usage 객체
+
+        Returns:
+            float: 추정 비용 (USD)
+        """
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cost = estimate_cost(route.model, getattr(usage, 'prompt_tokens', None),
+                             getattr(usage, 'completion_tokens', None), getattr(details, 'cached_tokens', None))
+
+        with self._lock:
+            stats = self._stats.setdefault(route.call_type, {'calls': 0, 'latency': 0.0, 'cost': 0.0})
+            stats['calls'] += 1
+            stats['latency'] += duration
+            stats['cost'] += cost or 0.0
+
+        cost_str = f"${cost:.5f}" if cost is not None else "cost n/a"
+        logger.info(f"[ROUTE] {route.call_type} -> {route.model}: {duration:.2f}s, {cost_str}")
+        return cost
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """경로별 호출 수, 평균 지연시간, 누적 비용"""
+        with self._lock:
+            return {
+                call_type: {
+                    'model': self.route(call_type).model,
+                    'calls': stats['calls'],
+                    'avg_latency': stats['latency'] / stats['calls'] if stats['calls'] else 0.0,
+                    'cost': stats['cost'],
+                }
+                for call_type, stats in self._stats.items()
+            }
+
+
+def test_model_router():
+    """ModelRouter 테스트 함수"""
+    from types import SimpleNamespace
+
+    try:
+        router = ModelRouter()
+        print("Testing ModelRouter...")
+        for call_type in ('body', 'seo_meta', 'categorization', 'summary', 'unknown'):
+            print(f"  {call_type}: {router.route(call_type)}")
+
+        usage = SimpleNamespace(prompt_tokens=1200, completion_tokens=80,
+                                prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+        router.record(router.route('seo_meta'), 0.8, usage)
+        router.record(router.route('body'), 25.0, SimpleNamespace(prompt_tokens=2000, completion_tokens=2400,
+                                                                  prompt_tokens_details=None))
+        print(f"  Summary: {router.summary()}")
+
+        summary = router.summary()
+        return summary['seo_meta']['cost'] < summary['body']['cost']
+
+    except Exception as e:
+        print(f"ModelRouter test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_model_router()
@@ -0,0 +1,114 @@
+"""
+프롬프트 토큰 예산 모듈
+호출 유형(본문, SEO 메타)별 입력 토큰 예산을 넘지 않도록 리서치·본문 발췌·템플릿을 잘라서 메시지 구성
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..config import Config
+from ..utils.token_counter import count_tokens, count_message_tokens, truncate_to_tokens
+from .prompt_builder import PromptBuilder
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 예산 초과 시 먼저 줄일 가변 데이터 (앞쪽부터)
+TRIMMABLE_VARIABLES = ('research_data', 'content')
+
+
+class PromptBudgetEnforcer:
+    """호출 유형별 프롬프트 토큰 예산 적용기"""
+
+    def __init__(self, prompt_builder: PromptBuilder, prompt_budgets: Optional[Dict[str, int]] = None,
+                 completion_budgets: Optional[Dict[str, int]] = None):
+        """
+        PromptBudgetEnforcer 초기화
+
+        Args:
+            prompt_builder (PromptBuilder): 메시지 구성기
+            prompt_budgets (Dict, optional): 호출 유형 -> 최대 입력 토큰
+            completion_budgets (Dict, optional): 호출 유형 -> 최대 출력 토큰
+        """
+        self.prompt_builder = prompt_builder
+        self.prompt_budgets = prompt_budgets or {
+            'body': Config.PROMPT_TOKEN_BUDGET_BODY,
+            'seo_meta': Config.PROMPT_TOKEN_BUDGET_SEO_META,
+        }
+        self.completion_budgets = completion_budgets or {
+            'body': Config.COMPLETION_TOKENS_BODY,
+            'seo_meta': Config.COMPLETION_TOKENS_SEO_META,
+        }
+
+    def completion_budget(self, call_type: str) -> int:
+        """호출 유형의 최대 출력 토큰"""
+        return self.completion_budgets.get(call_type, self.completion_budgets['body'])
+
+    def build(self, call_type: str, instructions: str,
+              variables: Dict[str, Any]) -> Tuple[List[Dict[str, str]], int]:
+        """
+        예산 안에 들도록 메시지 구성
+
+        Args:
+            call_type (str): 호출 유형 ('body', 'seo_meta')
+            instructions (str): 고정 지시문 (템플릿)
+            variables (Dict): 가변 입력 데이터
+
+        Returns:
+            Tuple[List[Dict], int]: (메시지 목록, 추정 입력 토큰 수)
+        """
+        budget = self.prompt_budgets.get(call_type, self.prompt_budgets['body'])
+        messages = self.prompt_builder.build_messages(instructions, variables)
+        original_tokens = estimated_tokens = count_message_tokens(messages)
+        if estimated_tokens <= budget:
+            return messages, estimated_tokens
+
+        # 1. 리서치 데이터·본문 발췌부터 줄임
+        variables = dict(variables)
+        for name in TRIMMABLE_VARIABLES:
+            value = variables.get(name)
+            if not value or estimated_tokens <= budget:
+                continue
+            value_tokens = count_tokens(str(value))
+            variables[name] = truncate_to_tokens(str(value), value_tokens - (estimated_tokens - budget))
+            messages = self.prompt_builder.build_messages(instructions, variables)
+            estimated_tokens = count_message_tokens(messages)
+
+        # 2. 그래도 넘치면 템플릿 뒤쪽(세부 주의사항)을 줄임
+        if estimated_tokens > budget:
+            instructions = truncate_to_tokens(instructions, count_tokens(instructions) - (estimated_tokens - budget))
+            messages = self.prompt_builder.build_messages(instructions, variables)
+            estimated_tokens = count_message_tokens(messages)
+
+        logger.warning(f"[TOKENS] Trimmed {call_type} prompt from ~{original_tokens} to ~{estimated_tokens} tokens (budget {budget})")
+        return messages, estimated_tokens
+
+
+def test_prompt_budget():
+    """PromptBudgetEnforcer 테스트 함수"""
+    try:
+        enforcer = PromptBudgetEnforcer(PromptBuilder(), prompt_budgets={'body': 800, 'seo_meta': 300},
+                                        completion_budgets={'body': 2500, 'seo_meta': 300})
+        research = "\n".join(f"- Fact {i}: recent developments in retrieval augmented generation" for i in range(200))
+
+        print("Testing PromptBudgetEnforcer...")
+        messages, tokens = enforcer.build('body', enforcer.prompt_builder.load_template('researched'),
+                                          {'title': 'RAG', 'research_data': research})
+        print(f"  Body prompt: ~{tokens} tokens (budget 800)")
+
+        meta_messages, meta_tokens = enforcer.build('seo_meta', enforcer.prompt_builder.load_template('seo_meta'),
+                                                    {'title': 'RAG', 'content': research})
+        print(f"  SEO meta prompt: ~{meta_tokens} tokens (budget 300)")
+        print(f"  SEO meta completion budget: {enforcer.completion_budget('seo_meta')} tokens")
+
+        return tokens <= 800 and meta_tokens <= 300 and 'title: RAG' in messages[-1]['content']
+
+    except Exception as e:
+        print(f"PromptBudgetEnforcer test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_prompt_budget()
@@ -0,0 +1,134 @@
+"""
+프롬프트 조립 모듈
+고정 지시문·템플릿을 앞에, 주제·리서치 등 가변 데이터를 뒤에 배치하여 OpenAI 프롬프트 캐시(동일 접두사 재사용)를 활용
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ..config import Config
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 모든 요청이 공유하는 고정 시스템 지시문
+SYSTEM_PROMPT = "당신은 전문 블로그 작가입니다... (생략)"
+
+# 이 길이를 넘거나 여러 줄인 값은 별도 섹션으로 배치
+INLINE_VALUE_LIMIT = 200
+
+
+class PromptBuilder:
+    """캐시 친화적(고정 접두사 + 가변 꼬리) 메시지 구성기"""
+
+    def __init__(self, prompts_dir: Optional[Path] = None, system_prompt: str = SYSTEM_PROMPT):
+        """
+        PromptBuilder 초기화
+
+        Args:
+            prompts_dir (Path, optional): 프롬프트 템플릿 디렉터리
+            system_prompt (str): 고정 시스템 지시문
+        """
+        self.prompts_dir = Path(prompts_dir or Config.PROMPTS_DIR)
+        self.system_prompt = system_prompt
+        self._templates: Dict[str, str] = {}
+
+    def load_template(self, name: str) -> str:
+        """
+        템플릿을 고정 지시문으로 로드 (요청마다 바뀌지 않도록 값은 채우지 않음)
+
+        템플릿의 {{title}} 같은 자리표시자는 {title}로 남겨 뒤쪽 입력 데이터의 같은 이름 항목을 가리키게 함
+
+        Args:
+            name (str): 템플릿 이름 (post_<name>.txt)
+
+        Returns:
+            str: 고정 템플릿 텍스트
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template_file = self.prompts_dir / f"post_{name}.txt"
+            if not template_file.exists():
+                raise FileNotFoundError(f"Prompt template not found: {template_file}")
+            with open(template_file, 'r', encoding='utf-8') as f:
+                template = re.sub(r'\{\{(\w+)\}\}', r'{\1}', f.read().strip())
+            self._templates[name] = template
+        return template
+
+    @staticmethod
+    def render_variables(variables: Dict[str, Any]) -> str:
+        """
+        가변 입력 데이터 블록 생성 (짧은 값은 목록, 긴 값은 섹션)
+
+        Args:
+            variables (Dict): 자리표시자 이름 -> 값
+
+        Returns:
+            str: 입력 데이터 블록
+        """
+        inline_lines = []
+        sections = []
+        for name, value in variables.items():
+            if value is None or value == '' or value == []:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = ', '.join(str(item) for item in value)
+            value = str(value).strip()
+            if '\n' in value or len(value) > INLINE_VALUE_LIMIT:
+                sections.append(f"### {name}\n{value}")
+            else:
+                inline_lines.append(f"- {name}: {value}")
+
+        parts = ["## 입력 데이터"]
+        if inline_lines:
+            parts.append('\n'.join(inline_lines))
+        parts.extend(sections)
+        return '\n\n'.join(parts)
+
+    def build_messages(self, instructions: str, variables: Dict[str, Any]) -> List[Dict[str, str]]:
+        """
+        고정 지시문을 system, 가변 데이터를 마지막 user 메시지로 배치한 메시지 구성
+
+        Args:
+            instructions (str): 고정 지시문 (템플릿 텍스트)
+            variables (Dict): 가변 입력 데이터
+
+        Returns:
+            List[Dict]: Chat Completion 메시지 목록
+        """
+        return [
+            {"role": "system", "content": f"{self.system_prompt}\n\n{instructions}"},
+            {"role": "user", "content": self.render_variables(variables)},
+        ]
+
+    def build_template_messages(self, template_name: str, variables: Dict[str, Any]) -> List[Dict[str, str]]:
+        """템플릿 이름으로 메시지 구성"""
+        return self.build_messages(self.load_template(template_name), variables)
+
+
+def test_prompt_builder():
+    """PromptBuilder 테스트 함수"""
+    try:
+        builder = PromptBuilder()
+
+        first = builder.build_template_messages('researched', {'title': 'AI 에이전트', 'research_data': 'Key Facts:\n- a'})
+        second = builder.build_template_messages('researched', {'title': '양자 컴퓨팅', 'research_data': 'Key Facts:\n- b'})
+
+        print("Testing PromptBuilder...")
+        print(f"  System prefix identical across topics: {first[0] == second[0]}")
+        print(f"  Variable data last: {first[-1]['role']} ({len(first[-1]['content'])} chars)")
+        print(f"  Static prefix length: {len(first[0]['content'])} chars")
+
+        return first[0] == second[0] and 'AI 에이전트' in first[-1]['content']
+
+    except Exception as e:
+        print(f"PromptBuilder test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_prompt_builder()
@@ -0,0 +1,228 @@
+"""
+LLM 응답 캐시 모듈
+모델·메시지·파라미터 해시로 OpenAI 응답을 디스크에 저장하여 동일 프롬프트 재실행 비용을 제거
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..config import Config
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 캐시 모드: rw(읽기/쓰기), ro(읽기 전용, 재현용), off(사용 안 함)
+CACHE_MODES = ('rw', 'ro', 'off')
+
+# 다른 프로세스의 쓰기를 반영하기 위해 디렉터리 전체 크기를 다시 계산하는 저장 간격
+RESCAN_EVERY_PUTS = 100
+
+
+class LLMResponseCache:
+    """내용 주소 기반 LLM 응답 캐시 (크기 기준 LRU 정리)"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, mode: Optional[str] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        LLMResponseCache 초기화
+
+        Args:
+            cache_dir (Path, optional): 캐시 디렉터리. None이면 캐시 디렉터리 하위 llm 사용
+            mode (str, optional): 'rw', 'ro', 'off'. None이면 설정값 사용
+            max_bytes (int, optional): 캐시 최대 크기. 초과 시 오래 쓰지 않은 항목부터 삭제
+        """
+        self.cache_dir = Path(cache_dir or Config.CACHE_DIR / 'llm')
+        self.mode = (mode or Config.LLM_CACHE_MODE).lower()
+        if self.mode not in CACHE_MODES:
+            logger.warning(f"Unknown LLM cache mode '{self.mode}', disabling cache")
+            self.mode = 'off'
+        self.max_bytes = max_bytes if max_bytes is not None else Config.LLM_CACHE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        # 누적 크기 (첫 저장 시 디렉터리 스캔으로 초기화) 및 마지막 스캔 이후 저장 횟수
+        self._total_bytes: Optional[int] = None
+        self._puts_since_scan = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def readable(self) -> bool:
+        return self.mode in ('rw', 'ro')
+
+    @property
+    def writable(self) -> bool:
+        return self.mode == 'rw'
+
+    @staticmethod
+    def make_key(api_kwargs: Dict[str, Any]) -> str:
+        """
+        요청 파라미터로 캐시 키 계산
+
+        Args:
+            api_kwargs (Dict): Chat Completion 요청 인자 (model, messages, 생성 파라미터)
+
+        Returns:
+            str: SHA-256 16진수 키
+        """
+        payload = json.dumps(api_kwargs, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            str: 캐시된 응답 텍스트. 없으면 None
+        """
+        if not self.readable:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # 최근 사용 시각 갱신 (LRU 정리 기준)
+            os.utime(path, None)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading LLM cache entry {key[:12]}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info(f"LLM cache hit: {key[:12]} ({entry.get('model')})")
+        return entry.get('content')
+
+    def put(self, key: str, content: str, model: Optional[str] = None):
+        """
+        응답 저장 (rw 모드에서만)
+
+        Args:
+            key (str): 캐시 키
+            content (str): 응답 텍스트
+            model (str, optional): 응답 모델 (기록용)
+        """
+        if not self.writable or not content:
+            return
+
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'model': model, 'created_at': datetime.now().isoformat(), 'content': content},
+                          f, ensure_ascii=False)
+            new_size = tmp_path.stat().st_size
+            try:
+                old_size = path.stat().st_size
+            except FileNotFoundError:
+                old_size = 0
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Error writing LLM cache entry {key[:12]}: {e}")
+            return
+
+        # 누적 크기만 갱신하고, 한도를 넘었거나 일정 횟수마다만 디렉터리를 스캔
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._total_bytes is not None:
+                self._total_bytes += new_size - old_size
+            needs_scan = (self._total_bytes is None or self._total_bytes > self.max_bytes
+                          or self._puts_since_scan >= RESCAN_EVERY_PUTS)
+        if needs_scan:
+            self._evict()
+
+    def _evict(self):
+        """디렉터리 전체 크기를 다시 계산하고, 한도를 넘으면 최근 사용 시각이 오래된 항목부터 삭제"""
+        with self._lock:
+            self._puts_since_scan = 0
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob('*/*.json'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                self._total_bytes = total
+                return
+
+            entries.sort()
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+            self._total_bytes = total
+            logger.info(f"LLM cache evicted {removed} entries (size now {total} bytes)")
+
+
+def test_response_cache():
+    """LLMResponseCache 테스트 함수"""
+    import tempfile
+    import time
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = LLMResponseCache(cache_dir=Path(tmp_dir), mode='rw', max_bytes=600)
+            request = {'model': 'gpt-5-mini', 'messages': [{'role': 'user', 'content': 'hello'}],
+                       'max_completion_tokens': 100}
+            key = cache.make_key(request)
+
+            print("Testing LLMResponseCache...")
+            print(f"  Miss before write: {cache.get(key) is None}")
+            cache.put(key, "# Hello\n\nCached body", model='gpt-5-mini')
+            print(f"  Hit after write: {cache.get(key) is not None}")
+
+            changed = dict(request, max_completion_tokens=200)
+            print(f"  Different parameters give different key: {cache.make_key(changed) != key}")
+
+            # 읽기 전용 모드는 저장하지 않음
+            replay = LLMResponseCache(cache_dir=Path(tmp_dir), mode='ro')
+            replay.put(replay.make_key(changed), "new content")
+            print(f"  Read-only mode does not write: {replay.get(replay.make_key(changed)) is None}")
+
+            # 크기 한도 초과 시 가장 오래 쓰지 않은 항목 삭제
+            for i in range(5):
+                time.sleep(0.01)
+                cache.put(f"{i:02d}" + key[2:], "x" * 200)
+            print(f"  Oldest entry evicted: {cache.get(key) is None}")
+
+            # 한도 안의 저장은 디렉터리를 다시 스캔하지 않음 (누적 크기만 갱신)
+            roomy = LLMResponseCache(cache_dir=Path(tmp_dir), mode='rw', max_bytes=10 ** 6)
+            roomy.put(key, "first")
+            roomy.put(key, "second")
+            print(f"  Scans skipped under the limit: {roomy._puts_since_scan == 1}")
+
+            return cache.hits == 1 and roomy._puts_since_scan == 1
+
+    except Exception as e:
+        print(f"LLMResponseCache test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_response_cache()
@@ -4,15 +4,18 @@ SEO 메타데이터 생성 모듈
 """
 
 import re
-import yaml
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from unidecode import unidecode
 
 from .content_gen import ContentGenerator
+from .extractive_summary import ExtractiveSummarizer
+from .keyword_engine import get_keyword_engine
+from .category_model import load_categorizer
 from ..config import Config
+from ..utils.slug import slugify
+from ..utils.front_matter import render_post
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -29,6 +32,12 @@ class SEOGenerator:
             content_generator (ContentGenerator, optional): 콘텐츠 생성기 인스턴스
         """
         self.content_generator = content_generator or ContentGenerator()
+        self.combined_generation = Config.COMBINED_SEO_GENERATION
+        self.summarizer = ExtractiveSummarizer(max_length=160)
+        self.extractive_min_score = Config.META_EXTRACTIVE_MIN_SCORE
+        # 학습된 분류 모델은 첫 분류 시 한 번 로드
+        self._categorizer = None
+        self._categorizer_loaded = False
         
         # SEO 설정
         self.max_title_length = 60
@@ -49,32 +58,8 @@ class SEOGenerator:
             str: SEO 친화적 슬러그
         """
         try:
-            # 1. 한글을 영문으로 음역 (unidecode 사용)
-            slug = unidecode(title)
-            
-            # 2. 소문자 변환
-            slug = slug.lower()
-            
-            # 3. 특수문자 제거 및 공백을 하이픈으로 변경
-            slug = re.sub(r'[^\w\s-]', '', slug)  # 알파벳, 숫자, 공백, 하이픈만 유지
-            slug = re.sub(r'[\s_]+', '-', slug)   # 공백과 언더스코어를 하이픈으로
-            slug = re.sub(r'-+', '-', slug)       # 연속된 하이픈을 하나로
-            
-            # 4. 앞뒤 하이픈 제거
-            slug = slug.strip('-')
-            
-            # 5. 길이 제한
-            if len(slug) > self.max_slug_length:
-                # 단어 경계에서 자르기
-                slug = slug[:self.max_slug_length]
-                last_dash = slug.rfind('-')
-                if last_dash > 20:  # 너무 짧아지지 않도록
-                    slug = slug[:last_dash]
-            
-            # 6. 빈 문자열 방지
-            if not slug:
-                slug = "blog-post"
-            
+            # 음역·정규화·길이 제한은 공용 슬러그 모듈(메모이제이션) 사용
+            slug = slugify(title, self.max_slug_length)
             logger.info(f"Generated slug: '{title}' -> '{slug}'")
             return slug
             
@@ -101,12 +86,8 @@ class SEOGenerator:
             # 기존 키워드 먼저 추가
             keywords.extend(existing_keywords)
             
-            # 제목과 헤딩에서 키워드 추출
-            headings = re.findall(r'^#+\s+(.+)$', content, re.MULTILINE)
-            for heading in headings:
-                # 간단한 키워드 추출 (향후 NLP 라이브러리로 개선 가능)
-                words = re.findall(r'\b[가-힣]{2,}\b', heading)
-                keywords.extend(words[:2])  # 각 제목에서 최대 2개
+            # _posts 코퍼스 DF 통계 기반 TF-IDF 상위 단어·바이그램 추가
+            keywords.extend(get_keyword_engine().extract(content, top_k=self.max_keywords, exclude=existing_keywords))
             
             # 중복 제거 및 길이 제한
             unique_keywords = []
@@ -126,7 +107,7 @@ class SEOGenerator:
     
     def generate_meta_description(self, title: str, content: str, keywords: List[str] = None) -> str:
         """
-        AI를 활용하여 메타 설명 생성
+        메타 설명 생성 (본문에서 로컬 추출, 추출 품질이 낮을 때만 AI 호출)
         
         Args:
             title (str): 글 제목
@@ -136,23 +117,27 @@ class SEOGenerator:
         Returns:
             str: 생성된 메타 설명
         """
+        # 본문 앞부분에서 TextRank로 추출 (API 호출 없음)
+        meta_description, score = self.summarizer.summarize(content, title, keywords)
+        if meta_description and score >= self.extractive_min_score:
+            logger.info(f"Extracted meta description locally ({len(meta_description)} chars, score {score:.2f})")
+            return meta_description
+        logger.info(f"Extractive meta description scored {score:.2f} (< {self.extractive_min_score}), using AI")
+        
         try:
-            # AI를 이용한 메타 설명 생성 요청
+            # AI를 이용한 메타 설명 생성 요청 (SEO 메타 프롬프트 사용, 글 정보는 프롬프트 뒤쪽에 배치)
             seo_topic = {
                 'title': title,
-                'content': content[:1000],  # 처음 1000자만 사용
+                'category': 'general',
                 'keywords': keywords or [],
-                'category': 'general'
+                'content': content[:1000]  # 처음 1000자만 사용
             }
             
-            # SEO 메타 프롬프트 사용
-            template = self.content_generator.load_prompt_template('seo_meta')
-            formatted_prompt = self.content_generator.format_prompt(template, seo_topic)
-            
             # AI 응답에서 메타 설명 부분만 추출
-            ai_response = self.content_generator.call_openai_api(
-                formatted_prompt, 
-                max_tokens=300,  # 짧은 응답
+            ai_response = self.content_generator.generate_from_template(
+                'seo_meta',
+                seo_topic,
+                call_type='seo_meta',  # 짧은 응답, 작은 입력 예산
                 temperature=0.5  # 더 일관된 결과
             )
             
@@ -230,18 +215,30 @@ class SEOGenerator:
         
         return description
     
-    def categorize_post(self, title: str, content: str, keywords: List[str] = None) -> str:
+    def categorize_post(self, title: str, content: str, keywords: List[str] = None, default: str = 'general') -> str:
         """
-        글의 내용을 바탕으로 카테고리 분류
+        글의 내용을 바탕으로 카테고리 분류 (학습된 분류 모델 우선, 확신이 낮으면 키워드 규칙)
         
         Args:
             title (str): 글 제목
             content (str): 글 내용
             keywords (List[str], optional): 키워드 리스트
+            default (str): 어느 쪽으로도 분류되지 않을 때의 카테고리
             
         Returns:
             str: 분류된 카테고리
         """
+        if not self._categorizer_loaded:
+            self._categorizer = load_categorizer()
+            self._categorizer_loaded = True
+        
+        if self._categorizer is not None:
+            category, probability = self._categorizer.predict(f"# {title}\n{' '.join(keywords or [])}\n{content}")
+            if probability >= Config.CATEGORY_MIN_CONFIDENCE:
+                logger.info(f"Categorized as: {category} (model, p={probability:.2f})")
+                return category
+            logger.info(f"Category model unsure ({category}, p={probability:.2f}), using keyword rules")
+        
         # 키워드 기반 카테고리 매핑
         category_keywords = {
             'productivity': ['생산성', '효율', '업무', '일', '도구', '앱', '시간관리'],
@@ -270,10 +267,10 @@ class SEOGenerator:
             return best_category
         
         # 기본 카테고리
-        return 'general'
+        return default
     
     def generate_front_matter(self, topic: Dict[str, Any], content: str, 
-                            generated_content: str = None) -> Dict[str, Any]:
+                            generated_content: str = None, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Jekyll용 Front Matter YAML 생성
         
@@ -281,6 +278,7 @@ class SEOGenerator:
             topic (Dict): 원본 주제 정보
             content (str): 생성된 콘텐츠
             generated_content (str, optional): 추가 생성 콘텐츠
+            metadata (Dict, optional): 본문과 함께 생성된 SEO 메타데이터 (meta_description, tags, category)
             
         Returns:
             Dict: Front matter 데이터
@@ -289,11 +287,18 @@ class SEOGenerator:
             title = topic.get('title', '제목 없음')
             existing_keywords = topic.get('keywords', [])
             
-            # SEO 메타데이터 생성
+            # SEO 메타데이터 생성 (본문과 함께 받은 메타데이터가 있으면 추가 호출 없이 사용)
             slug = self.generate_slug(title)
-            keywords = self.extract_keywords_from_content(content, existing_keywords)
-            meta_description = self.generate_meta_description(title, content, keywords)
-            category = self.categorize_post(title, content, keywords)
+            if metadata:
+                keywords = list(dict.fromkeys(existing_keywords + metadata['tags']))[:self.max_keywords]
+                meta_description = metadata['meta_description']
+                if len(meta_description) > self.max_description_length:
+                    meta_description = meta_description[:self.max_description_length-3] + "..."
+                category = metadata['category']
+            else:
+                keywords = self.extract_keywords_from_content(content, existing_keywords)
+                meta_description = self.generate_meta_description(title, content, keywords)
+                category = self.categorize_post(title, content, keywords)
             
             # Front matter 구성
             front_matter = {
@@ -327,12 +332,13 @@ class SEOGenerator:
                 'author': 'AutoBot'
             }
     
-    def create_full_post(self, topic: Dict[str, Any]) -> str:
+    def create_full_post(self, topic: Dict[str, Any], content: Optional[str] = None) -> str:
         """
         주제를 바탕으로 Front Matter + 콘텐츠가 포함된 완전한 포스트 생성
         
         Args:
             topic (Dict): 주제 정보
+            content (str, optional): 이미 생성된 본문 (Batch API 등). None이면 새로 생성
             
         Returns:
             str: Front Matter + 콘텐츠가 포함된 완전한 마크다운
@@ -340,19 +346,19 @@ class SEOGenerator:
         try:
             # 1. 콘텐츠 생성
             logger.info(f"Creating full post for: {topic.get('title')}")
-            content = self.content_generator.generate_post(topic)
+            metadata = None
+            if content is None and self.combined_generation:
+                # 본문 + 메타 설명·태그·카테고리를 한 번의 JSON 응답으로 생성
+                metadata = self.content_generator.generate_post_with_metadata(topic)
+                content = metadata['content']
+            elif content is None:
+                content = self.content_generator.generate_post(topic)
             
             # 2. Front Matter 생성
-            front_matter_data = self.generate_front_matter(topic, content)
-            
-            # 3. YAML Front Matter 문자열 생성
-            front_matter_yaml = yaml.dump(front_matter_data, 
-                                        default_flow_style=False, 
-                                        allow_unicode=True,
-                                        sort_keys=False)
+            front_matter_data = self.generate_front_matter(topic, content, metadata=metadata)
             
-            # 4. 완전한 포스트 조합
-            full_post = f"---\n{front_matter_yaml}---\n\n{content}"
+            # 3. Front Matter + 콘텐츠 조합 (공용 코덱)
+            full_post = render_post(front_matter_data, content)
             
             logger.info(f"Created full post ({len(full_post)} chars)")
             return full_post
@@ -0,0 +1,105 @@
+"""
+스트리밍 출력 점진 검증 모듈
+토큰이 도착하는 대로 글 구조를 검사하여 명백히 잘못된 생성은 조기에 중단
+"""
+
+import logging
+import re
+from typing import Optional
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 모델이 작성을 거부할 때 나타나는 문구 (글 앞부분에서만 검사)
+REFUSAL_PATTERNS = [
+    r"^\s*i'?m sorry",
+    r"^\s*i (?:can(?:no|')t|am unable to|won'?t)",
+    r"^\s*as an ai",
+    r"^\s*죄송(?:합니다|하지만)",
+    r"(?:도와|작성해)\s*드릴\s*수\s*없",
+]
+
+
+class StreamAbortedError(Exception):
+    """스트리밍 생성이 점진 검증에 실패하여 중단됨"""
+
+    def __init__(self, reason: str, partial_content: str = ""):
+        super().__init__(f"Streaming generation aborted: {reason}")
+        self.reason = reason
+        self.partial_content = partial_content
+
+
+class StreamValidator:
+    """스트리밍 중인 블로그 글의 구조 점진 검증기"""
+
+    def __init__(self, heading_window: int = 40, refusal_window: int = 200):
+        """
+        StreamValidator 초기화
+
+        Args:
+            heading_window (int): 첫 '#' 제목이 나와야 하는 앞부분 글자 수
+            refusal_window (int): 거부 문구를 검사할 앞부분 글자 수
+        """
+        self.heading_window = heading_window
+        self.refusal_window = refusal_window
+        self.content = ""
+        self._refusal_res = [re.compile(pattern, re.IGNORECASE) for pattern in REFUSAL_PATTERNS]
+
+    def feed(self, delta: str) -> Optional[str]:
+        """
+        새로 도착한 텍스트 추가 후 검증
+
+        Args:
+            delta (str): 새로 도착한 텍스트 조각
+
+        Returns:
+            str: 중단 사유. 계속 진행 가능하면 None
+        """
+        checked_before = len(self.content.lstrip())
+        self.content += delta
+        head = self.content.lstrip()
+
+        # 이미 검사 구간을 지났으면 더 볼 필요 없음
+        if checked_before >= self.refusal_window:
+            return None
+
+        head_window = head[:self.refusal_window]
+        for refusal_re in self._refusal_res:
+            if refusal_re.search(head_window):
+                return "model refused to write the post"
+
+        # 첫 글자가 '#'이 아니면 사유를 판단할 만큼(heading_window) 받은 뒤 중단
+        if head and not head.startswith('#') and len(head) >= self.heading_window:
+            return "output does not start with a '#' heading"
+
+        return None
+
+
+def test_stream_validator():
+    """StreamValidator 테스트 함수"""
+    try:
+        print("Testing StreamValidator...")
+
+        good = StreamValidator()
+        reasons = [good.feed(chunk) for chunk in ["# AI", " 트렌드\n\n", "## 개요\n", "본문..."]]
+        print(f"  Well-formed stream passes: {all(reason is None for reason in reasons)}")
+
+        no_heading = StreamValidator()
+        heading_reason = no_heading.feed("Here is your blog post about AI trends in 2025:\n\n")
+        print(f"  Missing heading detected: {heading_reason}")
+
+        refusal = StreamValidator()
+        reason = refusal.feed("죄송합니다. 해당 주제로는 글을 작성해 드릴 수 없습니다.")
+        print(f"  Refusal detected: {reason}")
+
+        return all(r is None for r in reasons) and heading_reason is not None and reason is not None
+
+    except Exception as e:
+        print(f"StreamValidator test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_stream_validator()
@@ -0,0 +1,125 @@
+"""
+구조화 포스트 응답 모듈
+한 번의 호출로 본문 + SEO 메타데이터(메타 설명, 태그, 카테고리)를 JSON으로 받고 스키마 검증
+"""
+
+import json
+import logging
+from typing import Dict, Any
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# SEOGenerator.categorize_post와 같은 카테고리 체계
+POST_CATEGORIES = ['productivity', 'technology', 'lifestyle', 'business', 'education', 'finance', 'general']
+
+# OpenAI Structured Outputs(strict) 호환 스키마: 모든 필드 필수, 추가 필드 금지
+POST_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'content': {'type': 'string', 'description': 'Full blog post in Markdown, starting with a # heading'},
+        'meta_description': {'type': 'string', 'description': 'SEO meta description, 150-160 characters'},
+        'tags': {'type': 'array', 'items': {'type': 'string'}, 'description': '3-8 keywords'},
+        'category': {'type': 'string', 'enum': POST_CATEGORIES},
+    },
+    'required': ['content', 'meta_description', 'tags', 'category'],
+    'additionalProperties': False,
+}
+
+RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {'name': 'blog_post', 'strict': True, 'schema': POST_SCHEMA},
+}
+
+# 구조화 응답 형식 안내 (게시글 템플릿 뒤에 붙는 고정 지시문)
+OUTPUT_INSTRUCTIONS = """**Output Format:**
+
+Return ONLY a JSON object with these fields:
+- `content`: the complete blog post in Markdown as instructed above, starting with the `#` main heading. Do not include a Tags line.
+- `meta_description`: an SEO meta description of 150-160 characters in the language of the post, summarizing the value for the reader.
+- `tags`: 3-8 relevant keywords for the post.
+- `category`: one of """ + ', '.join(POST_CATEGORIES) + "."
+
+
+class StructuredPostError(ValueError):
+    """구조화 응답이 스키마와 맞지 않음 (재시도 대상)"""
+    pass
+
+
+def parse_structured_post(text: str) -> Dict[str, Any]:
+    """
+    JSON 응답 파싱 및 스키마 검증
+
+    Args:
+        text (str): 모델 응답 텍스트
+
+    Returns:
+        Dict: content, meta_description, tags, category
+
+    Raises:
+        StructuredPostError: JSON이 아니거나 스키마와 맞지 않는 경우
+    """
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise StructuredPostError(f"Response is not valid JSON: {e}")
+
+    if not isinstance(payload, dict):
+        raise StructuredPostError(f"Expected a JSON object, got {type(payload).__name__}")
+
+    missing = [field for field in POST_SCHEMA['required'] if field not in payload]
+    if missing:
+        raise StructuredPostError(f"Missing fields: {', '.join(missing)}")
+
+    for field in ('content', 'meta_description', 'category'):
+        if not isinstance(payload[field], str) or not payload[field].strip():
+            raise StructuredPostError(f"Field '{field}' must be a non-empty string")
+    if not isinstance(payload['tags'], list) or not all(isinstance(tag, str) for tag in payload['tags']):
+        raise StructuredPostError("Field 'tags' must be a list of strings")
+
+    if not payload['content'].lstrip().startswith('#'):
+        raise StructuredPostError("Field 'content' must start with a Markdown heading")
+    if payload['category'] not in POST_CATEGORIES:
+        raise StructuredPostError(f"Unknown category: {payload['category']}")
+
+    return {
+        'content': payload['content'].strip(),
+        'meta_description': payload['meta_description'].strip(),
+        'tags': [tag.strip() for tag in payload['tags'] if tag.strip()],
+        'category': payload['category'],
+    }
+
+
+def test_structured_post():
+    """구조화 응답 파싱 테스트 함수"""
+    try:
+        valid = json.dumps({
+            'content': '# 생산성 앱 10선\n\n## 소개\n\n본문',
+            'meta_description': '업무 효율을 높이는 생산성 앱 10개를 소개합니다.',
+            'tags': ['생산성', '앱', ' '],
+            'category': 'productivity',
+        }, ensure_ascii=False)
+        post = parse_structured_post(valid)
+        print("Testing structured post parsing...")
+        print(f"  Parsed: category={post['category']}, tags={post['tags']}")
+
+        rejected = 0
+        for invalid in ('not json', '[]', '{"content": "# T"}',
+                        valid.replace('productivity', 'sports'), valid.replace('# 생산성', '생산성')):
+            try:
+                parse_structured_post(invalid)
+            except StructuredPostError as e:
+                rejected += 1
+                print(f"  Rejected: {e}")
+
+        return post['tags'] == ['생산성', '앱'] and rejected == 5
+
+    except Exception as e:
+        print(f"Structured post test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_structured_post()
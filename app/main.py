@@ -18,11 +18,12 @@ sys.path.insert(0, str(project_root))
 from app.config import Config
 from app.generators.content_gen import ContentGenerator
 from app.generators.seo_gen import SEOGenerator
+from app.generators.batch_gen import BatchGenerator
 from app.publishers.repo_writer import RepoWriter
 from app.utils.topic_loader import TopicLoader
 from app.collectors.idea_collector import IdeaCollector
 from app.utils.logger import get_logger, setup_logging
-from app.utils.error_handler import graceful_shutdown, ErrorRecovery, APIError, ContentGenerationError
+from app.utils.error_handler import graceful_shutdown, ErrorRecovery, APIError, ContentGenerationError, reset_retry_budget
 
 # 고급 로깅 시스템 초기화
 logger = setup_logging("INFO")
@@ -30,14 +31,16 @@ logger = setup_logging("INFO")
 class AutoBlogPipeline:
     """AutoBlog 완전 자동화 파이프라인"""
     
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, batch: bool = False):
         """
         파이프라인 초기화
         
         Args:
             dry_run (bool): True면 실제 발행하지 않고 테스트만
+            batch (bool): True면 once/seed 모드 본문을 OpenAI Batch API로 일괄 생성
         """
         self.dry_run = dry_run
+        self.batch = batch
         self.error_recovery = ErrorRecovery()
         
         # 컴포넌트 초기화
@@ -45,7 +48,7 @@ class AutoBlogPipeline:
         
         try:
             self.content_generator = ContentGenerator()
-            self.seo_generator = SEOGenerator()
+            self.seo_generator = SEOGenerator(self.content_generator)
             self.repo_writer = RepoWriter()
             self.topic_loader = TopicLoader()
             self.idea_collector = IdeaCollector()
@@ -92,13 +95,15 @@ class AutoBlogPipeline:
             logger.error(f"Error selecting topics: {e}")
             raise
 
-    def generate_and_publish_post(self, topic: Dict[str, Any], generated_content: Optional[str] = None) -> Dict[str, Any]:
+    def generate_and_publish_post(self, topic: Dict[str, Any], generated_content: Optional[str] = None,
+                                  batch_content: Optional[str] = None) -> Dict[str, Any]:
         """
         단일 포스트 생성 및 발행
         
         Args:
             topic (Dict): 주제 정보
             generated_content (str, optional): 이미 생성된 콘텐츠 (dynamic 모드에서 사용)
+            batch_content (str, optional): Batch API로 생성된 본문 (Front Matter는 여기서 생성)
         
         Returns:
             Dict: 실행 결과
@@ -119,9 +124,9 @@ class AutoBlogPipeline:
                 final_content = generated_content
                 logger.info("Using pre-generated content from dynamic pipeline.")
             else:
-                # 기존 topics.yml 모드: SEO Generator를 통해 콘텐츠 생성
+                # 기존 topics.yml 모드: SEO Generator를 통해 콘텐츠 생성 (배치 본문이 있으면 재사용)
                 logger.info("Generating complete post with SEO metadata (legacy mode)...")
-                final_content = self.seo_generator.create_full_post(topic)
+                final_content = self.seo_generator.create_full_post(topic, content=batch_content)
             
             if len(final_content) < 500:
                 raise ValueError(f"Generated post too short: {len(final_content)} chars")
@@ -215,15 +220,20 @@ class AutoBlogPipeline:
                 generated_content = self.content_generator.generate_post_with_research(
                     topic_title=topic_title,
                     category='AI_Trends', # 동적 파이프라인 기본 카테고리
-                    keywords=[] # 키워드는 리서치에서 추출하거나 AI가 생성하도록
+                    keywords=[], # 키워드는 리서치에서 추출하거나 AI가 생성하도록
+                    priority=idea.get('score') # NewsAPI 할당량이 빠듯하면 고득점 아이디어 우선
                 )
 
                 if generated_content:
                     # 콘텐츠에서 태그 추출 (간단한 키워드 기반)
                     extracted_tags = self._extract_tags_from_content(generated_content, topic_title)
                     
+                    # 학습된 분류 모델로 카테고리 결정 (분류되지 않으면 기존 기본값)
+                    category = self.seo_generator.categorize_post(topic_title, generated_content, extracted_tags,
+                                                                  default='AI_Trends')
+                    
                     # 생성된 콘텐츠를 바탕으로 발행
-                    publish_topic = {'title': topic_title, 'post_type': 'article', 'category': 'AI_Trends', 'tags': extracted_tags}
+                    publish_topic = {'title': topic_title, 'post_type': 'article', 'category': category, 'tags': extracted_tags}
                     post_result = self.generate_and_publish_post(publish_topic, generated_content=generated_content)
                     pipeline_result['posts'].append(post_result)
                     
@@ -308,6 +318,9 @@ class AutoBlogPipeline:
         Returns:
             Dict: 전체 실행 결과
         """
+        # 재시도 예산은 실행 단위로 적용
+        reset_retry_budget()
+        
         if mode == 'dynamic':
             return self.run_dynamic_pipeline(count=count if count is not None else 1)
         
@@ -328,11 +341,22 @@ class AutoBlogPipeline:
             topics = self.select_topic(mode)
             pipeline_result['total_count'] = len(topics)
             
+            # 배치 모드: 모든 본문을 Batch API로 한 번에 생성 (실패한 주제는 실시간 생성으로 대체)
+            batch_contents = {}
+            if self.batch:
+                logger.info(f"Generating {len(topics)} posts via OpenAI Batch API...")
+                try:
+                    batch_contents = BatchGenerator(self.content_generator).generate_posts(topics)
+                except Exception as e:
+                    # 제출·폴링·수집 실패나 시간 초과 시 모든 주제를 실시간 생성
+                    logger.error(f"Batch generation failed, falling back to live generation: {e}")
+                    batch_contents = {}
+            
             # 2. 각 주제별로 포스트 생성 및 발행
             for i, topic in enumerate(topics, 1):
                 logger.info(f"Processing {i}/{len(topics)}: {topic['title']}")
                 
-                post_result = self.generate_and_publish_post(topic)
+                post_result = self.generate_and_publish_post(topic, batch_content=batch_contents.get(topic['title']))
                 pipeline_result['posts'].append(post_result)
                 
                 if post_result['success']:
@@ -343,6 +367,9 @@ class AutoBlogPipeline:
             # 3. 결과 출력
             success_rate = (pipeline_result['success_count'] / pipeline_result['total_count']) * 100
             logger.info(f"Pipeline completed: {pipeline_result['success_count']}/{pipeline_result['total_count']} posts ({success_rate:.1f}% success)")
+            for call_type, stats in self.content_generator.model_router.summary().items():
+                logger.info(f"[ROUTE] {call_type} ({stats['model']}): {stats['calls']} calls, "
+                            f"avg {stats['avg_latency']:.2f}s, ${stats['cost']:.4f}")
             
             if pipeline_result['errors']:
                 logger.warning(f"Errors encountered: {len(pipeline_result['errors'])}")
@@ -368,11 +395,31 @@ def main():
                        help='Test mode - generate content but do not publish')
     parser.add_argument('--count', type=int, default=1,
                        help='Number of posts to generate in dynamic mode (default: 1)')
+    parser.add_argument('--batch', action='store_true',
+                       help='Generate once/seed posts through the OpenAI Batch API (cheaper, not interactive)')
+    parser.add_argument('--replay-research', action='store_true',
+                       help='Reuse stored research artifacts instead of calling Wikipedia/NewsAPI')
+    parser.add_argument('--llm-cache', choices=['rw', 'ro', 'off'], default=None,
+                       help='LLM response cache mode: rw (read-write), ro (replay only), off (default: LLM_CACHE_MODE)')
+    parser.add_argument('--generation-mode', choices=['single', 'sections'], default=None,
+                       help='Post body generation: single completion or outline + parallel sections (default: GENERATION_MODE)')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO',
                        help='Logging level (default: INFO)')
     
     args = parser.parse_args()
     
+    # 저장된 리서치로 재현 (네트워크 없이 동일 리서치 사용)
+    if args.replay_research:
+        Config.RESEARCH_REPLAY = True
+    
+    # 동일 프롬프트 재실행 시 저장된 LLM 응답 재사용
+    if args.llm_cache:
+        Config.LLM_CACHE_MODE = args.llm_cache
+    
+    # 본문 생성 방식 (개요 생성 후 섹션 병렬 생성)
+    if args.generation_mode:
+        Config.GENERATION_MODE = args.generation_mode
+    
     # 로그 레벨 조정
     if args.log_level != 'INFO':
         global logger
@@ -397,7 +444,7 @@ def main():
         logger.info("[CONFIG] Configuration validated successfully")
         
         # 파이프라인 실행
-        pipeline = AutoBlogPipeline(dry_run=args.dry_run)
+        pipeline = AutoBlogPipeline(dry_run=args.dry_run, batch=args.batch)
         result = pipeline.run_pipeline(args.mode, count=args.count)
         
         # 최종 결과
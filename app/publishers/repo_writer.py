@@ -9,9 +9,11 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any, List
-import yaml
 
 from ..config import Config
+from ..utils.error_handler import get_retry_engine
+from ..utils.slug import get_slug_index
+from ..utils.front_matter import render_post, split_post
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -36,6 +38,9 @@ class RepoWriter:
         # Git 저장소 확인 및 초기화
         self._init_repo()
         
+        # 기존 포스트 파일명 인덱스 (슬러그 충돌 확인·원자적 예약)
+        self.slug_index = get_slug_index(self.posts_dir)
+        
         # 설정값
         self.default_branch = 'main'
         self.commit_message_template = Config.GIT_COMMIT_MESSAGE_TEMPLATE or "feat: 새 블로그 글 발행 - {title}"
@@ -57,30 +62,19 @@ class RepoWriter:
             logger.error(f"Error initializing Git repository: {e}")
             raise
     
-    def generate_post_filename(self, title: str, date: Optional[datetime] = None) -> str:
-        """
-        Jekyll 블로그 포스트 파일명 생성
-        """
-        if not date:
-            date = datetime.now()
-        
-        date_str = date.strftime('%Y-%m-%d')
-        
-        from ..generators.seo_gen import SEOGenerator
-        seo_gen = SEOGenerator()
-        slug = seo_gen.generate_slug(title)
-        
-        filename = f"{date_str}-{slug}.md"
-        
-        logger.info(f"Generated filename: '{title}' -> '{filename}'")
-        return filename
-    
     def save_post(self, post_content: str, title: str, 
                   date: Optional[datetime] = None, 
                   category: str = 'general', tags: Optional[List[str]] = None) -> Path:
         """
         블로그 포스트를 Jekyll _posts 디렉터리에 저장
         """
+        # 호출자가 넘긴 값 (본문에 포함된 Front Matter보다 우선)
+        explicit_fields = {'title': title, 'categories': [category]}
+        if date:
+            explicit_fields['date'] = date.strftime('%Y-%m-%d %H:%M:%S +0900') # KST 기준
+        if tags is not None:
+            explicit_fields['tags'] = tags
+
         if not date:
             date = datetime.now()
 
@@ -90,27 +84,19 @@ class RepoWriter:
             'title': title,
             'date': date.strftime('%Y-%m-%d %H:%M:%S +0900'), # KST 기준
             'categories': [category],
-            'tags': tags if tags is not None else [],
+            'tags': [],
             'author': 'AutoBot'
         }
         
-        front_matter_str = yaml.dump(front_matter, allow_unicode=True, default_flow_style=False)
+        # 본문에 이미 Front Matter가 있으면(SEO 생성기 결과) 하나로 합침 - 기본값보다는 우선, 호출자 인자보다는 나중
+        existing_front_matter, body = split_post(post_content)
+        front_matter = {**front_matter, **existing_front_matter, **explicit_fields}
         
-        full_content = f"---\n{front_matter_str}---\n\n{post_content}"
+        full_content = render_post(front_matter, body)
 
         try:
-            filename = self.generate_post_filename(title, date)
-            file_path = self.posts_dir / filename
-            
-            if file_path.exists():
-                logger.warning(f"File already exists: {filename}")
-                timestamp = datetime.now().strftime('%H%M%S')
-                name_parts = filename.rsplit('.', 1)
-                filename = f"{name_parts[0]}-{timestamp}.{name_parts[1]}"
-                file_path = self.posts_dir / filename
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            # 같은 날짜·슬러그가 있으면 -2, -3 ... (임시 파일에 쓴 뒤 링크하므로 동시 발행·중단에도 빈 파일이 남지 않음)
+            file_path = self.slug_index.reserve(title, date, full_content)
             
             logger.info(f"Post saved successfully: {file_path}")
             return file_path
@@ -175,7 +161,8 @@ class RepoWriter:
             if push:
                 try:
                     origin = self.repo.remote('origin')
-                    push_info = origin.push(self.default_branch)
+                    # 네트워크 오류만 백오프 후 재시도 (인증 오류 등은 즉시 실패)
+                    push_info = get_retry_engine('git').call(origin.push, self.default_branch)
                     
                     if push_info:
                         result['pushed'] = True
@@ -222,6 +209,8 @@ class RepoWriter:
             logger.info(f"Starting post publication: {title}")
             file_path = self.save_post(post_content, title, date, category, tags)
             result['file_path'] = str(file_path)
+            self._update_keyword_stats(file_path)
+            self._update_post_index(file_path)
             
             commit_message = self.generate_commit_message(title, post_type, category, tags)
             
@@ -246,6 +235,24 @@ class RepoWriter:
             result['error'] = error_msg
             return result
     
+    def _update_keyword_stats(self, file_path: Path):
+        """발행된 글을 키워드 DF 통계에 반영 (실패해도 발행은 계속)"""
+        if file_path.parent.resolve() != Config.POSTS_DIR.resolve():
+            return
+        try:
+            from ..generators.keyword_engine import get_keyword_engine
+            get_keyword_engine().add_post(file_path)
+        except Exception as e:
+            logger.warning(f"Could not update keyword stats for {file_path.name}: {e}")
+    
+    def _update_post_index(self, file_path: Path):
+        """발행된 글을 중복 체크용 포스트 인덱스에 반영 (실패해도 발행은 계속)"""
+        try:
+            from ..utils.post_index import get_post_index
+            get_post_index(file_path.parent).update_post(file_path)
+        except Exception as e:
+            logger.warning(f"Could not update post index for {file_path.name}: {e}")
+    
     def get_repo_status(self) -> Dict[str, Any]:
         """
         저장소 상태 정보 반환
@@ -0,0 +1,232 @@
+"""
+리서치 아티팩트 저장소 모듈
+리서치 결과를 주제+소스 해시로 주소화하여 압축 저장하고, 네트워크 없이 재현(replay) 가능하게 함
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ..config import Config
+from ..utils.file_lock import FileLock
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 저장할 때마다 바뀌어 내용 비교에서 제외하는 리서치 필드
+VOLATILE_RESEARCH_FIELDS = ('research_timestamp',)
+
+
+class ResearchArtifactStore:
+    """내용 주소 기반(content-addressed) 리서치 번들 저장소"""
+
+    def __init__(self, root_dir: Optional[Path] = None):
+        """
+        ResearchArtifactStore 초기화
+
+        Args:
+            root_dir (Path, optional): 저장소 디렉터리. None이면 캐시 디렉터리 사용
+        """
+        self.root_dir = Path(root_dir or Config.CACHE_DIR / 'research_artifacts')
+        self.objects_dir = self.root_dir / 'objects'
+        self.index_file = self.root_dir / 'index.json'
+        # 여러 파이프라인 프로세스가 같은 저장소를 공유하므로 인덱스·번들 갱신은 파일 잠금으로 직렬화
+        self._lock = FileLock(self.root_dir / 'index.lock')
+
+    @staticmethod
+    def normalize_topic(topic: str) -> str:
+        """주제 정규화 (대소문자/공백 차이 무시)"""
+        return ' '.join(topic.lower().split())
+
+    @classmethod
+    def compute_key(cls, topic: str, sources: List[Dict[str, Any]]) -> str:
+        """
+        주제와 소스 목록으로 아티팩트 키 계산
+
+        Args:
+            topic (str): 리서치 주제
+            sources (List[Dict]): 리서치 소스 목록 (url 기준)
+
+        Returns:
+            str: SHA-256 16진수 키
+        """
+        source_ids = sorted(source.get('url') or source.get('title', '') for source in sources)
+        payload = json.dumps({'topic': cls.normalize_topic(topic), 'sources': source_ids},
+                             ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _object_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / f"{key}.json.gz"
+
+    def _load_index(self) -> Dict[str, List[Dict[str, str]]]:
+        try:
+            if self.index_file.exists():
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Error loading research artifact index: {e}")
+        return {}
+
+    @staticmethod
+    def _research_fingerprint(research: Dict[str, Any]) -> bytes:
+        """요약이 같은 내용에 대한 것인지 비교하기 위한 리서치 내용 직렬화 (수집 시각 제외)"""
+        content = {k: v for k, v in research.items() if k not in VOLATILE_RESEARCH_FIELDS}
+        return json.dumps(content, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """임시 파일에 쓴 뒤 교체하여 부분 기록 방지"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        tmp_path.replace(path)
+
+    def save(self, research_data: Dict[str, Any], summary: Optional[str] = None) -> Optional[str]:
+        """
+        리서치 번들 저장
+
+        Args:
+            research_data (Dict): ContentResearcher 결과
+            summary (str, optional): 프롬프트용 리서치 요약
+
+        Returns:
+            str: 아티팩트 키. 저장 실패 시 None
+        """
+        try:
+            topic = research_data.get('topic', '')
+            key = self.compute_key(topic, research_data.get('sources', []))
+            bundle = {
+                'key': key,
+                'topic': topic,
+                'research': {k: v for k, v in research_data.items() if k not in ('artifact_key', '_artifact_summary')},
+                'summary': summary,
+                'stored_at': datetime.now().isoformat()
+            }
+            with self._lock:
+                # 같은 키(주제+소스 URL)라도 소스 내용이 바뀌었으면 이전 요약은 버림 (내용이 같을 때만 유지)
+                if summary is None:
+                    existing = self.load(key)
+                    if (existing and existing.get('summary') and self._research_fingerprint(existing['research'])
+                            == self._research_fingerprint(bundle['research'])):
+                        bundle['summary'] = existing['summary']
+
+                raw = json.dumps(bundle, ensure_ascii=False, sort_keys=True).encode('utf-8')
+                # mtime=0으로 압축 결과를 내용에 대해 결정적으로 유지
+                self._write_atomic(self._object_path(key), gzip.compress(raw, mtime=0))
+
+                index = self._load_index()
+                entries = [e for e in index.get(self.normalize_topic(topic), []) if e['key'] != key]
+                entries.append({'key': key, 'stored_at': bundle['stored_at']})
+                index[self.normalize_topic(topic)] = entries
+                self._write_atomic(self.index_file, json.dumps(index, ensure_ascii=False, indent=1).encode('utf-8'))
+
+            logger.info(f"Stored research artifact {key[:12]} for '{topic}'")
+            return key
+
+        except Exception as e:
+            logger.warning(f"Error storing research artifact: {e}")
+            return None
+
+    def attach_summary(self, key: str, summary: str) -> bool:
+        """
+        요약이 없는 번들에만 프롬프트용 요약 기록 (이미 있으면 그대로 두어 재현 결과가 바뀌지 않게 함)
+
+        Args:
+            key (str): 아티팩트 키
+            summary (str): 프롬프트용 리서치 요약
+
+        Returns:
+            bool: 새로 기록했으면 True
+        """
+        try:
+            with self._lock:
+                bundle = self.load(key)
+                if not bundle or bundle.get('summary'):
+                    return False
+                bundle['summary'] = summary
+                raw = json.dumps(bundle, ensure_ascii=False, sort_keys=True).encode('utf-8')
+                self._write_atomic(self._object_path(key), gzip.compress(raw, mtime=0))
+            return True
+
+        except Exception as e:
+            logger.warning(f"Error storing research summary for {key[:12]}: {e}")
+            return False
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """키로 리서치 번들 로드"""
+        path = self._object_path(key)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, 'rb') as f:
+                return json.loads(f.read().decode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Error loading research artifact {key[:12]}: {e}")
+            return None
+
+    def latest_for_topic(self, topic: str) -> Optional[Dict[str, Any]]:
+        """주제에 대해 가장 최근에 저장된 리서치 번들 로드"""
+        with self._lock:
+            entries = self._load_index().get(self.normalize_topic(topic), [])
+        for entry in sorted(entries, key=lambda e: e['stored_at'], reverse=True):
+            bundle = self.load(entry['key'])
+            if bundle:
+                return bundle
+        return None
+
+    def list_topics(self) -> List[str]:
+        """저장된 주제 목록"""
+        with self._lock:
+            return sorted(self._load_index().keys())
+
+
+def test_artifact_store():
+    """ResearchArtifactStore 테스트 함수"""
+    import tempfile
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = ResearchArtifactStore(Path(tmp_dir))
+            research_data = {
+                'topic': 'Edge Computing',
+                'key_facts': ['Edge computing brings computation closer to data sources.'],
+                'recent_developments': [],
+                'sources': [{'type': 'wikipedia', 'title': 'Edge computing', 'url': 'https://en.wikipedia.org/wiki/Edge_computing'}]
+            }
+
+            key = store.save(research_data)
+            summary = "Key Facts:\n- Edge computing brings computation closer to data sources."
+            attached = store.attach_summary(key, summary)
+            overwritten = store.attach_summary(key, "changed summary")
+            replayed = store.latest_for_topic('edge  computing')
+
+            # 같은 소스로 다시 저장: 내용이 같으면 요약 유지, 바뀌었으면 버림
+            store.save(dict(research_data, research_timestamp='later'))
+            kept = store.load(key)['summary'] == summary
+            store.save(dict(research_data, key_facts=['Edge computing was updated.']))
+            dropped = store.load(key)['summary'] is None
+
+            print("Testing ResearchArtifactStore...")
+            print(f"  Key: {key[:16]}...")
+            print(f"  Same key for same inputs: {key == store.compute_key('EDGE computing', research_data['sources'])}")
+            print(f"  Replayed facts: {replayed['research']['key_facts']}")
+            print(f"  Replayed summary stored: {bool(replayed['summary'])}")
+            print(f"  Summary kept for same content: {kept}, dropped for changed content: {dropped}")
+
+            return (replayed['research']['key_facts'] == research_data['key_facts']
+                    and attached and not overwritten and replayed['summary'] == summary and kept and dropped)
+
+    except Exception as e:
+        print(f"ResearchArtifactStore test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_artifact_store()
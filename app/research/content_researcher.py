@@ -14,6 +14,13 @@ except ImportError:
     NewsApiClient = None
 
 from ..config import Config
+from ..utils.single_flight import get_flight_group
+from ..utils.client_registry import get_requests_session
+from ..utils.rate_limiter import get_request_limiter
+from ..utils.error_handler import get_retry_engine
+from .news_budget import NewsAPIBudget
+from .simhash import collapse_near_duplicates
+from .artifact_store import ResearchArtifactStore
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -22,34 +29,63 @@ logger = logging.getLogger(__name__)
 class ContentResearcher:
     """콘텐츠 리서치를 위한 정보 수집 클래스"""
     
-    def __init__(self):
-        """ContentResearcher 초기화"""
+    def __init__(self, replay: Optional[bool] = None):
+        """
+        ContentResearcher 초기화
+        
+        Args:
+            replay (bool, optional): True면 네트워크 대신 저장된 리서치 아티팩트를 재사용. None이면 설정값 사용
+        """
+        self.replay = Config.RESEARCH_REPLAY if replay is None else replay
+        self.artifact_store = ResearchArtifactStore()
+        
         # News API 초기화 (키가 있는 경우에만)
         self.news_client = None
         if NewsApiClient and Config.NEWS_API_KEY:
             try:
-                self.news_client = NewsApiClient(api_key=Config.NEWS_API_KEY)
+                self.news_client = NewsApiClient(api_key=Config.NEWS_API_KEY, session=get_requests_session('newsapi'))
                 logger.info("NewsAPI client initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize NewsAPI client: {e}")
         else:
             logger.info("NewsAPI not available (missing key or library)")
         
+        # NewsAPI 일일 할당량/결과 캐시
+        self.news_budget = NewsAPIBudget()
+        self.max_news_articles = 5
+        
         # Wikipedia 언어 설정
         wikipedia.set_lang("en")  # 영어로 설정 (더 많은 정보)
+        # wikipedia 라이브러리는 세션 주입을 지원하지 않아 모듈의 requests.get을 공유 세션으로 연결
+        wikipedia.wikipedia.requests = get_requests_session('wikipedia')
+        
+        # 동시 요청 병합 그룹 (프로세스 전역, 인스턴스 간 공유)
+        self._research_flight = get_flight_group('research', copy_results=True)
+        self._wiki_flight = get_flight_group('wikipedia')
+        self._http_retry = get_retry_engine('http')
         
         logger.info("ContentResearcher initialized successfully")
     
-    def research_topic(self, topic: str) -> Dict[str, Any]:
+    def research_topic(self, topic: str, priority: Optional[float] = None) -> Dict[str, Any]:
         """
         주제에 대한 종합적인 리서치 수행
+        동일 주제의 리서치가 이미 진행 중이면 새로 요청하지 않고 그 결과를 공유
         
         Args:
             topic (str): 리서치할 주제
+            priority (float, optional): 아이디어 점수. NewsAPI 할당량이 빠듯할 때 우선순위로 사용
             
         Returns:
             Dict: 리서치 결과 데이터
         """
+        flight_key = ' '.join(topic.lower().split())
+        return self._research_flight.do(flight_key, self._research_topic, topic, priority)
+    
+    def _research_topic(self, topic: str, priority: Optional[float] = None) -> Dict[str, Any]:
+        """실제 리서치 수행 (병합되지 않은 단일 호출)"""
+        if self.replay:
+            return self._replay_research(topic)
+        
         logger.info(f"Starting research for topic: {topic}")
         
         research_data = {
@@ -70,7 +106,7 @@ class ContentResearcher:
             research_data['sources'].extend(wiki_data.get('sources', []))
             
             # 2. News API에서 최신 동향 수집
-            news_data = self._research_news(topic)
+            news_data = self._research_news(topic, priority)
             research_data['recent_developments'].extend(news_data.get('articles', []))
             research_data['sources'].extend(news_data.get('sources', []))
             
@@ -82,6 +118,35 @@ class ContentResearcher:
         except Exception as e:
             logger.error(f"Error during research for '{topic}': {e}")
         
+        # 재현 가능한 생성을 위해 리서치 번들 저장
+        if Config.RESEARCH_ARTIFACTS_ENABLED and (research_data['key_facts'] or research_data['recent_developments']):
+            artifact_key = self.artifact_store.save(research_data)
+            if artifact_key:
+                research_data['artifact_key'] = artifact_key
+        
+        return research_data
+    
+    def _replay_research(self, topic: str) -> Dict[str, Any]:
+        """저장된 리서치 아티팩트로 네트워크 없이 리서치 결과 재현"""
+        bundle = self.artifact_store.latest_for_topic(topic)
+        if not bundle:
+            logger.warning(f"No stored research artifact for '{topic}' (replay mode)")
+            return {
+                'topic': topic,
+                'key_facts': [],
+                'recent_developments': [],
+                'statistics': [],
+                'related_terms': [],
+                'sources': [],
+                'research_timestamp': datetime.now().isoformat()
+            }
+        
+        logger.info(f"Replaying research artifact {bundle['key'][:12]} for '{topic}'")
+        research_data = bundle['research']
+        research_data['artifact_key'] = bundle['key']
+        if bundle.get('summary'):
+            # 저장 당시 프롬프트에 쓴 요약을 그대로 재사용 (요약 로직이 바뀌어도 같은 프롬프트)
+            research_data['_artifact_summary'] = bundle['summary']
         return research_data
     
     def _research_wikipedia(self, topic: str) -> Dict[str, Any]:
@@ -96,7 +161,8 @@ class ContentResearcher:
             logger.info(f"Researching Wikipedia for: {topic}")
             
             # Wikipedia 검색
-            search_results = wikipedia.search(topic, results=3)
+            search_results = self._wiki_flight.do(('search', topic.lower()), self._http_retry.call,
+                                                 wikipedia.search, topic, results=3)
             
             if not search_results:
                 logger.warning(f"No Wikipedia results found for: {topic}")
@@ -104,7 +170,7 @@ class ContentResearcher:
             
             # 첫 번째 결과에서 정보 추출
             page_title = search_results[0]
-            page = wikipedia.page(page_title)
+            page = self._fetch_wikipedia_page(page_title)
             
             # 요약 정보 추출 (첫 3 문장)
             summary_sentences = page.summary.split('. ')[:3]
@@ -128,7 +194,7 @@ class ContentResearcher:
             # 모호한 검색어인 경우 첫 번째 옵션 사용
             logger.warning(f"Disambiguation for '{topic}', using first option")
             try:
-                page = wikipedia.page(e.options[0])
+                page = self._fetch_wikipedia_page(e.options[0])
                 summary_sentences = page.summary.split('. ')[:2]
                 for sentence in summary_sentences:
                     if sentence.strip() and len(sentence) > 20:
@@ -150,59 +216,95 @@ class ContentResearcher:
         
         return wiki_data
     
-    def _research_news(self, topic: str) -> Dict[str, Any]:
-        """News API에서 최신 뉴스 수집"""
+    def _fetch_wikipedia_page(self, page_title: str):
+        """Wikipedia 페이지 조회 (동일 페이지 동시 요청은 하나로 병합)"""
+        return self._wiki_flight.do(('page', page_title), self._http_retry.call, wikipedia.page, page_title)
+    
+    def _research_news(self, topic: str, priority: Optional[float] = None) -> Dict[str, Any]:
+        """News API에서 최신 뉴스 수집 (일일 할당량 및 캐시 고려)"""
         news_data = {
             'articles': [],
             'sources': []
         }
         
+        # 캐시된 결과가 있으면 할당량을 쓰지 않고 재사용
+        articles = self.news_budget.get_cached(topic)
+        if articles is not None:
+            logger.info(f"Using cached news results for: {topic}")
+            return self._parse_news_articles(articles, news_data)
+        
         if not self.news_client:
             logger.info("News API not available, skipping news research")
             return news_data
         
+        if not self.news_budget.try_acquire(priority):
+            # 할당량이 부족하면 만료된 캐시라도 사용, 없으면 뉴스 없이 진행
+            articles = self.news_budget.get_cached(topic, allow_stale=True)
+            if articles is not None:
+                logger.info(f"NewsAPI budget unavailable, using stale cached news for: {topic}")
+                return self._parse_news_articles(articles, news_data)
+            logger.info(f"NewsAPI budget unavailable, continuing without news for: {topic}")
+            return news_data
+        
         try:
             logger.info(f"Researching news for: {topic}")
+            get_request_limiter('newsapi', Config.NEWS_API_RPM).acquire()
             
-            # 최근 30일간 뉴스 검색
-            articles = self.news_client.get_everything(
+            # 최근 30일간 뉴스 검색 (네트워크 오류만 재시도, NewsAPI 에러 응답은 재시도하지 않음)
+            articles = self._http_retry.call(
+                self.news_client.get_everything,
                 q=topic,
                 language='en',
                 sort_by='publishedAt',
-                page_size=5,  # 최대 5개 기사
+                page_size=self.max_news_articles * 2,  # 중복 병합 후 최대 5개 기사
                 from_param=(datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
             )
             
-            if articles['status'] == 'ok' and articles['articles']:
-                for article in articles['articles']:
-                    if article['title'] and article['description']:
-                        news_item = {
-                            'title': article['title'],
-                            'description': article['description'][:200] + '...' if len(article['description']) > 200 else article['description'],
-                            'source': article['source']['name'],
-                            'url': article['url'],
-                            'published_at': article['publishedAt']
-                        }
-                        news_data['articles'].append(news_item)
-                        
-                        # 소스 정보 추가
-                        source_info = {
-                            'type': 'news',
-                            'title': article['title'],
-                            'url': article['url'],
-                            'source': article['source']['name']
-                        }
-                        news_data['sources'].append(source_info)
-                
-                logger.info(f"News research successful: {len(news_data['articles'])} articles collected")
-            else:
-                logger.warning(f"No news articles found for: {topic}")
+            if articles.get('status') == 'ok':
+                self.news_budget.store(topic, articles)
+            
+            self._parse_news_articles(articles, news_data)
                 
         except Exception as e:
+            if self.news_budget.is_quota_error(e):
+                self.news_budget.mark_exhausted()
             logger.error(f"News research error for '{topic}': {e}")
         
         return news_data
     
+    def _parse_news_articles(self, articles: Dict[str, Any], news_data: Dict[str, Any]) -> Dict[str, Any]:
+        """NewsAPI 응답을 리서치 데이터 형식으로 변환 (여러 매체의 동일 기사는 하나로 병합)"""
+        if articles.get('status') == 'ok' and articles.get('articles'):
+            news_items = []
+            for article in articles['articles']:
+                if article['title'] and article['description']:
+                    news_items.append({
+                        'title': article['title'],
+                        'description': article['description'][:200] + '...' if len(article['description']) > 200 else article['description'],
+                        'source': article['source']['name'],
+                        'url': article['url'],
+                        'published_at': article['publishedAt']
+                    })
+            
+            # 신디케이트된 동일 기사 병합 후 상위 기사만 사용
+            for news_item in collapse_near_duplicates(news_items)[:self.max_news_articles]:
+                news_data['articles'].append(news_item)
+                
+                # 소스 정보 추가
+                source_info = {
+                    'type': 'news',
+                    'title': news_item['title'],
+                    'url': news_item['url'],
+                    'source': ', '.join(news_item['sources'])
+                }
+                news_data['sources'].append(source_info)
+            
+            logger.info(f"News research successful: {len(news_data['articles'])} articles collected")
+        else:
+            logger.warning("No news articles found")
+        
+        return news_data
+    
     def _collect_statistics(self, topic: str) -> List[Dict[str, Any]]:
         """통계 데이터 수집 (향후 구현)"""
         # 향후 구현: 웹 스크래핑, API 등을 통한 통계 데이터 수집
@@ -220,7 +322,7 @@ class ContentResearcher:
         if research_data.get('recent_developments'):
             summary_parts.append("\nRecent News:")
             for article in research_data['recent_developments'][:2]:  # 상위 2개만
-                summary_parts.append(f"• {article['title']} ({article['source']})")
+                summary_parts.append(f"• {article['title']} ({', '.join(article.get('sources') or [article['source']])})")
         
         if research_data.get('sources'):
             source_names = [s.get('source', s.get('title', 'Unknown')) for s in research_data['sources'][:3]]
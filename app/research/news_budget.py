@@ -0,0 +1,216 @@
+"""
+NewsAPI 할당량 관리 모듈
+일일 요청 사용량을 파일에 기록하고 검색 결과를 캐시하여 무료 플랜 한도 내에서 운영
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..config import Config
+from ..utils.file_lock import FileLock
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 할당량 소진을 의미하는 NewsAPI 에러 코드
+QUOTA_ERROR_CODES = {'rateLimited', 'apiKeyExhausted', 'maximumResultsReached'}
+
+
+class NewsAPIBudget:
+    """NewsAPI 일일 할당량 추적 및 결과 캐시"""
+
+    def __init__(self, state_file: Optional[Path] = None, daily_quota: Optional[int] = None,
+                 cache_ttl_hours: Optional[float] = None, priority_threshold: Optional[int] = None,
+                 reserve_ratio: float = 0.3):
+        """
+        NewsAPIBudget 초기화
+
+        Args:
+            state_file (Path, optional): 사용량/캐시 저장 파일. None이면 캐시 디렉터리 사용
+            daily_quota (int, optional): 하루 최대 요청 수
+            cache_ttl_hours (float, optional): 캐시 유효 시간
+            priority_threshold (int, optional): 할당량이 빠듯할 때 요청을 허용할 최소 아이디어 점수
+            reserve_ratio (float): 남은 할당량이 이 비율 이하이면 빠듯한 상태로 판단
+        """
+        self.state_file = Path(state_file or Config.CACHE_DIR / 'newsapi_budget.json')
+        self.daily_quota = daily_quota if daily_quota is not None else Config.NEWS_API_DAILY_QUOTA
+        self.cache_ttl = timedelta(hours=cache_ttl_hours if cache_ttl_hours is not None else Config.NEWS_API_CACHE_TTL_HOURS)
+        self.priority_threshold = priority_threshold if priority_threshold is not None else Config.NEWS_API_PRIORITY_THRESHOLD
+        self.reserve = int(self.daily_quota * reserve_ratio)
+
+        # 여러 프로세스가 같은 상태 파일을 쓰므로 변경 시에는 파일 잠금 후 다시 읽어서 갱신
+        self._lock = FileLock(self.state_file.with_suffix('.lock'))
+        self._state = self._load_state()
+
+        logger.info(f"NewsAPIBudget initialized - used {self._state['used']}/{self.daily_quota} today")
+
+    @staticmethod
+    def _today() -> str:
+        """NewsAPI 할당량 기준 날짜 (UTC)"""
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+    def _empty_state(self, cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {'date': self._today(), 'used': 0, 'exhausted': False, 'cache': cache or {}}
+
+    def _load_state(self) -> Dict[str, Any]:
+        """저장된 상태 로드 (날짜가 바뀌었으면 사용량 초기화, 캐시는 유지)"""
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get('date') != self._today():
+                    return self._empty_state(state.get('cache'))
+                state.setdefault('cache', {})
+                return state
+        except Exception as e:
+            logger.warning(f"Error loading NewsAPI budget state: {e}")
+        return self._empty_state()
+
+    def _save_state(self):
+        """상태 저장 (만료된 지 오래된 캐시 항목은 정리)"""
+        try:
+            stale_cutoff = datetime.now(timezone.utc) - self.cache_ttl * 4
+            self._state['cache'] = {
+                key: entry for key, entry in self._state['cache'].items()
+                if datetime.fromisoformat(entry['fetched_at']) >= stale_cutoff
+            }
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, ensure_ascii=False)
+            tmp_file.replace(self.state_file)
+        except Exception as e:
+            logger.warning(f"Error saving NewsAPI budget state: {e}")
+
+    def _roll_over(self):
+        """최신 상태를 다시 읽고, 날짜가 바뀌었으면 사용량 초기화 (잠금 상태에서 호출)"""
+        self._state = self._load_state()
+
+    @staticmethod
+    def make_key(query: str) -> str:
+        """검색어 캐시 키"""
+        return ' '.join(query.lower().split())
+
+    @property
+    def remaining(self) -> int:
+        """오늘 남은 요청 수"""
+        with self._lock:
+            self._roll_over()
+            if self._state['exhausted']:
+                return 0
+            return max(0, self.daily_quota - self._state['used'])
+
+    def get_cached(self, query: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 검색 결과 조회
+
+        Args:
+            query (str): 검색어
+            allow_stale (bool): True면 TTL이 지난 결과도 반환
+
+        Returns:
+            Dict: 캐시된 NewsAPI 응답. 없으면 None
+        """
+        with self._lock:
+            self._roll_over()
+            entry = self._state['cache'].get(self.make_key(query))
+        if not entry:
+            return None
+
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(entry['fetched_at'])
+        if age <= self.cache_ttl or allow_stale:
+            return entry['response']
+        return None
+
+    def try_acquire(self, priority: Optional[float] = None) -> bool:
+        """
+        요청 1회분의 할당량 확보 시도
+
+        Args:
+            priority (float, optional): 아이디어 점수. 할당량이 빠듯하면 높은 점수만 허용
+
+        Returns:
+            bool: True면 요청 가능 (사용량에 반영됨)
+        """
+        with self._lock:
+            self._roll_over()
+            remaining = 0 if self._state['exhausted'] else self.daily_quota - self._state['used']
+
+            if remaining <= 0:
+                logger.warning("NewsAPI daily quota exhausted")
+                return False
+
+            if remaining <= self.reserve and (priority is None or priority < self.priority_threshold):
+                logger.info(f"NewsAPI quota tight ({remaining} left), skipping low-priority request (priority={priority})")
+                return False
+
+            self._state['used'] += 1
+            self._save_state()
+            return True
+
+    def store(self, query: str, response: Dict[str, Any]):
+        """검색 결과 캐시에 저장"""
+        with self._lock:
+            self._roll_over()
+            self._state['cache'][self.make_key(query)] = {
+                'fetched_at': datetime.now(timezone.utc).isoformat(),
+                'response': response
+            }
+            self._save_state()
+
+    def mark_exhausted(self):
+        """서버가 할당량 소진을 알린 경우 오늘은 더 요청하지 않도록 표시"""
+        with self._lock:
+            self._roll_over()
+            self._state['exhausted'] = True
+            self._save_state()
+        logger.warning("NewsAPI reported quota exhaustion - news research disabled until tomorrow (UTC)")
+
+    @staticmethod
+    def is_quota_error(error: Exception) -> bool:
+        """할당량 소진 에러 여부"""
+        get_code = getattr(error, 'get_code', None)
+        if callable(get_code):
+            try:
+                return get_code() in QUOTA_ERROR_CODES
+            except Exception:
+                return False
+        return '429' in str(error) or 'rateLimited' in str(error)
+
+
+def test_news_budget():
+    """NewsAPIBudget 테스트 함수"""
+    import tempfile
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            budget = NewsAPIBudget(state_file=Path(tmp_dir) / 'budget.json', daily_quota=4,
+                                   cache_ttl_hours=1, priority_threshold=80, reserve_ratio=0.5)
+
+            print("Testing NewsAPIBudget...")
+            print(f"  Acquire (low priority, plenty left): {budget.try_acquire(50)}")
+            print(f"  Acquire (low priority, plenty left): {budget.try_acquire(50)}")
+            print(f"  Acquire (low priority, tight): {budget.try_acquire(50)} (expected False)")
+            print(f"  Acquire (high priority, tight): {budget.try_acquire(90)} (expected True)")
+
+            budget.store("AI Trends", {'status': 'ok', 'articles': []})
+            print(f"  Cached lookup: {budget.get_cached('ai  trends') is not None}")
+
+            # 새 인스턴스에서도 사용량이 유지되는지 확인
+            reloaded = NewsAPIBudget(state_file=Path(tmp_dir) / 'budget.json', daily_quota=4)
+            print(f"  Persisted remaining: {reloaded.remaining} (expected 1)")
+
+            return reloaded.remaining == 1
+
+    except Exception as e:
+        print(f"NewsAPIBudget test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_news_budget()
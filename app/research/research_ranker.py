@@ -0,0 +1,228 @@
+"""
+리서치 스니펫 랭킹 모듈
+BM25로 주제와의 관련도를 계산하여 토큰 예산 안에 가장 관련성 높은 정보만 담기
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Any, Optional
+
+from ..config import Config
+from ..utils.token_counter import count_tokens
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'is', 'are', 'was', 'were', 'be', 'been', 'it', 'its', 'as', 'from', 'that',
+    'this', 'these', 'those', 'has', 'have', 'had', 'will', 'can', 'how', 'what', 'why'
+}
+
+# 섹션 출력 순서와 제목
+SECTION_HEADERS = [
+    ('fact', "Key Facts:"),
+    ('news', "Recent Developments:"),
+    ('term', "Related Terms:"),
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """BM25용 토큰화 (소문자, 불용어 제거)"""
+    words = re.findall(r'[a-z0-9]+|[가-힣]+', text.lower())
+    return [word for word in words if word not in STOP_WORDS and len(word) > 1]
+
+
+class BM25:
+    """Okapi BM25 점수 계산기"""
+
+    def __init__(self, documents: List[List[str]], k1: float = 1.5, b: float = 0.75):
+        """
+        BM25 초기화
+
+        Args:
+            documents (List[List[str]]): 토큰화된 문서 목록
+            k1 (float): 단어 빈도 포화 계수
+            b (float): 문서 길이 정규화 계수
+        """
+        self.k1 = k1
+        self.b = b
+        self.doc_freqs = [Counter(doc) for doc in documents]
+        self.doc_lengths = [len(doc) for doc in documents]
+        self.avg_length = (sum(self.doc_lengths) / len(documents)) if documents else 0.0
+
+        document_frequency = Counter()
+        for doc in documents:
+            document_frequency.update(set(doc))
+
+        n_docs = len(documents)
+        self.idf = {
+            term: math.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+            for term, df in document_frequency.items()
+        }
+
+    def score(self, query: List[str]) -> List[float]:
+        """질의에 대한 각 문서의 BM25 점수"""
+        scores = []
+        for freqs, length in zip(self.doc_freqs, self.doc_lengths):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * length / self.avg_length) if self.avg_length else self.k1
+            for term in query:
+                tf = freqs.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+
+class ResearchRanker:
+    """리서치 데이터를 주제 관련도 순으로 정렬하고 토큰 예산에 맞춰 압축"""
+
+    def __init__(self, token_budget: Optional[int] = None):
+        """
+        ResearchRanker 초기화
+
+        Args:
+            token_budget (int, optional): 요약에 사용할 최대 토큰 수
+        """
+        self.token_budget = token_budget or Config.RESEARCH_TOKEN_BUDGET
+
+    def _collect_snippets(self, research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """리서치 데이터에서 점수화할 스니펫 목록 생성"""
+        snippets = []
+
+        for fact in research_data.get('key_facts', []):
+            snippets.append({'kind': 'fact', 'text': fact, 'line': f"- {fact}"})
+
+        for dev in research_data.get('recent_developments', []):
+            title = dev.get('title', 'N/A')
+            source = ', '.join(dev.get('sources') or [dev.get('source', 'N/A')])
+            snippets.append({
+                'kind': 'news',
+                'text': f"{title} {dev.get('description', '')}",
+                'line': f"- {title} (Source: {source})"
+            })
+
+        for term in research_data.get('related_terms', []):
+            snippets.append({'kind': 'term', 'text': term, 'line': term})
+
+        return snippets
+
+    def rank(self, topic: str, research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        스니펫을 BM25 점수 내림차순으로 정렬
+
+        Args:
+            topic (str): 리서치 주제 (질의)
+            research_data (Dict): ContentResearcher 결과
+
+        Returns:
+            List[Dict]: 점수가 포함된 스니펫 목록
+        """
+        snippets = self._collect_snippets(research_data)
+        if not snippets:
+            return []
+
+        bm25 = BM25([tokenize(snippet['text']) for snippet in snippets])
+        scores = bm25.score(tokenize(topic))
+
+        for position, (snippet, score) in enumerate(zip(snippets, scores)):
+            snippet['score'] = score
+            snippet['position'] = position
+
+        # 동점이면 원래 순서 유지
+        return sorted(snippets, key=lambda s: (-s['score'], s['position']))
+
+    def pack(self, topic: str, research_data: Dict[str, Any], token_budget: Optional[int] = None) -> str:
+        """
+        관련도가 높은 스니펫부터 토큰 예산 안에서 선택하여 요약 텍스트 생성
+
+        Args:
+            topic (str): 리서치 주제
+            research_data (Dict): ContentResearcher 결과
+            token_budget (int, optional): 이번 호출의 토큰 예산
+
+        Returns:
+            str: 섹션별로 정리된 요약 텍스트
+        """
+        budget = token_budget or self.token_budget
+        ranked = self.rank(topic, research_data)
+
+        selected = {kind: [] for kind, _ in SECTION_HEADERS}
+        used_tokens = 0
+        skipped = 0
+
+        # 주제와 겹치는 스니펫이 하나도 없으면 (예: 한글 주제) 관련도 필터 없이 원래 순서로 채움
+        require_match = any(snippet['score'] > 0 for snippet in ranked)
+
+        for snippet in ranked:
+            # 관련 용어는 항상, 나머지는 일치하는 스니펫이 있을 때만 관련도 0인 항목 제외
+            if snippet['score'] <= 0 and (require_match or snippet['kind'] == 'term'):
+                skipped += 1
+                continue
+
+            cost = max(1, count_tokens(snippet['line']))
+            if used_tokens + cost > budget:
+                skipped += 1
+                continue
+
+            selected[snippet['kind']].append(snippet)
+            used_tokens += cost
+
+        summary_parts = []
+        for kind, header in SECTION_HEADERS:
+            items = selected[kind]
+            if not items:
+                continue
+            if summary_parts:
+                header = "\n" + header
+            if kind == 'term':
+                summary_parts.append(f"{header} {', '.join(item['line'] for item in items)}")
+            else:
+                summary_parts.append(header)
+                summary_parts.extend(item['line'] for item in items)
+
+        logger.info(f"Packed research for '{topic}': {len(ranked) - skipped}/{len(ranked)} snippets, ~{used_tokens}/{budget} tokens")
+        return "\n".join(summary_parts)
+
+
+def test_research_ranker():
+    """ResearchRanker 테스트 함수"""
+    try:
+        research_data = {
+            'key_facts': [
+                "Quantum computing uses qubits that can represent multiple states at once.",
+                "The city hosts an annual jazz festival every summer.",
+                "Error correction remains the main obstacle for practical quantum computers."
+            ],
+            'recent_developments': [
+                {'title': "New quantum chip reaches 1,000 qubits", 'description': "A milestone for quantum hardware.", 'source': 'TechNews'},
+                {'title': "Stock markets close higher", 'description': "Investors cheered earnings.", 'source': 'Finance Daily'}
+            ],
+            'related_terms': ['Qubit', 'Quantum entanglement', 'Jazz']
+        }
+
+        ranker = ResearchRanker(token_budget=60)
+        ranked = ranker.rank("Quantum Computing", research_data)
+
+        print("Testing ResearchRanker...")
+        for snippet in ranked:
+            print(f"  {snippet['score']:.2f} [{snippet['kind']}] {snippet['text'][:60]}")
+
+        packed = ranker.pack("Quantum Computing", research_data)
+        print("\n--- Packed Summary ---")
+        print(packed)
+
+        return 'jazz festival' not in packed
+
+    except Exception as e:
+        print(f"ResearchRanker test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_research_ranker()
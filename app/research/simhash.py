@@ -0,0 +1,130 @@
+"""
+SimHash 기반 유사 문서 병합 모듈
+여러 매체에 배포된 거의 동일한 뉴스 기사를 하나의 대표 기사로 묶기
+"""
+
+import hashlib
+import logging
+import re
+from typing import Dict, List, Any
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+
+
+def _shingles(text: str, size: int = 3) -> List[str]:
+    """문자 단위 shingle 생성 (구두점/공백 정규화 후)"""
+    normalized = ' '.join(re.findall(r'\w+', text.lower()))
+    if len(normalized) <= size:
+        return [normalized] if normalized else []
+    return [normalized[i:i + size] for i in range(len(normalized) - size + 1)]
+
+
+def simhash(text: str, bits: int = SIMHASH_BITS) -> int:
+    """
+    텍스트의 SimHash 지문 계산
+
+    Args:
+        text (str): 입력 텍스트
+        bits (int): 지문 비트 수
+
+    Returns:
+        int: SimHash 값
+    """
+    weights = [0] * bits
+    for shingle in _shingles(text):
+        digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=bits // 8).digest()
+        value = int.from_bytes(digest, 'big')
+        for bit in range(bits):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit in range(bits):
+        if weights[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문 간 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+def collapse_near_duplicates(articles: List[Dict[str, Any]], max_distance: int = 8) -> List[Dict[str, Any]]:
+    """
+    거의 동일한 기사들을 클러스터로 묶고 클러스터별 대표 기사만 반환
+
+    대표 기사는 클러스터에서 처음 등장한 기사(NewsAPI는 최신순 정렬)이며,
+    'sources' 필드에 같은 기사를 게재한 매체 목록이 기록된다.
+
+    Args:
+        articles (List[Dict]): 'title', 'description', 'source' 키를 가진 기사 목록
+        max_distance (int): 같은 클러스터로 판단할 최대 해밍 거리
+
+    Returns:
+        List[Dict]: 대표 기사 목록
+    """
+    representatives = []
+    fingerprints = []
+
+    for article in articles:
+        fingerprint = simhash(f"{article.get('title', '')} {article.get('description', '')}")
+        source = article.get('source')
+
+        for index, existing in enumerate(fingerprints):
+            if hamming_distance(fingerprint, existing) <= max_distance:
+                cluster = representatives[index]
+                if source and source not in cluster['sources']:
+                    cluster['sources'].append(source)
+                cluster['duplicate_count'] += 1
+                break
+        else:
+            representative = dict(article)
+            representative['sources'] = [source] if source else []
+            representative['duplicate_count'] = 0
+            representatives.append(representative)
+            fingerprints.append(fingerprint)
+
+    if len(representatives) < len(articles):
+        logger.info(f"Collapsed {len(articles)} articles into {len(representatives)} unique stories")
+
+    return representatives
+
+
+def test_simhash():
+    """SimHash 병합 테스트 함수"""
+    try:
+        articles = [
+            {'title': "OpenAI releases new reasoning model for developers",
+             'description': "The company said the model is available today through its API for all paying developers.",
+             'source': 'The Verge'},
+            {'title': "OpenAI releases new reasoning model for developers",
+             'description': "The company said the model is available today via its API for all paying developers.",
+             'source': 'Engadget'},
+            {'title': "OpenAI releases a new reasoning model for developers",
+             'description': "The company said the model is available today through its API for paying developers.",
+             'source': 'Yahoo News'},
+            {'title': "Apple unveils redesigned MacBook Air with M4 chip",
+             'description': "The new laptop ships next week with longer battery life.",
+             'source': 'Wired'},
+        ]
+
+        collapsed = collapse_near_duplicates(articles)
+
+        print("Testing SimHash collapse...")
+        for article in collapsed:
+            print(f"  {article['title']} <- {article['sources']}")
+
+        return len(collapsed) == 2
+
+    except Exception as e:
+        print(f"SimHash test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_simhash()
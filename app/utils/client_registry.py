@@ -0,0 +1,118 @@
+"""
+공유 클라이언트 레지스트리 모듈
+OpenAI/HTTP 클라이언트를 프로세스 전역에서 한 번만 생성하여 커넥션 풀(keep-alive)을 재사용
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 커넥션 풀 설정
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+OPENAI_TIMEOUT = 120.0
+USER_AGENT = "AutoBlog-Pipe/1.0 (+https://github.com/grayson1999/AutoBlog-Pipe)"
+
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    이름으로 공유 클라이언트 조회 (없으면 factory로 한 번만 생성)
+
+    Args:
+        name (str): 클라이언트 이름
+        factory (Callable): 클라이언트 생성 함수
+
+    Returns:
+        Any: 공유 클라이언트 인스턴스
+    """
+    client = _clients.get(name)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = factory()
+            _clients[name] = client
+            logger.info(f"[CLIENTS] Created shared client: {name}")
+        return client
+
+
+def get_openai_client(api_key: str) -> Any:
+    """API 키별 공유 OpenAI 클라이언트 (httpx 커넥션 풀 재사용)"""
+    from openai import OpenAI, DefaultHttpxClient
+    import httpx
+
+    def factory():
+        http_client = DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_CONNECTIONS),
+            timeout=OPENAI_TIMEOUT
+        )
+        # SDK 내장 재시도는 끄고 공용 재시도 엔진에 맡김 (재시도 중첩 방지)
+        return OpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+
+    key_id = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:12]
+    return get_client(f"openai:{key_id}", factory)
+
+
+def create_pooled_session(max_retries: Any = 0) -> requests.Session:
+    """커넥션 풀이 설정된 requests 세션 생성"""
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=max_retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_requests_session(name: str) -> requests.Session:
+    """용도별 공유 requests 세션 (feeds, wikipedia, newsapi 등)"""
+    return get_client(f"requests:{name}", create_pooled_session)
+
+
+def close_all():
+    """모든 공유 클라이언트 종료 (프로세스 종료 시)"""
+    with _clients_lock:
+        for name, client in list(_clients.items()):
+            close = getattr(client, 'close', None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"[CLIENTS] Error closing {name}: {e}")
+        _clients.clear()
+
+
+def test_client_registry():
+    """클라이언트 레지스트리 테스트 함수"""
+    try:
+        first = get_requests_session('test')
+        second = get_requests_session('test')
+        other = get_requests_session('other')
+
+        print("Testing client registry...")
+        print(f"  Same session reused: {first is second}")
+        print(f"  Separate session per name: {first is not other}")
+
+        close_all()
+        return first is second and first is not other
+
+    except Exception as e:
+        print(f"Client registry test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_client_registry()
@@ -4,14 +4,12 @@
 """
 
 import logging
-import difflib
 from pathlib import Path
 from typing import List, Dict, Any
-import yaml
-import re
 from datetime import datetime, timedelta
 
 from ..config import Config
+from .post_index import extract_title_keywords, get_post_index
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -52,17 +50,15 @@ class ContentDeduplicator:
                 logger.info("No existing posts found - proceeding with publication")
                 return False
             
-            # 제목 유사도 체크
-            for post in published_posts:
-                existing_title = post.get('title', '')
-                similarity = self._calculate_similarity(new_title, existing_title)
-                
-                if similarity >= self.similarity_threshold:
-                    logger.warning(f"Duplicate detected! '{new_title}' is {similarity:.2%} similar to '{existing_title}'")
-                    return True
+            # 제목 유사도 체크 (길이·문자 빈도 상한으로 후보를 줄인 뒤 정확히 계산)
+            match = get_post_index(self.posts_dir).similar_title(new_title, self.similarity_threshold)
+            if match is not None:
+                existing_post, similarity = match
+                logger.warning(f"Duplicate detected! '{new_title}' is {similarity:.2%} similar to '{existing_post['title']}'")
+                return True
             
             # 키워드 기반 중복 체크
-            if self._check_keyword_overlap(new_title, published_posts):
+            if self._check_keyword_overlap(new_title):
                 logger.warning(f"High keyword overlap detected for: '{new_title}'")
                 return True
             
@@ -75,7 +71,7 @@ class ContentDeduplicator:
             return False
     
     def _load_published_posts(self) -> List[Dict[str, Any]]:
-        """기존 발행 글 목록을 로드"""
+        """기존 발행 글 목록을 로드 (영속 포스트 인덱스에서 증분 갱신)"""
         posts = []
         
         try:
@@ -83,22 +79,7 @@ class ContentDeduplicator:
                 logger.info("Posts directory doesn't exist yet")
                 return posts
             
-            # Jekyll _posts 디렉터리에서 모든 .md 파일 읽기
-            for post_file in self.posts_dir.glob("*.md"):
-                try:
-                    with open(post_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Front matter 파싱
-                    front_matter = self._extract_front_matter(content)
-                    if front_matter:
-                        front_matter['filename'] = post_file.name
-                        posts.append(front_matter)
-                        
-                except Exception as e:
-                    logger.warning(f"Error reading post file {post_file}: {e}")
-                    continue
-            
+            posts = get_post_index(self.posts_dir).posts()
             logger.info(f"Loaded {len(posts)} existing posts")
             
         except Exception as e:
@@ -106,73 +87,20 @@ class ContentDeduplicator:
         
         return posts
     
-    def _extract_front_matter(self, content: str) -> Dict[str, Any]:
-        """마크다운 파일에서 Front Matter 추출"""
-        try:
-            # Front matter 구분자 찾기
-            if not content.startswith('---\n'):
-                return {}
-            
-            # 두 번째 --- 찾기
-            end_marker = content.find('\n---\n', 4)
-            if end_marker == -1:
-                return {}
-            
-            # YAML 파싱
-            yaml_content = content[4:end_marker]
-            front_matter = yaml.safe_load(yaml_content)
-            
-            return front_matter or {}
-            
-        except Exception as e:
-            logger.warning(f"Error extracting front matter: {e}")
-            return {}
-    
-    def _calculate_similarity(self, title1: str, title2: str) -> float:
-        """두 제목 간 유사도 계산"""
-        try:
-            # 정규화: 소문자 변환, 특수문자 제거
-            def normalize(text):
-                text = text.lower()
-                text = re.sub(r'[^\w\s]', '', text)
-                text = re.sub(r'\s+', ' ', text).strip()
-                return text
-            
-            norm_title1 = normalize(title1)
-            norm_title2 = normalize(title2)
-            
-            # 완전 동일한 경우
-            if norm_title1 == norm_title2:
-                return 1.0
-            
-            # SequenceMatcher를 사용한 유사도 계산
-            similarity = difflib.SequenceMatcher(None, norm_title1, norm_title2).ratio()
-            
-            return similarity
-            
-        except Exception as e:
-            logger.warning(f"Error calculating similarity: {e}")
-            return 0.0
-    
-    def _check_keyword_overlap(self, new_title: str, published_posts: List[Dict]) -> bool:
-        """키워드 중복 체크"""
+    def _check_keyword_overlap(self, new_title: str) -> bool:
+        """키워드 중복 체크 (역색인으로 키워드가 하나 이상 겹치는 글만 비교)"""
         try:
             # 새 제목에서 키워드 추출
             new_keywords = self._extract_keywords(new_title)
+            if not new_keywords:
+                return False
             
-            for post in published_posts:
-                existing_title = post.get('title', '')
-                existing_keywords = self._extract_keywords(existing_title)
-                
-                # 키워드 교집합 비율 계산
-                if new_keywords and existing_keywords:
-                    overlap = len(new_keywords & existing_keywords)
-                    total_unique = len(new_keywords | existing_keywords)
-                    
-                    if total_unique > 0:
-                        overlap_ratio = overlap / total_unique
-                        if overlap_ratio >= 0.6:  # 60% 이상 키워드 겹침
-                            return True
+            for post, overlap in get_post_index(self.posts_dir).keyword_candidates(new_keywords):
+                # 키워드 교집합 비율 계산 (Jaccard)
+                total_unique = len(new_keywords) + len(post['keywords']) - overlap
+                overlap_ratio = overlap / total_unique
+                if overlap_ratio >= 0.6:  # 60% 이상 키워드 겹침
+                    return True
             
             return False
             
@@ -183,23 +111,7 @@ class ContentDeduplicator:
     def _extract_keywords(self, title: str) -> set:
         """제목에서 중요 키워드 추출"""
         try:
-            # 불용어 리스트
-            stop_words = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
-                'those', 'how', 'what', 'when', 'where', 'why', 'who', '2024', '2025'
-            }
-            
-            # 정규화 및 토큰화
-            title_lower = title.lower()
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', title_lower)  # 3글자 이상 영단어만
-            
-            # 불용어 제거
-            keywords = set(word for word in words if word not in stop_words)
-            
-            return keywords
+            return extract_title_keywords(title)
             
         except Exception as e:
             logger.warning(f"Error extracting keywords: {e}")
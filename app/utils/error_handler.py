@@ -8,8 +8,6 @@ import traceback
 from typing import Callable, Any, Optional, Dict
 from functools import wraps
 import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
 import openai
 from openai import OpenAI
 
@@ -21,13 +19,23 @@ except ImportError:
         import logging
         return logging.getLogger(__name__)
 
+try:
+    from .single_flight import get_flight_group
+    from .client_registry import get_client, create_pooled_session
+    from .retry_engine import RetryBudget, RetryEngine, RetryPolicy, classify_error, classify_git_error
+except ImportError:
+    from single_flight import get_flight_group
+    from client_registry import get_client, create_pooled_session
+    from retry_engine import RetryBudget, RetryEngine, RetryPolicy, classify_error, classify_git_error
+
 
 class RetryConfig:
     """재시도 설정"""
     
-    # OpenAI API 재시도 설정
+    # OpenAI API 재시도 설정 (시도 횟수는 최초 시도 포함)
     OPENAI_MAX_RETRIES = 3
-    OPENAI_RETRY_DELAYS = [1, 2, 4]  # 지수 백오프
+    OPENAI_BASE_DELAY = 1.0
+    OPENAI_MAX_DELAY = 30.0
     OPENAI_RETRY_ERRORS = [
         "rate_limit_exceeded",
         "server_error", 
@@ -37,12 +45,57 @@ class RetryConfig:
     
     # HTTP 요청 재시도 설정
     HTTP_MAX_RETRIES = 3
-    HTTP_BACKOFF_FACTOR = 0.3
-    HTTP_STATUS_FORCELIST = [500, 502, 503, 504]
+    HTTP_BASE_DELAY = 0.3
+    HTTP_MAX_DELAY = 10.0
     
     # Git 작업 재시도 설정
     GIT_MAX_RETRIES = 2
     GIT_RETRY_DELAY = 2
+    
+    # 실행 1회 동안 모든 외부 호출이 공유하는 재시도 총량 (장애 시 재시도 폭주 방지)
+    RUN_RETRY_BUDGET = 30
+
+
+# 실행 단위 공유 재시도 예산
+_run_retry_budget = RetryBudget(RetryConfig.RUN_RETRY_BUDGET)
+
+# 호출 유형별 재시도 정책
+RETRY_POLICIES = {
+    'openai': RetryPolicy(max_attempts=RetryConfig.OPENAI_MAX_RETRIES,
+                          base_delay=RetryConfig.OPENAI_BASE_DELAY,
+                          max_delay=RetryConfig.OPENAI_MAX_DELAY),
+    'http': RetryPolicy(max_attempts=RetryConfig.HTTP_MAX_RETRIES,
+                        base_delay=RetryConfig.HTTP_BASE_DELAY,
+                        max_delay=RetryConfig.HTTP_MAX_DELAY),
+    'git': RetryPolicy(max_attempts=RetryConfig.GIT_MAX_RETRIES,
+                       base_delay=RetryConfig.GIT_RETRY_DELAY,
+                       max_delay=RetryConfig.GIT_RETRY_DELAY * 4),
+}
+
+# 호출 유형별 에러 분류기 (메시지 기반 분류는 git만)
+RETRY_CLASSIFIERS = {
+    'git': classify_git_error,
+}
+
+
+def get_retry_engine(name: str, retry_on: tuple = ()) -> RetryEngine:
+    """
+    호출 유형별 재시도 엔진 (실행 단위 재시도 예산 공유)
+    
+    Args:
+        name (str): 정책 이름 ('openai', 'http', 'git')
+        retry_on (tuple): 분류와 무관하게 재시도할 예외 타입
+    
+    Returns:
+        RetryEngine: 재시도 엔진
+    """
+    return RetryEngine(name, RETRY_POLICIES[name], budget=_run_retry_budget,
+                       classifier=RETRY_CLASSIFIERS.get(name, classify_error), retry_on=retry_on)
+
+
+def reset_retry_budget():
+    """새 파이프라인 실행 시작 시 재시도 예산 초기화"""
+    _run_retry_budget.reset()
 
 
 class APIError(Exception):
@@ -74,81 +127,50 @@ def retry_on_failure(
     backoff_factor: float = 2.0,
     exceptions: tuple = (Exception,)
 ):
-    """재시도 데코레이터"""
+    """재시도 데코레이터 (지정한 예외는 분류와 무관하게 재시도)"""
     def decorator(func: Callable) -> Callable:
+        policy = RetryPolicy(max_attempts=max_retries + 1, base_delay=delay,
+                             max_delay=delay * (backoff_factor ** max_retries), multiplier=backoff_factor)
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger = get_logger()
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                
-                except exceptions as e:
-                    if attempt == max_retries:
-                        logger.error(f"[RETRY] Final attempt failed for {func.__name__}: {str(e)}")
-                        raise
-                    
-                    wait_time = delay * (backoff_factor ** attempt)
-                    logger.warning(f"[RETRY] Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {str(e)}")
-                    logger.info(f"[RETRY] Retrying in {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-            
-            return None  # 실제로는 도달하지 않음
+            engine = RetryEngine(func.__name__, policy, budget=_run_retry_budget,
+                                 classifier=_not_retryable, retry_on=exceptions)
+            return engine.call(func, *args, **kwargs)
         
         return wrapper
     return decorator
 
 
+def _not_retryable(error: BaseException):
+    """retry_on_failure용 분류기: 지정한 예외만 재시도"""
+    info = classify_error(error)
+    info.retryable = False
+    return info
+
+
 def handle_openai_errors(func: Callable) -> Callable:
     """OpenAI API 에러 처리 데코레이터"""
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         logger = get_logger()
         
-        for attempt in range(RetryConfig.OPENAI_MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            
-            except openai.RateLimitError as e:
-                if attempt == RetryConfig.OPENAI_MAX_RETRIES - 1:
-                    logger.error(f"[API] OpenAI rate limit exceeded - final attempt failed: {str(e)}")
-                    raise APIError(f"OpenAI rate limit exceeded: {str(e)}", "rate_limit_exceeded")
-                
-                # Rate limit 정보 파싱
-                retry_after = getattr(e, 'retry_after', None) or RetryConfig.OPENAI_RETRY_DELAYS[attempt]
-                logger.warning(f"[API] Rate limit hit, waiting {retry_after}s before retry {attempt + 1}/{RetryConfig.OPENAI_MAX_RETRIES}")
-                time.sleep(retry_after)
-            
-            except openai.APIError as e:
-                if attempt == RetryConfig.OPENAI_MAX_RETRIES - 1:
-                    logger.error(f"[API] OpenAI API error - final attempt failed: {str(e)}")
-                    raise APIError(f"OpenAI API error: {str(e)}", "api_error")
-                
-                logger.warning(f"[API] API error, retrying {attempt + 1}/{RetryConfig.OPENAI_MAX_RETRIES}: {str(e)}")
-                time.sleep(RetryConfig.OPENAI_RETRY_DELAYS[attempt])
-            
-            except openai.APIConnectionError as e:
-                if attempt == RetryConfig.OPENAI_MAX_RETRIES - 1:
-                    logger.error(f"[API] OpenAI connection error - final attempt failed: {str(e)}")
-                    raise APIError(f"OpenAI connection error: {str(e)}", "connection_error")
-                
-                logger.warning(f"[API] Connection error, retrying {attempt + 1}/{RetryConfig.OPENAI_MAX_RETRIES}: {str(e)}")
-                time.sleep(RetryConfig.OPENAI_RETRY_DELAYS[attempt])
-            
-            except openai.APITimeoutError as e:
-                if attempt == RetryConfig.OPENAI_MAX_RETRIES - 1:
-                    logger.error(f"[API] OpenAI timeout - final attempt failed: {str(e)}")
-                    raise APIError(f"OpenAI timeout: {str(e)}", "timeout")
-                
-                logger.warning(f"[API] Timeout, retrying {attempt + 1}/{RetryConfig.OPENAI_MAX_RETRIES}: {str(e)}")
-                time.sleep(RetryConfig.OPENAI_RETRY_DELAYS[attempt])
-            
-            except Exception as e:
-                logger.error(f"[API] Unexpected error in OpenAI call: {str(e)}")
-                raise APIError(f"Unexpected OpenAI error: {str(e)}", "unknown")
+        try:
+            return get_retry_engine('openai').call(func, *args, **kwargs)
+        
+        except openai.RateLimitError as e:
+            logger.error(f"[API] OpenAI rate limit exceeded - final attempt failed: {str(e)}")
+            raise APIError(f"OpenAI rate limit exceeded: {str(e)}", "rate_limit_exceeded",
+                           retry_after=classify_error(e).retry_after)
         
-        return None  # 실제로는 도달하지 않음
+        except openai.APIError as e:
+            error_type = classify_error(e).error_type
+            logger.error(f"[API] OpenAI {error_type} - final attempt failed: {str(e)}")
+            raise APIError(f"OpenAI {error_type}: {str(e)}", error_type)
+        
+        except Exception as e:
+            logger.error(f"[API] Unexpected error in OpenAI call: {str(e)}")
+            raise APIError(f"Unexpected OpenAI error: {str(e)}", "unknown")
     
     return wrapper
 
@@ -157,44 +179,69 @@ class HTTPRetrySession:
     """HTTP 요청용 재시도 세션"""
     
     def __init__(self):
-        self.session = requests.Session()
-        
-        # 재시도 전략 설정
-        retry_strategy = Retry(
-            total=RetryConfig.HTTP_MAX_RETRIES,
-            backoff_factor=RetryConfig.HTTP_BACKOFF_FACTOR,
-            status_forcelist=RetryConfig.HTTP_STATUS_FORCELIST,
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # 커넥션 풀(keep-alive) 세션 - 재시도는 어댑터가 아닌 공용 재시도 엔진이 담당
+        self.session = create_pooled_session()
         
         # 타임아웃 설정
-        self.session.timeout = (10, 30)  # (connect, read)
+        self.timeout = (10, 30)  # (connect, read)
+    
+    def _request(self, method: str, *args, **kwargs) -> requests.Response:
+        """요청 1회 전송 (재시도 대상 상태 코드는 예외로 변환)"""
+        kwargs.setdefault('timeout', self.timeout)
+        response = self.session.request(method, *args, **kwargs)
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        return response
     
     def get(self, *args, **kwargs):
         """GET 요청"""
-        return self.session.get(*args, **kwargs)
+        return get_retry_engine('http').call(self._request, "GET", *args, **kwargs)
     
     def post(self, *args, **kwargs):
         """POST 요청"""
-        return self.session.post(*args, **kwargs)
+        return get_retry_engine('http').call(self._request, "POST", *args, **kwargs)
+
+
+def _http_flight_key(url: str, kwargs: Dict[str, Any]) -> Optional[tuple]:
+    """GET 요청 병합 키 생성 (본문이 있는 요청은 병합하지 않음)"""
+    if any(kwargs.get(name) is not None for name in ('data', 'json', 'files')):
+        return None
+    params = kwargs.get('params') or {}
+    if isinstance(params, dict):
+        params = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    else:
+        params = str(params)
+    headers = tuple(sorted((kwargs.get('headers') or {}).items()))
+    return ('GET', url, params, headers)
+
+
+def _send_http_request(url: str, method: str, **kwargs) -> requests.Response:
+    """실제 HTTP 요청 전송"""
+    # 프로세스 전역 세션 재사용 (매 요청마다 TLS 핸드셰이크 방지)
+    session = get_client('http_retry_session', HTTPRetrySession)
+    
+    if method.upper() == "GET":
+        response = session.get(url, **kwargs)
+    elif method.upper() == "POST":
+        response = session.post(url, **kwargs)
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    # 병합된 대기자들이 본문을 공유할 수 있도록 미리 읽어둠
+    response.content
+    return response
 
 
 def safe_http_request(url: str, method: str = "GET", **kwargs) -> Optional[requests.Response]:
-    """안전한 HTTP 요청"""
+    """안전한 HTTP 요청 (동일 GET 요청이 진행 중이면 그 응답을 공유)"""
     logger = get_logger()
     
     try:
-        session = HTTPRetrySession()
-        
-        if method.upper() == "GET":
-            response = session.get(url, **kwargs)
-        elif method.upper() == "POST":
-            response = session.post(url, **kwargs)
+        flight_key = _http_flight_key(url, kwargs) if method.upper() == "GET" else None
+        if flight_key is not None:
+            response = get_flight_group('http').do(flight_key, _send_http_request, url, method, **kwargs)
         else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+            response = _send_http_request(url, method, **kwargs)
         
         response.raise_for_status()
         logger.debug(f"[HTTP] Successful {method} request to {url}")
@@ -223,34 +270,26 @@ def handle_git_errors(func: Callable) -> Callable:
     def wrapper(*args, **kwargs) -> Any:
         logger = get_logger()
         
-        for attempt in range(RetryConfig.GIT_MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            
-            except Exception as e:
-                error_msg = str(e).lower()
-                
-                # 네트워크 관련 Git 에러
-                if any(keyword in error_msg for keyword in ['network', 'connection', 'timeout', 'remote']):
-                    if attempt == RetryConfig.GIT_MAX_RETRIES - 1:
-                        logger.error(f"[GIT] Network error - final attempt failed: {str(e)}")
-                        raise GitOperationError(f"Git network error: {str(e)}")
-                    
-                    logger.warning(f"[GIT] Network error, retrying {attempt + 1}/{RetryConfig.GIT_MAX_RETRIES}: {str(e)}")
-                    time.sleep(RetryConfig.GIT_RETRY_DELAY)
-                    continue
-                
-                # 인증 관련 에러 (재시도하지 않음)
-                elif any(keyword in error_msg for keyword in ['authentication', 'permission', 'access']):
-                    logger.error(f"[GIT] Authentication/Permission error: {str(e)}")
-                    raise GitOperationError(f"Git authentication error: {str(e)}")
-                
-                # 기타 에러
-                else:
-                    logger.error(f"[GIT] Unexpected git error: {str(e)}")
-                    raise GitOperationError(f"Git error: {str(e)}")
+        try:
+            return get_retry_engine('git').call(func, *args, **kwargs)
         
-        return None  # 실제로는 도달하지 않음
+        except Exception as e:
+            error_type = classify_git_error(e).error_type
+            
+            # 네트워크 관련 Git 에러 (재시도 후 실패)
+            if error_type in ("connection_error", "timeout"):
+                logger.error(f"[GIT] Network error - final attempt failed: {str(e)}")
+                raise GitOperationError(f"Git network error: {str(e)}")
+            
+            # 인증 관련 에러 (재시도하지 않음)
+            elif error_type == "authentication":
+                logger.error(f"[GIT] Authentication/Permission error: {str(e)}")
+                raise GitOperationError(f"Git authentication error: {str(e)}")
+            
+            # 기타 에러
+            else:
+                logger.error(f"[GIT] Unexpected git error: {str(e)}")
+                raise GitOperationError(f"Git error: {str(e)}")
     
     return wrapper
 
@@ -0,0 +1,121 @@
+"""
+파일 잠금 유틸리티
+같은 호스트의 여러 프로세스(cron 중복 실행, 워커 등)가 상태 파일을 안전하게 공유하도록 배타적 잠금 제공
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 같은 프로세스 안의 스레드끼리는 파일 잠금이 보장되지 않으므로 경로별 스레드 잠금을 함께 사용
+_thread_locks: Dict[str, threading.RLock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock_for(path: Path) -> threading.RLock:
+    key = str(path.resolve())
+    with _thread_locks_guard:
+        lock = _thread_locks.get(key)
+        if lock is None:
+            lock = threading.RLock()
+            _thread_locks[key] = lock
+        return lock
+
+
+class FileLock:
+    """프로세스 간 배타적 파일 잠금 (with 문으로 사용)"""
+
+    def __init__(self, path: Path):
+        """
+        FileLock 초기화
+
+        Args:
+            path (Path): 잠금 파일 경로 (없으면 생성)
+        """
+        self.path = Path(path)
+        self._thread_lock = _thread_lock_for(self.path)
+        self._fd = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        except Exception:
+            self._release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release()
+        return False
+
+    def _release(self):
+        if self._fd is not None:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            except OSError as e:
+                logger.warning(f"Error releasing file lock {self.path}: {e}")
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._thread_lock.release()
+
+
+def test_file_lock():
+    """FileLock 테스트 함수"""
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            counter_file = Path(tmp_dir) / 'counter.txt'
+            counter_file.write_text('0')
+
+            with ProcessPoolExecutor(max_workers=4) as pool:
+                list(pool.map(_increment_counter, [str(counter_file)] * 200))
+
+            total = int(counter_file.read_text())
+            print("Testing FileLock...")
+            print(f"  Counter after 200 locked increments from 4 processes: {total}")
+            return total == 200
+
+    except Exception as e:
+        print(f"FileLock test failed: {e}")
+        return False
+
+
+def _increment_counter(path: str):
+    """테스트용: 잠금 상태에서 카운터 파일 증가"""
+    counter_file = Path(path)
+    with FileLock(counter_file.with_suffix('.lock')):
+        counter_file.write_text(str(int(counter_file.read_text()) + 1))
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_file_lock()
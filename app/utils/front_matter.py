@@ -0,0 +1,196 @@
+"""
+Front Matter 코덱 모듈
+포스트 파일의 YAML Front Matter 읽기/쓰기를 한곳에서 처리 (libyaml C 로더/덤퍼 우선, 헤더 바이트만 읽기, 안정적인 왕복 변환)
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import yaml
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# libyaml이 있으면 C 구현 사용 (없으면 순수 Python 구현)
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+DELIMITER = '---'
+
+# 헤더가 이보다 길면 Front Matter가 아닌 것으로 판단
+MAX_HEADER_BYTES = 64 * 1024
+
+
+def parse_front_matter(yaml_text: str) -> Dict[str, Any]:
+    """
+    Front Matter YAML 파싱
+
+    Args:
+        yaml_text (str): 구분자(---) 사이의 YAML 텍스트
+
+    Returns:
+        Dict: Front Matter (비어 있거나 매핑이 아니면 빈 딕셔너리)
+    """
+    data = yaml.load(yaml_text, Loader=Loader)
+    return data if isinstance(data, dict) else {}
+
+
+def dump_front_matter(data: Dict[str, Any]) -> str:
+    """
+    Front Matter YAML 생성 (키 정렬, 블록 스타일, 유니코드 그대로 - 다시 읽어 쓰면 같은 바이트)
+
+    Args:
+        data (Dict): Front Matter
+
+    Returns:
+        str: 줄바꿈으로 끝나는 YAML 텍스트 (구분자 제외)
+    """
+    return yaml.dump(data, Dumper=Dumper, allow_unicode=True, default_flow_style=False, sort_keys=True)
+
+
+def split_post(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    포스트 텍스트를 (Front Matter, 본문)으로 분리
+
+    본문은 닫는 구분자 뒤 빈 줄 하나를 뺀 나머지이므로 render_post로 다시 합치면 원문과 같음
+
+    Args:
+        text (str): 포스트 전체 텍스트
+
+    Returns:
+        Tuple[Dict, str]: Front Matter가 없으면 ({}, 원문)
+    """
+    if not text.startswith(DELIMITER + '\n'):
+        return {}, text
+
+    end_marker = text.find(f'\n{DELIMITER}\n', len(DELIMITER))
+    if end_marker == -1:
+        return {}, text
+
+    data = parse_front_matter(text[len(DELIMITER) + 1:end_marker + 1])
+    body = text[end_marker + len(DELIMITER) + 2:]
+    if body.startswith('\n'):
+        body = body[1:]
+    return data, body
+
+
+def render_post(data: Dict[str, Any], body: str) -> str:
+    """
+    Front Matter와 본문으로 포스트 텍스트 생성
+
+    Args:
+        data (Dict): Front Matter
+        body (str): 마크다운 본문
+
+    Returns:
+        str: "---\\n<YAML>---\\n\\n<본문>"
+    """
+    return f"{DELIMITER}\n{dump_front_matter(data)}{DELIMITER}\n\n{body}"
+
+
+def read_front_matter(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    파일의 Front Matter만 읽기 (본문은 읽지 않고 닫는 구분자까지만)
+
+    Args:
+        path (str | Path): 포스트 파일
+
+    Returns:
+        Dict: Front Matter (없으면 빈 딕셔너리)
+    """
+    delimiter = DELIMITER.encode('ascii')
+    with open(path, 'rb') as f:
+        if f.readline().rstrip(b'\r\n') != delimiter:
+            return {}
+
+        lines = []
+        size = 0
+        for line in f:
+            if line.rstrip(b'\r\n') == delimiter:
+                return parse_front_matter(b''.join(lines).decode('utf-8'))
+            lines.append(line)
+            size += len(line)
+            if size > MAX_HEADER_BYTES:
+                break
+
+    logger.warning(f"Unterminated front matter in {path}")
+    return {}
+
+
+def read_post(path: Union[str, Path]) -> Tuple[Dict[str, Any], str]:
+    """파일을 (Front Matter, 본문)으로 읽기 (줄바꿈은 \\n으로 통일)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return split_post(f.read())
+
+
+def detect_newline(path: Union[str, Path]) -> str:
+    """파일의 줄바꿈 방식 (첫 줄 기준, 파일이 없으면 \\n)"""
+    try:
+        with open(path, 'rb') as f:
+            return '\r\n' if f.readline().endswith(b'\r\n') else '\n'
+    except FileNotFoundError:
+        return '\n'
+
+
+def write_post(path: Union[str, Path], data: Dict[str, Any], body: str, newline: Optional[str] = None):
+    """
+    포스트 파일 쓰기 (기존 파일이면 줄바꿈 방식 유지 - read_post 후 그대로 쓰면 같은 바이트)
+
+    Args:
+        path (str | Path): 포스트 파일
+        data (Dict): Front Matter
+        body (str): 마크다운 본문
+        newline (str, optional): 줄바꿈 ('\\n' 또는 '\\r\\n'). None이면 기존 파일 방식
+    """
+    newline = newline or detect_newline(path)
+    with open(path, 'w', encoding='utf-8', newline=newline) as f:
+        f.write(render_post(data, body))
+
+
+def test_front_matter():
+    """Front Matter 코덱 테스트 함수"""
+    import tempfile
+
+    try:
+        print("Testing front matter codec...")
+        print(f"  libyaml C loader: {Loader is not yaml.SafeLoader}, C dumper: {Dumper is not yaml.SafeDumper}")
+
+        data = {'layout': 'post', 'title': '원격 근무 가이드: 2025', 'date': '2025-08-11 00:00:41 +0900',
+                'categories': ['productivity'], 'tags': ['원격 근무', 'AI'], 'seo': {'description': '설명'}}
+        body = "# 원격 근무 가이드\n\n---\n\n구분선이 있는 본문\n"
+        text = render_post(data, body)
+
+        parsed, parsed_body = split_post(text)
+        stable = render_post(parsed, parsed_body) == text
+        print(f"  Round trip stable: {stable}")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'post.md'
+            path.write_text(text + "본문 " * 100000, encoding='utf-8')
+            header_only = read_front_matter(path)
+            print(f"  Header-only read: {header_only['title']}")
+
+            plain = Path(tmp_dir) / 'plain.md'
+            plain.write_text("# No front matter\n", encoding='utf-8')
+
+            # CRLF 파일도 읽고 다시 쓰면 같은 바이트
+            crlf = Path(tmp_dir) / 'crlf.md'
+            crlf.write_bytes(text.replace('\n', '\r\n').encode('utf-8'))
+            original = crlf.read_bytes()
+            write_post(crlf, *read_post(crlf))
+            crlf_stable = crlf.read_bytes() == original
+            print(f"  CRLF rewrite stable: {crlf_stable}")
+
+            return (stable and crlf_stable and parsed == data and parsed_body == body and header_only == data
+                    and read_front_matter(plain) == {} and split_post("# No front matter\n")[0] == {})
+
+    except Exception as e:
+        print(f"Front matter codec test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_front_matter()
@@ -170,8 +170,9 @@ class AutoBlogLogger:
     def log_api_call(self, api_name: str, success: bool, duration: float, **details):
         """API 호출 로그"""
         status = "[SUCCESS]" if success else "[FAILED]"
+        ttfb_str = f" (ttfb {details['ttfb']:.2f}s)" if details.get('ttfb') is not None else ""
         self.info(
-            f"{status} {api_name} API: {duration:.1f}s",
+            f"{status} {api_name} API: {duration:.1f}s{ttfb_str}",
             extra={"api": api_name, "success": success, "duration": duration, **details}
         )
     
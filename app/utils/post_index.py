@@ -0,0 +1,350 @@
+"""
+포스트 인덱스 모듈
+_posts의 제목·날짜·태그·카테고리·정규화 키워드를 SQLite에 저장하고 파일 mtime/크기로 증분 갱신 (중복 체크용)
+키워드 → 글 역색인을 함께 유지해 키워드가 겹치는 글만 후보로 조회하고, 제목 유사도 검색은 TitleSimilarityIndex로 처리
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from ..config import Config
+    from .client_registry import get_client
+    from .front_matter import read_front_matter
+    from .title_similarity import TitleSimilarityIndex
+except ImportError:
+    from config import Config
+    from client_registry import get_client
+    from front_matter import read_front_matter
+    from title_similarity import TitleSimilarityIndex
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# 제목 키워드 불용어
+TITLE_STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+    'those', 'how', 'what', 'when', 'where', 'why', 'who', '2024', '2025'
+}
+
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+
+def normalize_title(title: str) -> str:
+    """제목 정규화 (소문자, 특수문자 제거, 공백 정리)"""
+    text = title.lower()
+    text = re.sub(r'[^\w\s]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def extract_title_keywords(title: str) -> Set[str]:
+    """제목에서 중요 키워드 추출 (3글자 이상 영단어, 불용어 제외)"""
+    return {word for word in _KEYWORD_RE.findall(title.lower()) if word not in TITLE_STOP_WORDS}
+
+
+def _as_list(value: Any) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+class PostIndex:
+    """_posts 디렉터리의 영속 인덱스 (메모리 사본 + SQLite)"""
+
+    def __init__(self, posts_dir: Path, db_path: Optional[Path] = None,
+                 rescan_seconds: Optional[float] = None):
+        """
+        PostIndex 초기화
+
+        Args:
+            posts_dir (Path): Jekyll _posts 디렉터리
+            db_path (Path, optional): SQLite 파일. None이면 캐시 디렉터리 (디렉터리별 파일)
+            rescan_seconds (float, optional): 디렉터리 변경이 없어도 전체 재확인하는 주기(초)
+        """
+        self.posts_dir = Path(posts_dir)
+        if db_path is None:
+            digest = hashlib.sha1(str(self.posts_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+            db_path = Config.CACHE_DIR / f'post_index-{digest}.sqlite3'
+        self.db_path = Path(db_path)
+        self.rescan_seconds = Config.POST_INDEX_RESCAN_SECONDS if rescan_seconds is None else rescan_seconds
+
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.keyword_postings: Dict[str, Set[str]] = {}
+        self.version = 0
+        self._title_index: Optional[Tuple[int, List[Dict[str, Any]], TitleSimilarityIndex]] = None
+        self._fingerprints: Dict[str, tuple] = {}
+        self._dir_mtime_ns: Optional[int] = None
+        self._last_scan = 0.0
+        self._lock = threading.RLock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._init_schema()
+        self._load()
+        self.refresh(force=True)
+
+    def _init_schema(self):
+        """스키마 생성 (버전이 다르면 다시 만듦)"""
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        with self._conn:
+            if version != SCHEMA_VERSION:
+                self._conn.execute('DROP TABLE IF EXISTS posts')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS posts ('
+                'filename TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, '
+                'title TEXT, date TEXT, tags TEXT, categories TEXT, keywords TEXT)'
+            )
+            self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _set_record(self, filename: str, record: Optional[Dict[str, Any]]):
+        """레코드 교체와 키워드 역색인 갱신 (record가 None이면 삭제)"""
+        self.version += 1
+        previous = self.records.pop(filename, None)
+        if previous is not None:
+            for keyword in previous['keywords']:
+                postings = self.keyword_postings.get(keyword)
+                if postings is not None:
+                    postings.discard(filename)
+                    if not postings:
+                        del self.keyword_postings[keyword]
+        if record is not None:
+            self.records[filename] = record
+            for keyword in record['keywords']:
+                self.keyword_postings.setdefault(keyword, set()).add(filename)
+
+    def _load(self):
+        """저장된 인덱스를 메모리로 로드"""
+        rows = self._conn.execute(
+            'SELECT filename, mtime_ns, size, title, date, tags, categories, keywords FROM posts').fetchall()
+        for filename, mtime_ns, size, title, date, tags, categories, keywords in rows:
+            self._fingerprints[filename] = (mtime_ns, size)
+            if title is not None:
+                self._set_record(filename, {
+                    'filename': filename, 'title': title, 'date': date,
+                    'tags': json.loads(tags), 'categories': json.loads(categories),
+                    'keywords': set(json.loads(keywords)),
+                })
+
+    def _index_file(self, path: Path, fingerprint: tuple) -> tuple:
+        """파일 하나의 Front Matter를 읽어 레코드와 DB 행 생성 (Front Matter가 없으면 제목 None)"""
+        try:
+            front_matter = read_front_matter(path)
+        except Exception as e:
+            logger.warning(f"Error reading post file {path}: {e}")
+            front_matter = {}
+
+        filename = path.name
+        self._fingerprints[filename] = fingerprint
+        if not front_matter:
+            self._set_record(filename, None)
+            return (filename, *fingerprint, None, None, None, None, None)
+
+        title = str(front_matter.get('title') or '')
+        record = {
+            'filename': filename,
+            'title': title,
+            'date': str(front_matter.get('date') or ''),
+            'tags': _as_list(front_matter.get('tags')),
+            'categories': _as_list(front_matter.get('categories')),
+            'keywords': extract_title_keywords(title),
+        }
+        self._set_record(filename, record)
+        return (filename, *fingerprint, title, record['date'], json.dumps(record['tags'], ensure_ascii=False),
+                json.dumps(record['categories'], ensure_ascii=False), json.dumps(sorted(record['keywords'])))
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        디렉터리와 인덱스 동기화
+
+        디렉터리 mtime이 그대로이고 재확인 주기 전이면 stat 한 번으로 끝나며,
+        그 외에는 파일별 mtime/크기를 비교해 바뀐 글만 다시 읽음
+
+        Args:
+            force (bool): 조건과 관계없이 전체 확인
+
+        Returns:
+            int: 추가·변경·삭제된 글 수
+        """
+        with self._lock:
+            try:
+                dir_mtime_ns = self.posts_dir.stat().st_mtime_ns
+            except FileNotFoundError:
+                dir_mtime_ns = None
+
+            now = time.monotonic()
+            if (not force and dir_mtime_ns == self._dir_mtime_ns
+                    and now - self._last_scan < self.rescan_seconds):
+                return 0
+
+            current: Dict[str, tuple] = {}
+            if dir_mtime_ns is not None:
+                for entry in os.scandir(self.posts_dir):
+                    if entry.name.endswith('.md') and entry.is_file():
+                        stat = entry.stat()
+                        current[entry.name] = (stat.st_mtime_ns, stat.st_size)
+
+            upserts = [self._index_file(self.posts_dir / name, fingerprint)
+                       for name, fingerprint in current.items() if self._fingerprints.get(name) != fingerprint]
+            removed = [name for name in self._fingerprints if name not in current]
+            for name in removed:
+                self._fingerprints.pop(name, None)
+                self._set_record(name, None)
+
+            if upserts or removed:
+                with self._conn:
+                    self._conn.executemany('INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)', upserts)
+                    self._conn.executemany('DELETE FROM posts WHERE filename = ?', [(name,) for name in removed])
+                logger.info(f"Post index: {len(self.records)} posts (+{len(upserts)} updated, -{len(removed)} removed)")
+
+            self._dir_mtime_ns = dir_mtime_ns
+            self._last_scan = now
+            return len(upserts) + len(removed)
+
+    def update_post(self, path: Path):
+        """
+        발행·수정된 글 하나를 바로 반영 (디렉터리 mtime이 바뀌지 않는 덮어쓰기 대비)
+
+        Args:
+            path (Path): 포스트 파일
+        """
+        path = Path(path)
+        with self._lock:
+            stat = path.stat()
+            row = self._index_file(path, (stat.st_mtime_ns, stat.st_size))
+            with self._conn:
+                self._conn.execute('INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)', row)
+
+    def posts(self) -> List[Dict[str, Any]]:
+        """
+        Front Matter가 있는 글 목록 (필요하면 먼저 증분 갱신)
+
+        Returns:
+            List[Dict]: filename, title, date, tags, categories, keywords
+        """
+        self.refresh()
+        with self._lock:
+            return list(self.records.values())
+
+    def keyword_candidates(self, keywords: Set[str]) -> List[Tuple[Dict[str, Any], int]]:
+        """
+        키워드가 하나 이상 겹치는 글과 겹치는 키워드 수 (역색인 조회, 비용은 후보 수에 비례)
+
+        Args:
+            keywords (Set[str]): 정규화된 제목 키워드 (extract_title_keywords)
+
+        Returns:
+            List[Tuple[Dict, int]]: (글 레코드, 공통 키워드 수)
+        """
+        self.refresh()
+        with self._lock:
+            overlap = Counter()
+            for keyword in keywords:
+                overlap.update(self.keyword_postings.get(keyword, ()))
+            return [(self.records[filename], count) for filename, count in overlap.items()]
+
+    def similar_title(self, title: str, threshold: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        임계값 이상으로 유사한 제목의 글 (제목 유사도 인덱스는 글 목록이 바뀔 때만 다시 만듦)
+
+        Args:
+            title (str): 새 제목
+            threshold (float): 유사도 임계값
+
+        Returns:
+            Optional[Tuple[Dict, float]]: (글 레코드, 유사도) 또는 None
+        """
+        self.refresh()
+        with self._lock:
+            if self._title_index is None or self._title_index[0] != self.version:
+                records = list(self.records.values())
+                self._title_index = (self.version, records,
+                                     TitleSimilarityIndex([normalize_title(record['title']) for record in records]))
+            _, records, index = self._title_index
+
+        found = index.find_similar(normalize_title(title), threshold)
+        if found is None:
+            return None
+        return records[found[0]], found[1]
+
+
+def get_post_index(posts_dir: Path) -> PostIndex:
+    """디렉터리별 프로세스 공유 포스트 인덱스"""
+    posts_dir = Path(posts_dir).resolve()
+    return get_client(f'post_index:{posts_dir}', lambda: PostIndex(posts_dir))
+
+
+def test_post_index():
+    """PostIndex 테스트 함수"""
+    import tempfile
+
+    try:
+        print("Testing PostIndex...")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            posts_dir = Path(tmp_dir) / '_posts'
+            posts_dir.mkdir()
+            db_path = Path(tmp_dir) / 'post_index.sqlite3'
+            for i in range(2000):
+                (posts_dir / f"2025-01-01-post-{i}.md").write_text(
+                    f"---\ntitle: Post {i} about Remote Work Tools\ndate: 2025-01-01 09:00:00 +0900\n"
+                    f"tags:\n- remote\ncategories:\n- productivity\n---\n\nBody {i}\n", encoding='utf-8')
+
+            start = time.perf_counter()
+            index = PostIndex(posts_dir, db_path, rescan_seconds=60)
+            build_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            for _ in range(100):
+                posts = index.posts()
+            lookup_ms = (time.perf_counter() - start) * 1000 / 100
+            print(f"  Build: {build_ms:.1f}ms, lookup: {lookup_ms:.3f}ms ({len(posts)} posts)")
+
+            # 재시작: DB에서 로드, 다시 파싱하지 않음
+            start = time.perf_counter()
+            reloaded = PostIndex(posts_dir, db_path, rescan_seconds=60)
+            print(f"  Reload from SQLite: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+            (posts_dir / "2025-01-01-post-0.md").unlink()
+            new_post = posts_dir / "2025-01-02-new.md"
+            new_post.write_text("---\ntitle: Brand New Post\n---\n\nBody\n", encoding='utf-8')
+            changed = reloaded.refresh()
+            titles = {post['title'] for post in reloaded.posts()}
+            print(f"  After add/remove: {changed} changes, {len(titles)} posts")
+
+            start = time.perf_counter()
+            candidates = reloaded.keyword_candidates({'brand', 'post', 'unrelated'})
+            candidate_ms = (time.perf_counter() - start) * 1000
+            print(f"  Keyword candidates: {len(candidates)} in {candidate_ms:.3f}ms")
+            new_only = reloaded.keyword_candidates({'brand'})
+
+            return (len(posts) == 2000 and lookup_ms < 1.0 and changed == 2 and 'Brand New Post' in titles
+                    and 'Post 0 about Remote Work Tools' not in titles and len(candidates) == 2000
+                    and [(post['title'], count) for post, count in new_only] == [('Brand New Post', 1)]
+                    and "2025-01-01-post-0.md" not in reloaded.keyword_postings['remote']
+                    and posts[0]['keywords'] == {'post', 'about', 'remote', 'work', 'tools'})
+
+    except Exception as e:
+        print(f"PostIndex test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_post_index()
@@ -0,0 +1,432 @@
+"""
+토큰 버킷 속도 제한 모듈
+OpenAI의 분당 요청 수(RPM)/분당 토큰 수(TPM) 한도에 맞춰 호출 속도를 조절하여 429 에러 예방
+파일 잠금 버킷으로 같은 호스트의 여러 프로세스가 한도를 공유
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+try:
+    from ..config import Config
+    from .client_registry import get_client
+    from .file_lock import FileLock
+    from .token_counter import count_message_tokens
+except ImportError:
+    # 직접 실행 시를 위한 fallback
+    Config = None
+    from client_registry import get_client
+    from file_lock import FileLock
+    from token_counter import count_message_tokens
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    OpenAI rate limit reset 헤더 값을 초 단위로 변환
+
+    Args:
+        value (str): "1s", "6m0s", "20ms", "1h2m3.5s" 형식의 문자열
+
+    Returns:
+        float: 초. 파싱 불가 시 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    units = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+    parts = re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', value)
+    if not parts:
+        return None
+    return sum(float(number) * units[unit] for number, unit in parts)
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷 (프로세스 내부 상태)"""
+
+    def __init__(self, capacity: float, refill_per_second: float,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        TokenBucket 초기화
+
+        Args:
+            capacity (float): 버킷 최대 용량
+            refill_per_second (float): 초당 충전량
+            clock (Callable): 시간 함수 (테스트용 교체 가능)
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self._initial_state(capacity, refill_per_second)
+
+    def _initial_state(self, capacity: float, refill_per_second: float) -> Dict[str, float]:
+        return {
+            'capacity': float(capacity),
+            'rate': float(refill_per_second),
+            'level': float(capacity),
+            'updated': self._clock()
+        }
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict[str, float]]:
+        """잠금 상태에서 충전이 반영된 버킷 상태 제공"""
+        with self._lock:
+            self._refill(self._state)
+            yield self._state
+
+    def _refill(self, state: Dict[str, float]):
+        now = self._clock()
+        elapsed = max(0.0, now - state['updated'])
+        state['level'] = min(state['capacity'], state['level'] + elapsed * state['rate'])
+        state['updated'] = now
+
+    @staticmethod
+    def _wait_for(state: Dict[str, float], amount: float) -> float:
+        # 버킷 용량보다 큰 요청은 가득 찬 상태에서 허용 (영원히 대기하지 않도록)
+        amount = min(amount, state['capacity'])
+        # 부동소수점 오차로 아주 작은 부족분이 남아 무한 대기하지 않도록 허용 오차 적용
+        if state['level'] + 1e-6 >= amount:
+            return 0.0
+        if state['rate'] <= 0:
+            return float('inf')
+        return (amount - state['level']) / state['rate']
+
+    @property
+    def capacity(self) -> float:
+        with self._locked() as state:
+            return state['capacity']
+
+    @property
+    def refill_per_second(self) -> float:
+        with self._locked() as state:
+            return state['rate']
+
+    @property
+    def level(self) -> float:
+        """현재 남은 토큰"""
+        with self._locked() as state:
+            return state['level']
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 소비하려면 기다려야 하는 시간 (초)"""
+        with self._locked() as state:
+            return self._wait_for(state, amount)
+
+    def try_consume(self, amount: float) -> float:
+        """
+        토큰이 충분하면 원자적으로 차감
+
+        Returns:
+            float: 0이면 차감 성공, 아니면 더 기다려야 하는 시간 (초)
+        """
+        with self._locked() as state:
+            wait = self._wait_for(state, amount)
+            if wait <= 0:
+                state['level'] -= min(amount, state['capacity'])
+            return wait
+
+    def consume(self, amount: float):
+        """대기 없이 토큰 차감 (음수 잔량 허용)"""
+        with self._locked() as state:
+            state['level'] -= min(amount, state['capacity'])
+
+    def refund(self, amount: float):
+        """사용하지 않은 토큰 반환"""
+        with self._locked() as state:
+            state['level'] = min(state['capacity'], state['level'] + amount)
+
+    def sync(self, remaining: Optional[float] = None, limit: Optional[float] = None,
+             reset_seconds: Optional[float] = None):
+        """
+        서버가 알려준 한도 정보로 버킷 상태 보정
+
+        Args:
+            remaining (float, optional): 서버 기준 남은 양
+            limit (float, optional): 서버 기준 분당 한도
+            reset_seconds (float, optional): 한도가 가득 찰 때까지 남은 시간
+        """
+        with self._locked() as state:
+            if limit:
+                state['capacity'] = float(limit)
+                state['rate'] = float(limit) / 60.0
+            if remaining is not None:
+                # 서버가 더 적게 남았다고 하면 그 값을 신뢰
+                state['level'] = min(state['level'], float(remaining))
+                if reset_seconds and reset_seconds > 0 and remaining < state['capacity']:
+                    state['rate'] = max(state['rate'], (state['capacity'] - remaining) / reset_seconds)
+
+    def drain(self, seconds: float):
+        """seconds 동안 사용할 수 없도록 버킷 비우기 (429 응답 시)"""
+        with self._locked() as state:
+            state['level'] = -seconds * state['rate']
+
+
+class FileTokenBucket(TokenBucket):
+    """같은 호스트의 여러 프로세스가 공유하는 파일 기반 토큰 버킷"""
+
+    def __init__(self, name: str, capacity: float, refill_per_second: float,
+                 state_dir: Optional[Path] = None, clock: Callable[[], float] = time.time):
+        """
+        FileTokenBucket 초기화
+
+        Args:
+            name (str): 버킷 이름 (상태 파일명)
+            capacity (float): 버킷 최대 용량
+            refill_per_second (float): 초당 충전량
+            state_dir (Path, optional): 상태 파일 디렉터리. None이면 캐시 디렉터리 사용
+            clock (Callable): 프로세스 간 공유 가능한 시간 함수 (벽시계)
+        """
+        self.name = name
+        base_dir = Path(state_dir) if state_dir else (Config.CACHE_DIR if Config else Path('.cache')) / 'ratelimits'
+        self.state_file = base_dir / f"{name}.json"
+        self._file_lock = FileLock(base_dir / f"{name}.lock")
+        self._defaults = (float(capacity), float(refill_per_second))
+        super().__init__(capacity, refill_per_second, clock)
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict[str, float]]:
+        """파일 잠금 상태에서 상태 파일을 읽고, 변경 후 다시 기록"""
+        with self._file_lock:
+            state = None
+            try:
+                if self.state_file.exists():
+                    with open(self.state_file, 'r', encoding='utf-8') as f:
+                        state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"[RATE-LIMIT] Resetting unreadable bucket state {self.state_file}: {e}")
+            if not state:
+                state = self._initial_state(*self._defaults)
+
+            self._refill(state)
+            yield state
+
+            tmp_file = self.state_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            tmp_file.replace(self.state_file)
+
+
+def create_bucket(name: str, capacity: float, refill_per_second: float) -> TokenBucket:
+    """설정에 따라 프로세스 공유(파일) 또는 프로세스 내부 버킷 생성"""
+    if Config is not None and Config.RATE_LIMIT_SHARED:
+        return FileTokenBucket(name, capacity, refill_per_second)
+    return TokenBucket(capacity, refill_per_second)
+
+
+class RequestRateLimiter:
+    """단일 버킷 요청 속도 제한 (NewsAPI, RSS 피드 등)"""
+
+    def __init__(self, bucket: TokenBucket, name: str = "requests",
+                 sleep: Callable[[float], None] = time.sleep):
+        self.bucket = bucket
+        self.name = name
+        self._sleep = sleep
+
+    def acquire(self, amount: float = 1) -> float:
+        """요청 1회분을 확보할 때까지 대기하고 대기 시간 반환"""
+        waited = 0.0
+        while True:
+            wait = self.bucket.try_consume(amount)
+            if wait <= 0:
+                break
+            self._sleep(wait)
+            waited += wait
+        if waited > 0:
+            logger.info(f"[RATE-LIMIT] Paced {self.name} request by {waited:.2f}s")
+        return waited
+
+
+class OpenAIRateLimiter:
+    """OpenAI RPM/TPM 이중 토큰 버킷 리미터"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep,
+                 requests_bucket: Optional[TokenBucket] = None, tokens_bucket: Optional[TokenBucket] = None):
+        """
+        OpenAIRateLimiter 초기화
+
+        Args:
+            requests_per_minute (int): 분당 요청 한도
+            tokens_per_minute (int): 분당 토큰 한도
+            clock (Callable): 시간 함수
+            sleep (Callable): 대기 함수
+            requests_bucket / tokens_bucket (TokenBucket, optional): 외부에서 만든 버킷 (프로세스 공유 등)
+        """
+        self.requests = requests_bucket or TokenBucket(requests_per_minute, requests_per_minute / 60.0, clock)
+        self.tokens = tokens_bucket or TokenBucket(tokens_per_minute, tokens_per_minute / 60.0, clock)
+        self._sleep = sleep
+        self._acquire_lock = threading.Lock()
+        self.total_wait = 0.0
+
+    @staticmethod
+    def estimate_tokens(messages: List[Dict[str, Any]], max_completion_tokens: int = 0) -> int:
+        """
+        요청이 소비할 토큰 추정 (OpenAI는 max tokens까지 TPM에 선반영)
+
+        Args:
+            messages (List[Dict]): 채팅 메시지
+            max_completion_tokens (int): 최대 출력 토큰
+
+        Returns:
+            int: 추정 토큰 수
+        """
+        return count_message_tokens(messages) + (max_completion_tokens or 0)
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """
+        요청 1회와 추정 토큰을 확보할 때까지 대기
+
+        Args:
+            estimated_tokens (int): 추정 토큰 수
+
+        Returns:
+            float: 실제 대기한 시간 (초)
+        """
+        waited = 0.0
+        # 대기 순서를 보장하기 위해 한 번에 한 호출자만 확보 시도
+        with self._acquire_lock:
+            while True:
+                # 버킷별로 원자적으로 차감 (다른 프로세스와 경쟁해도 초과 사용하지 않도록)
+                wait = self.requests.try_consume(1)
+                if wait <= 0:
+                    wait = self.tokens.try_consume(estimated_tokens)
+                    if wait <= 0:
+                        break
+                    self.requests.refund(1)
+                self._sleep(wait)
+                waited += wait
+
+        if waited > 0:
+            self.total_wait += waited
+            logger.info(f"[RATE-LIMIT] Paced OpenAI call by {waited:.2f}s (~{estimated_tokens} tokens)")
+        return waited
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """실제 사용 토큰이 추정보다 적으면 차액 반환"""
+        if actual_tokens is not None and actual_tokens < estimated_tokens:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """응답의 x-ratelimit-* 헤더로 버킷 보정"""
+        def number(name):
+            try:
+                value = headers.get(name)
+                return float(value) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+
+        self.requests.sync(
+            remaining=number('x-ratelimit-remaining-requests'),
+            limit=number('x-ratelimit-limit-requests'),
+            reset_seconds=parse_reset_duration(headers.get('x-ratelimit-reset-requests'))
+        )
+        self.tokens.sync(
+            remaining=number('x-ratelimit-remaining-tokens'),
+            limit=number('x-ratelimit-limit-tokens'),
+            reset_seconds=parse_reset_duration(headers.get('x-ratelimit-reset-tokens'))
+        )
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """429 응답을 받으면 모든 호출자가 retry_after 동안 대기하도록 버킷 비우기"""
+        seconds = retry_after if retry_after and retry_after > 0 else 1.0
+        self.requests.drain(seconds)
+        self.tokens.drain(seconds)
+        logger.warning(f"[RATE-LIMIT] OpenAI returned 429, pausing all callers for {seconds:.1f}s")
+
+
+def get_openai_rate_limiter() -> OpenAIRateLimiter:
+    """공유 OpenAI 리미터 (RATE_LIMIT_SHARED이면 같은 호스트의 모든 프로세스가 상태 공유)"""
+    rpm = Config.OPENAI_RPM if Config else 500
+    tpm = Config.OPENAI_TPM if Config else 200000
+
+    def factory():
+        return OpenAIRateLimiter(
+            rpm, tpm,
+            requests_bucket=create_bucket('openai-requests', rpm, rpm / 60.0),
+            tokens_bucket=create_bucket('openai-tokens', tpm, tpm / 60.0)
+        )
+
+    return get_client('openai_rate_limiter', factory)
+
+
+def get_request_limiter(name: str, requests_per_minute: int) -> RequestRateLimiter:
+    """이름별 공유 요청 리미터 (예: 'newsapi', 'feeds')"""
+    return get_client(
+        f"request_limiter:{name}",
+        lambda: RequestRateLimiter(create_bucket(name, requests_per_minute, requests_per_minute / 60.0), name)
+    )
+
+
+def test_rate_limiter():
+    """OpenAIRateLimiter 테스트 함수 (가상 시계 사용)"""
+    try:
+        now = [0.0]
+        limiter = OpenAIRateLimiter(
+            requests_per_minute=60, tokens_per_minute=6000,
+            clock=lambda: now[0], sleep=lambda seconds: now.__setitem__(0, now[0] + seconds)
+        )
+
+        print("Testing OpenAIRateLimiter...")
+        waits = [limiter.acquire(2000) for _ in range(4)]
+        print(f"  Waits for 4 x 2000-token calls at 6000 TPM: {[round(w, 1) for w in waits]}")
+
+        limiter.update_from_headers({
+            'x-ratelimit-limit-requests': '60',
+            'x-ratelimit-remaining-requests': '0',
+            'x-ratelimit-reset-requests': '1s',
+        })
+        waited = limiter.acquire(10)
+        print(f"  Wait after server reported 0 remaining requests: {waited:.2f}s")
+        print(f"  parse_reset_duration('6m0s') = {parse_reset_duration('6m0s')}")
+
+        return waits[:3] == [0.0, 0.0, 0.0] and waits[3] > 0 and waited > 0
+
+    except Exception as e:
+        print(f"Rate limiter test failed: {e}")
+        return False
+
+
+def _consume_shared(args):
+    """테스트용: 다른 프로세스에서 공유 버킷 소비"""
+    state_dir, amount = args
+    bucket = FileTokenBucket('test-shared', capacity=10, refill_per_second=0.001, state_dir=Path(state_dir))
+    return bucket.try_consume(amount) <= 0
+
+
+def test_shared_bucket():
+    """FileTokenBucket 프로세스 간 공유 테스트 함수"""
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with ProcessPoolExecutor(max_workers=4) as pool:
+                granted = sum(pool.map(_consume_shared, [(tmp_dir, 1)] * 20))
+
+            print("Testing FileTokenBucket...")
+            print(f"  Granted {granted}/20 requests from 4 processes sharing a 10-token bucket")
+            return granted == 10
+
+    except Exception as e:
+        print(f"Shared bucket test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_rate_limiter()
+    test_shared_bucket()
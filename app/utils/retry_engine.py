@@ -0,0 +1,312 @@
+"""
+통합 재시도 엔진
+지수 백오프 + Full Jitter, Retry-After 헤더 존중, 실행 단위 재시도 예산, 에러 분류를 한 곳에서 처리
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+
+class ErrorInfo:
+    """에러 분류 결과"""
+
+    def __init__(self, error_type: str, retryable: bool, retry_after: Optional[float] = None):
+        self.error_type = error_type
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+    def __repr__(self):
+        return f"ErrorInfo({self.error_type!r}, retryable={self.retryable}, retry_after={self.retry_after})"
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """
+    응답 헤더에서 재시도 대기 시간(초) 추출
+
+    Args:
+        headers: 'retry-after-ms' 또는 'retry-after'(초 또는 HTTP 날짜)를 가진 헤더 매핑
+
+    Returns:
+        float: 대기 시간. 없으면 None
+    """
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get('retry-after')
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _status_info(status: Optional[int], headers: Any) -> Optional[ErrorInfo]:
+    """HTTP 상태 코드 기반 분류"""
+    if status is None:
+        return None
+    if status == 429:
+        return ErrorInfo("rate_limit_exceeded", True, parse_retry_after(headers))
+    if status in (408, 409) or status >= 500:
+        return ErrorInfo("server_error", True, parse_retry_after(headers))
+    if status in (401, 403):
+        return ErrorInfo("authentication", False)
+    return ErrorInfo("client_error", False)
+
+
+def classify_error(error: BaseException) -> ErrorInfo:
+    """
+    예외를 재시도 가능 여부와 유형으로 분류
+
+    Args:
+        error (BaseException): 발생한 예외
+
+    Returns:
+        ErrorInfo: 분류 결과
+    """
+    if openai is not None:
+        if isinstance(error, openai.APITimeoutError):
+            return ErrorInfo("timeout", True)
+        if isinstance(error, openai.APIConnectionError):
+            return ErrorInfo("connection_error", True)
+        if isinstance(error, openai.APIStatusError):
+            response = getattr(error, 'response', None)
+            info = _status_info(error.status_code, response.headers if response is not None else None)
+            if info.error_type == "client_error":
+                info.error_type = "api_error"
+            return info
+        if isinstance(error, openai.APIError):
+            return ErrorInfo("api_error", True)
+
+    if isinstance(error, requests.exceptions.Timeout):
+        return ErrorInfo("timeout", True)
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return ErrorInfo("connection_error", True)
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return _status_info(error.response.status_code, error.response.headers)
+
+    return ErrorInfo("unknown", False)
+
+
+def classify_git_error(error: BaseException) -> ErrorInfo:
+    """
+    Git 명령 예외 분류 (GitPython 에러는 유형이 없어 메시지로 구분)
+
+    다른 엔진에 메시지 매칭을 쓰면 'network'가 들어간 일반 예외(예: 위키백과 DisambiguationError)까지
+    재시도하므로 git 엔진에서만 사용
+
+    Args:
+        error (BaseException): 발생한 예외
+
+    Returns:
+        ErrorInfo: 분류 결과
+    """
+    info = classify_error(error)
+    if info.error_type != "unknown":
+        return info
+
+    message = str(error).lower()
+    if any(keyword in message for keyword in ['authentication', 'permission', 'access denied']):
+        return ErrorInfo("authentication", False)
+    if any(keyword in message for keyword in ['network', 'connection', 'timeout', 'timed out', 'remote end hung up']):
+        return ErrorInfo("connection_error", True)
+    return info
+
+
+class RetryBudget:
+    """실행(run) 단위 재시도 예산 - 장애 시 재시도가 연쇄적으로 폭증하지 않도록 제한"""
+
+    def __init__(self, max_retries: int):
+        self.max_retries = max_retries
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return max(0, self.max_retries - self._used)
+
+    def try_spend(self) -> bool:
+        """재시도 1회 사용. 예산이 없으면 False"""
+        with self._lock:
+            if self._used >= self.max_retries:
+                return False
+            self._used += 1
+            return True
+
+    def reset(self):
+        """새 실행 시작 시 예산 초기화"""
+        with self._lock:
+            self._used = 0
+
+
+class RetryPolicy:
+    """재시도 정책"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 multiplier: float = 2.0, max_retry_after: float = 120.0):
+        """
+        RetryPolicy 초기화
+
+        Args:
+            max_attempts (int): 최초 시도를 포함한 최대 시도 횟수
+            base_delay (float): 백오프 기본 대기 시간
+            max_delay (float): 백오프 상한
+            multiplier (float): 지수 배수
+            max_retry_after (float): 서버가 요구한 Retry-After를 따를 최대 시간 (초과 시 포기)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """Full Jitter 지수 백오프: 0 ~ min(max_delay, base * multiplier^attempt) 사이 균등 분포"""
+        cap = min(self.max_delay, self.base_delay * (self.multiplier ** attempt))
+        return random.uniform(0, cap)
+
+
+class RetryEngine:
+    """모든 외부 호출에 공통으로 쓰는 재시도 실행기"""
+
+    def __init__(self, name: str, policy: RetryPolicy, budget: Optional[RetryBudget] = None,
+                 classifier: Callable[[BaseException], ErrorInfo] = classify_error,
+                 retry_on: Tuple[type, ...] = (), sleep: Callable[[float], None] = time.sleep):
+        """
+        RetryEngine 초기화
+
+        Args:
+            name (str): 엔진 이름 (로그용)
+            policy (RetryPolicy): 재시도 정책
+            budget (RetryBudget, optional): 공유 재시도 예산
+            classifier (Callable): 예외 분류 함수
+            retry_on (Tuple[type]): 분류와 무관하게 재시도할 예외 타입
+            sleep (Callable): 대기 함수
+        """
+        self.name = name
+        self.policy = policy
+        self.budget = budget
+        self.classifier = classifier
+        self.retry_on = retry_on
+        self._sleep = sleep
+
+    def classify(self, error: BaseException) -> ErrorInfo:
+        info = self.classifier(error)
+        if not info.retryable and self.retry_on and isinstance(error, self.retry_on):
+            info.retryable = True
+        return info
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        func를 정책에 따라 재시도하며 실행
+
+        Raises:
+            마지막 시도의 예외 (재시도 불가 에러는 즉시)
+        """
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                info = self.classify(e)
+                attempt += 1
+                label = getattr(func, '__name__', self.name)
+
+                if not info.retryable:
+                    raise
+                if attempt >= self.policy.max_attempts:
+                    logger.error(f"[RETRY] {self.name}: {label} failed after {attempt} attempts ({info.error_type}): {e}")
+                    raise
+                if info.retry_after is not None and info.retry_after > self.policy.max_retry_after:
+                    logger.error(f"[RETRY] {self.name}: server asked to wait {info.retry_after:.0f}s, giving up: {e}")
+                    raise
+                if self.budget is not None and not self.budget.try_spend():
+                    logger.error(f"[RETRY] {self.name}: run retry budget exhausted, not retrying {label}: {e}")
+                    raise
+
+                delay = self.policy.backoff(attempt - 1)
+                if info.retry_after is not None:
+                    # 서버가 지정한 시각 이후로, 동시 재시도가 몰리지 않게 지터 추가
+                    delay = info.retry_after + random.uniform(0, self.policy.base_delay)
+
+                logger.warning(f"[RETRY] {self.name}: attempt {attempt}/{self.policy.max_attempts} failed "
+                               f"({info.error_type}), retrying {label} in {delay:.1f}s: {e}")
+                self._sleep(delay)
+
+
+def test_retry_engine():
+    """RetryEngine 테스트 함수"""
+    try:
+        sleeps = []
+        budget = RetryBudget(max_retries=3)
+        engine = RetryEngine("test", RetryPolicy(max_attempts=5, base_delay=1.0),
+                             budget=budget, retry_on=(ValueError,), sleep=sleeps.append)
+
+        calls = {'count': 0}
+
+        def flaky():
+            calls['count'] += 1
+            if calls['count'] < 3:
+                raise ValueError("temporary failure")
+            return "ok"
+
+        print("Testing RetryEngine...")
+        print(f"  Flaky call result: {engine.call(flaky)} after {calls['count']} attempts")
+        print(f"  Jittered sleeps: {[round(s, 2) for s in sleeps]}")
+
+        def always_fails():
+            raise ValueError("still failing")
+
+        try:
+            engine.call(always_fails)
+        except ValueError:
+            print(f"  Budget remaining after exhaustion: {budget.remaining}")
+
+        print(f"  Retry-After parsing: {parse_retry_after({'retry-after': '7'})}s")
+        print(f"  Unknown errors are not retried: {not classify_error(KeyError('x')).retryable}")
+
+        # 메시지 매칭은 git 엔진에서만
+        message_error = Exception("'AI network' may refer to: Neural network")
+        generic, git = classify_error(message_error), classify_git_error(message_error)
+        print(f"  Message-only error: generic {generic}, git {git}")
+
+        return (calls['count'] == 3 and budget.remaining == 0
+                and not generic.retryable and git.error_type == "connection_error")
+
+    except Exception as e:
+        print(f"RetryEngine test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_retry_engine()
@@ -0,0 +1,138 @@
+"""
+요청 병합(Single-flight) 모듈
+동일한 키에 대한 동시 호출을 하나의 실제 호출로 합치고 결과를 공유
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    """진행 중인 단일 호출 상태"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """동일 키의 동시 요청을 하나로 병합하는 그룹"""
+
+    def __init__(self, name: str = "default", copy_results: bool = False):
+        """
+        SingleFlight 초기화
+
+        Args:
+            name (str): 그룹 이름 (로그/통계용)
+            copy_results (bool): True면 대기자에게 결과의 깊은 복사본을 반환
+        """
+        self.name = name
+        self.copy_results = copy_results
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self.stats = {'executed': 0, 'shared': 0}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        키에 대한 호출 실행. 같은 키의 호출이 진행 중이면 그 결과를 기다려 공유
+
+        Args:
+            key (Hashable): 요청 식별 키
+            func (Callable): 실제로 실행할 함수
+
+        Returns:
+            Any: func의 반환값 (대기자는 리더의 결과를 공유)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self.stats['executed'] += 1
+            else:
+                call.waiters += 1
+                self.stats['shared'] += 1
+
+        if not is_leader:
+            logger.debug(f"[SINGLE-FLIGHT] {self.name}: joining in-flight call for {key!r}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result) if self.copy_results else call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+            if call.waiters:
+                logger.info(f"[SINGLE-FLIGHT] {self.name}: shared one call for {key!r} with {call.waiters} waiter(s)")
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 호출 수"""
+        with self._lock:
+            return len(self._calls)
+
+
+# 프로세스 전역 그룹 레지스트리
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_flight_group(name: str, copy_results: bool = False) -> SingleFlight:
+    """이름별 프로세스 전역 SingleFlight 그룹 반환 (없으면 생성)"""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name, copy_results=copy_results)
+            _groups[name] = group
+        return group
+
+
+def test_single_flight():
+    """SingleFlight 테스트 함수"""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        group = SingleFlight("test", copy_results=True)
+        executions = []
+
+        def slow_fetch(value):
+            executions.append(value)
+            time.sleep(0.2)
+            return {'value': value}
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(group.do, 'same-key', slow_fetch, 42) for _ in range(5)]
+            results = [f.result() for f in futures]
+
+        print("Testing SingleFlight...")
+        print(f"  Real executions: {len(executions)} (expected 1)")
+        print(f"  Results shared: {all(r == {'value': 42} for r in results)}")
+        print(f"  Stats: {group.stats}")
+
+        return len(executions) == 1
+
+    except Exception as e:
+        print(f"SingleFlight test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_single_flight()
@@ -0,0 +1,228 @@
+"""
+슬러그 모듈
+제목 → URL 슬러그 변환(메모이제이션)과 기존 포스트 파일명 인덱스, 파일명 원자적 예약 (OpenAI/SEO 생성기 의존 없음)
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from unidecode import unidecode
+
+try:
+    from .client_registry import get_client
+except ImportError:
+    from client_registry import get_client
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAX_SLUG_LENGTH = 50
+DEFAULT_SLUG = "blog-post"
+
+# Jekyll 포스트 파일명: YYYY-MM-DD-<slug>.md
+_POST_FILENAME_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})-(.+)\.md$')
+
+# 예약용 임시 파일 (점으로 시작해 Jekyll이 무시) 및 비정상 종료로 남은 임시 파일을 지울 기준 시간(초)
+_TEMP_PREFIX = ".reserve-"
+_TEMP_SUFFIX = ".tmp"
+STALE_TEMP_SECONDS = 3600
+
+
+@lru_cache(maxsize=4096)
+def transliterate(text: str) -> str:
+    """한글 등 비 ASCII 문자를 영문으로 음역 (같은 입력은 캐시)"""
+    return unidecode(text)
+
+
+@lru_cache(maxsize=4096)
+def slugify(title: str, max_length: int = MAX_SLUG_LENGTH) -> str:
+    """
+    제목을 SEO 친화적인 URL 슬러그로 변환
+
+    Args:
+        title (str): 원본 제목
+        max_length (int): 최대 길이 (단어 경계에서 자름)
+
+    Returns:
+        str: 슬러그 (빈 결과면 "blog-post")
+    """
+    slug = transliterate(title).lower()
+    slug = re.sub(r'[^\w\s-]', '', slug)  # 알파벳, 숫자, 공백, 하이픈만 유지
+    slug = re.sub(r'[\s_]+', '-', slug)   # 공백과 언더스코어를 하이픈으로
+    slug = re.sub(r'-+', '-', slug).strip('-')
+
+    if len(slug) > max_length:
+        slug = slug[:max_length]
+        last_dash = slug.rfind('-')
+        if last_dash > 20:  # 너무 짧아지지 않도록
+            slug = slug[:last_dash]
+        slug = slug.strip('-')
+
+    return slug or DEFAULT_SLUG
+
+
+class SlugIndex:
+    """포스트 디렉터리의 파일명 인덱스 (한 번 로드 후 메모리에서 충돌 확인)"""
+
+    def __init__(self, posts_dir: Path):
+        """
+        SlugIndex 초기화
+
+        Args:
+            posts_dir (Path): Jekyll _posts 디렉터리
+        """
+        self.posts_dir = Path(posts_dir)
+        self.filenames: Set[str] = set()
+        self.slugs: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+        if self.posts_dir.exists():
+            for entry in os.scandir(self.posts_dir):
+                if entry.name.startswith(_TEMP_PREFIX):
+                    self._remove_stale_temp(entry)
+                else:
+                    self._add(entry.name)
+        logger.info(f"Slug index loaded: {len(self.filenames)} posts in {self.posts_dir}")
+
+    @staticmethod
+    def _remove_stale_temp(entry: os.DirEntry):
+        """비정상 종료로 남은 예약 임시 파일 삭제 (다른 프로세스가 쓰는 중일 수 있는 최근 파일은 둠)"""
+        try:
+            if time.time() - entry.stat().st_mtime > STALE_TEMP_SECONDS:
+                os.unlink(entry.path)
+                logger.warning(f"Removed orphaned reservation temp file: {entry.name}")
+        except OSError:
+            pass
+
+    def _add(self, filename: str):
+        self.filenames.add(filename)
+        match = _POST_FILENAME_RE.match(filename)
+        if match:
+            self.slugs.setdefault(match.group(2), set()).add(match.group(1))
+
+    def _discard(self, filename: str):
+        self.filenames.discard(filename)
+        match = _POST_FILENAME_RE.match(filename)
+        if match and match.group(2) in self.slugs:
+            self.slugs[match.group(2)].discard(match.group(1))
+
+    def exists(self, slug: str, date: Optional[datetime] = None) -> bool:
+        """슬러그가 이미 쓰였는지 (date가 있으면 같은 날짜 기준)"""
+        with self._lock:
+            dates = self.slugs.get(slug, set())
+            return bool(dates) if date is None else date.strftime('%Y-%m-%d') in dates
+
+    def reserve(self, title: str, date: Optional[datetime] = None, content: str = "") -> Path:
+        """
+        제목의 포스트 파일명을 원자적으로 예약하며 내용 기록
+
+        같은 디렉터리의 임시 파일에 내용을 모두 쓴 뒤 os.link로 최종 이름에 연결하므로,
+        중간에 죽어도 빈/반쪽 포스트가 _posts에 남지 않음 (남는 것은 점으로 시작하는 임시 파일뿐이며 다음 시작 시 정리).
+        같은 날짜에 같은 슬러그가 있으면 -2, -3 ... 을 붙이며, 이미 있는 이름으로는 링크가 실패하므로
+        여러 프로세스가 동시에 발행해도 같은 파일을 얻지 않음
+
+        Args:
+            title (str): 글 제목
+            date (datetime, optional): 발행 날짜. None이면 현재 시각
+            content (str): 포스트 전체 내용
+
+        Returns:
+            Path: 예약된 파일 경로
+        """
+        date_str = (date or datetime.now()).strftime('%Y-%m-%d')
+        base = f"{date_str}-{slugify(title)}"
+        self.posts_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.posts_dir, prefix=_TEMP_PREFIX, suffix=_TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.chmod(temp_path, 0o644)
+
+            with self._lock:
+                suffix = 1
+                while True:
+                    filename = f"{base}.md" if suffix == 1 else f"{base}-{suffix}.md"
+                    suffix += 1
+                    if filename in self.filenames:
+                        continue
+                    try:
+                        os.link(temp_path, self.posts_dir / filename)
+                    except FileExistsError:
+                        # 다른 프로세스가 먼저 만든 파일
+                        self._add(filename)
+                        continue
+                    self._add(filename)
+                    if suffix > 2:
+                        logger.warning(f"Slug collision for '{title}', reserved {filename}")
+                    return self.posts_dir / filename
+        finally:
+            os.unlink(temp_path)
+
+    def release(self, path: Path):
+        """예약 취소 (이후 단계 실패 시 저장한 파일 삭제)"""
+        path = Path(path)
+        with self._lock:
+            self._discard(path.name)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def get_slug_index(posts_dir: Path) -> SlugIndex:
+    """디렉터리별 프로세스 공유 슬러그 인덱스"""
+    posts_dir = Path(posts_dir).resolve()
+    return get_client(f'slug_index:{posts_dir}', lambda: SlugIndex(posts_dir))
+
+
+def test_slug():
+    """슬러그 모듈 테스트 함수"""
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        print("Testing slug module...")
+        for title in ["2024년 최고의 생산성 앱 10선", "Hello, World!", "", "A" * 80]:
+            print(f"  '{title[:30]}' -> '{slugify(title)}'")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            posts_dir = Path(tmp_dir)
+            (posts_dir / "2025-01-01-hello-world.md").write_text("existing", encoding='utf-8')
+            orphan = posts_dir / f"{_TEMP_PREFIX}orphan{_TEMP_SUFFIX}"
+            orphan.write_text("", encoding='utf-8')
+            os.utime(orphan, (0, 0))
+            index = SlugIndex(posts_dir)
+            date = datetime(2025, 1, 1)
+
+            # 동시에 같은 제목 예약 (인덱스 두 개 = 별도 프로세스 흉내)
+            other_index = SlugIndex(posts_dir)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                paths = list(pool.map(
+                    lambda i: (index if i % 2 else other_index).reserve("Hello, World!", date, f"post {i}"), range(8)))
+            names = sorted(path.name for path in paths)
+            print(f"  Reserved: {names[:3]} ... ({len(set(names))} unique)")
+
+            index.release(paths[0])
+            leftovers = [path.name for path in posts_dir.iterdir() if path.name.startswith(_TEMP_PREFIX)]
+            return (len(set(names)) == 8 and "2025-01-01-hello-world.md" not in names
+                    and all(path.read_text(encoding='utf-8').startswith("post ") for path in paths[1:])
+                    and not leftovers and slugify("") == DEFAULT_SLUG and not paths[0].exists())
+
+    except Exception as e:
+        print(f"Slug test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_slug()
@@ -0,0 +1,208 @@
+"""
+제목 유사도 인덱스 모듈
+difflib 비율을 모든 제목과 계산하지 않고, 길이 필터 → 문자 빈도 상한(quick_ratio) → 비트 병렬 LCS 상한으로
+후보를 줄인 뒤 남은 제목만 정확히 계산 (세 상한 모두 SequenceMatcher 비율 이상이므로 판정은 전체 비교와 같음)
+"""
+
+import difflib
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 비트 병렬 LCS 상한을 계산할 수 있는 최대 제목 길이 (uint64 한 워드)
+MAX_LCS_LENGTH = 64
+
+
+def title_ratio(norm_title1: str, norm_title2: str) -> float:
+    """정규화된 두 제목의 유사도 (완전 동일하면 1.0, 그 외 SequenceMatcher 비율)"""
+    if norm_title1 == norm_title2:
+        return 1.0
+    return difflib.SequenceMatcher(None, norm_title1, norm_title2).ratio()
+
+
+def length_range(length: int, threshold: float) -> Tuple[int, int]:
+    """
+    임계값 이상이 될 수 있는 상대 제목 길이 범위
+
+    비율은 2 * 일치 문자 수 / 길이 합이고 일치 문자 수는 짧은 쪽 길이를 넘지 않으므로,
+    길이 차이가 크면 계산 없이 제외 가능 (경계는 넉넉하게 잡음)
+
+    Args:
+        length (int): 새 제목 길이
+        threshold (float): 유사도 임계값 (0 초과)
+
+    Returns:
+        Tuple[int, int]: (최소 길이, 최대 길이) 포함 범위
+    """
+    return int(length * threshold / (2 - threshold)), int(length * (2 - threshold) / threshold) + 1
+
+
+def _ratio(matches: np.ndarray, total: np.ndarray) -> np.ndarray:
+    """difflib과 같은 식 (2 * 일치 / 길이 합, 길이 합이 0이면 1.0)"""
+    return np.where(total > 0, 2.0 * matches / np.maximum(total, 1), 1.0)
+
+
+class TitleSimilarityIndex:
+    """정규화된 제목 목록의 유사도 검색 인덱스 (길이순 정렬 + 문자별 역색인)"""
+
+    def __init__(self, titles: List[str]):
+        """
+        TitleSimilarityIndex 초기화
+
+        Args:
+            titles (List[str]): 정규화된 제목 목록 (결과는 이 목록의 위치로 반환)
+        """
+        self.titles = titles
+        # 길이순으로 재배치해 길이 범위가 연속 구간이 되게 함
+        self.order = np.argsort(np.fromiter((len(title) for title in titles), dtype=np.int64, count=len(titles)),
+                                kind='stable')
+        self.lengths = np.array([len(titles[i]) for i in self.order], dtype=np.int64)
+
+        # 문자 → (정렬 위치, 해당 제목의 문자 수, 문자가 나오는 자리 비트마스크 - 64자 초과 제목은 0)
+        positions: Dict[str, List[int]] = {}
+        counts: Dict[str, List[int]] = {}
+        masks: Dict[str, List[int]] = {}
+        for position, index in enumerate(self.order):
+            title = titles[index]
+            title_masks: Dict[str, int] = {}
+            if len(title) <= MAX_LCS_LENGTH:
+                for bit, char in enumerate(title):
+                    title_masks[char] = title_masks.get(char, 0) | (1 << bit)
+            for char, count in Counter(title).items():
+                positions.setdefault(char, []).append(position)
+                counts.setdefault(char, []).append(count)
+                masks.setdefault(char, []).append(title_masks.get(char, 0))
+        self.postings = {
+            char: (np.array(positions[char], dtype=np.int64), np.array(counts[char], dtype=np.int64),
+                   np.array(masks[char], dtype=np.uint64))
+            for char in positions
+        }
+
+    def upper_bounds(self, query: str, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        길이 범위 안 제목들의 유사도 상한 (SequenceMatcher.quick_ratio와 같은 값)
+
+        Args:
+            query (str): 정규화된 새 제목
+            threshold (float): 유사도 임계값
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (정렬 위치, 상한)
+        """
+        min_length, max_length = length_range(len(query), threshold)
+        start = int(np.searchsorted(self.lengths, min_length, side='left'))
+        end = int(np.searchsorted(self.lengths, max_length, side='right'))
+        if start >= end:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        # 공통 문자 수 = 문자별 min(새 제목 개수, 기존 제목 개수)의 합
+        intersection = np.zeros(end - start, dtype=np.int64)
+        for char, query_count in Counter(query).items():
+            posting = self.postings.get(char)
+            if posting is None:
+                continue
+            positions, counts, _ = posting
+            lo, hi = np.searchsorted(positions, [start, end])
+            intersection[positions[lo:hi] - start] += np.minimum(counts[lo:hi], query_count)
+
+        return np.arange(start, end), _ratio(intersection, self.lengths[start:end] + len(query))
+
+    def lcs_bounds(self, query: str, candidates: np.ndarray) -> np.ndarray:
+        """
+        후보 제목들의 LCS 기반 유사도 상한 (비트 병렬 LCS를 후보 전체에 벡터 연산으로 계산)
+
+        SequenceMatcher의 일치 블록들은 공통 부분 수열이므로 일치 문자 수는 LCS 길이를 넘지 않음.
+        64자를 넘는 후보는 LCS를 계산하지 않고 1.0(제외하지 않음)
+
+        Args:
+            query (str): 정규화된 새 제목
+            candidates (np.ndarray): 정렬 위치
+
+        Returns:
+            np.ndarray: 후보별 상한
+        """
+        lengths = self.lengths[candidates]
+        match_masks: Dict[str, np.ndarray] = {}
+        for char in set(query):
+            mask = np.zeros(len(candidates), dtype=np.uint64)
+            posting = self.postings.get(char)
+            if posting is not None:
+                positions, _, masks = posting
+                found = np.minimum(np.searchsorted(positions, candidates), len(positions) - 1)
+                hit = positions[found] == candidates
+                mask[hit] = masks[found[hit]]
+            match_masks[char] = mask
+
+        # Hyyrö 비트 병렬 LCS: V의 하위 m비트 중 0의 개수 = LCS 길이 (uint64 덧셈 자리올림은 버려도 무방)
+        v = np.full(len(candidates), np.iinfo(np.uint64).max, dtype=np.uint64)
+        for char in query:
+            u = v & match_masks[char]
+            v = (v + u) | (v - u)
+        low_bits = np.where(lengths >= MAX_LCS_LENGTH, np.iinfo(np.uint64).max,
+                            (np.uint64(1) << np.minimum(lengths, MAX_LCS_LENGTH - 1).astype(np.uint64)) - np.uint64(1))
+        lcs = np.bitwise_count(~v & low_bits).astype(np.int64)
+        return np.where(lengths > MAX_LCS_LENGTH, 1.0, _ratio(lcs, lengths + len(query)))
+
+    def find_similar(self, query: str, threshold: float) -> Optional[Tuple[int, float]]:
+        """
+        임계값 이상으로 유사한 제목 찾기 (모든 제목에 title_ratio를 계산한 것과 같은 판정)
+
+        Args:
+            query (str): 정규화된 새 제목
+            threshold (float): 유사도 임계값
+
+        Returns:
+            Optional[Tuple[int, float]]: (제목 목록 위치, 유사도) 또는 None
+        """
+        candidates, bounds = self.upper_bounds(query, threshold)
+        keep = bounds >= threshold
+        candidates, bounds = candidates[keep], bounds[keep]
+        if len(candidates):
+            bounds = np.minimum(bounds, self.lcs_bounds(query, candidates))
+            keep = bounds >= threshold
+            candidates, bounds = candidates[keep], bounds[keep]
+
+        # 상한이 높은 후보부터 정확히 계산 (중복일 가능성이 높은 순)
+        for position in candidates[np.argsort(-bounds, kind='stable')]:
+            index = int(self.order[position])
+            similarity = title_ratio(query, self.titles[index])
+            if similarity >= threshold:
+                return index, similarity
+        return None
+
+
+def test_title_similarity():
+    """TitleSimilarityIndex 테스트 함수"""
+    try:
+        titles = ["the future of artificial intelligence", "best practices for remote work",
+                  "5g technology impact on iot devices", "sustainable technology trends", ""]
+        index = TitleSimilarityIndex(titles)
+        print("Testing TitleSimilarityIndex...")
+
+        queries = ["the future of artificial intelligence in 2025", "sustainable tech trends",
+                   "complete guide to machine learning", ""]
+        results = []
+        for query in queries:
+            found = index.find_similar(query, 0.7)
+            expected = any(title_ratio(query, title) >= 0.7 for title in titles)
+            results.append((found is not None) == expected)
+            print(f"  '{query}' -> " + (f"'{titles[found[0]]}' ({found[1]:.2f})" if found else "no match"))
+
+        # 공통 3-gram이 없어도 비율이 높을 수 있음 (문자 단위 상한을 쓰는 이유)
+        gap = TitleSimilarityIndex(["abcd"]).find_similar("abxcd", 0.7)
+        return all(results) and gap is not None and gap[1] > 0.85
+
+    except Exception as e:
+        print(f"TitleSimilarityIndex test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_title_similarity()
@@ -0,0 +1,160 @@
+"""
+토큰 수 추정 모듈
+LLM 호출 전 프롬프트 크기를 로컬에서 추정 (tiktoken이 있으면 정확한 계산, 없으면 문자 유형별 근사)
+"""
+
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:
+    # 선택적 의존성: 없으면 근사 추정 사용
+    tiktoken = None
+
+# 메시지 하나당 역할/구분자 오버헤드, 응답 시작 프라이밍
+TOKENS_PER_MESSAGE = 4
+REPLY_PRIMING_TOKENS = 3
+
+# 근사 추정용 토큰 조각 패턴: 영문 단어, 숫자, 한글 연속, CJK 문자, 기호 연속
+_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[가-힣]+|[぀-ヿ一-鿿]|[^\sA-Za-z\d가-힣぀-ヿ一-鿿]+")
+
+_encoder: Optional[Any] = None
+
+
+def _get_encoder():
+    """tiktoken 인코더 (gpt-4o/gpt-5 계열 o200k_base, 한 번만 로드)"""
+    global _encoder
+    if _encoder is None and tiktoken is not None:
+        try:
+            _encoder = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken encoder unavailable, using approximate token counts: {e}")
+    return _encoder
+
+
+def _approximate_tokens(text: str) -> int:
+    """문자 유형별 근사 토큰 수 (실제보다 약간 많게 잡는 쪽으로 보수적)"""
+    tokens = 0.0
+    for piece in _PIECE_RE.findall(text):
+        first = piece[0]
+        if first.isascii() and first.isalpha():
+            tokens += max(1, math.ceil(len(piece) / 4))
+        elif first.isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        elif '가' <= first <= '힣':
+            # 한글은 음절 약 1.5자당 1토큰
+            tokens += max(1, math.ceil(len(piece) / 1.5))
+        elif len(piece) == 1 and ('぀' <= first <= 'ヿ' or '一' <= first <= '鿿'):
+            tokens += 1
+        else:
+            tokens += math.ceil(len(piece) / 2)
+    return int(tokens)
+
+
+def count_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 추정
+
+    Args:
+        text (str): 대상 텍스트
+
+    Returns:
+        int: 토큰 수
+    """
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    return _approximate_tokens(text)
+
+
+def count_message_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    채팅 메시지 목록의 입력 토큰 수 추정
+
+    Args:
+        messages (List[Dict]): 채팅 메시지
+
+    Returns:
+        int: 입력 토큰 수
+    """
+    return sum(count_tokens(str(message.get('content') or '')) + TOKENS_PER_MESSAGE
+               for message in messages) + REPLY_PRIMING_TOKENS
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    토큰 예산에 맞게 텍스트를 앞에서부터 유지하며 자름 (가능하면 줄 단위)
+
+    Args:
+        text (str): 대상 텍스트
+        max_tokens (int): 최대 토큰 수
+
+    Returns:
+        str: 잘린 텍스트
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # 줄 단위 이진 탐색
+    lines = text.split('\n')
+    low, high = 0, len(lines)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens('\n'.join(lines[:mid])) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    if low > 0:
+        return '\n'.join(lines[:low])
+
+    # 첫 줄조차 넘치면 글자 단위로 자름
+    first_line = lines[0]
+    low, high = 0, len(first_line)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(first_line[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return first_line[:low]
+
+
+def test_token_counter():
+    """토큰 카운터 테스트 함수"""
+    try:
+        english = "Large language models are transforming how we write software."
+        korean = "대규모 언어 모델은 소프트웨어 개발 방식을 바꾸고 있습니다."
+        research = "\n".join(f"- Fact {i}: 인공지능 연구 동향 {i}" for i in range(50))
+
+        print("Testing token counter...")
+        print(f"  Using tiktoken: {_get_encoder() is not None}")
+        print(f"  English ({len(english)} chars): {count_tokens(english)} tokens")
+        print(f"  Korean ({len(korean)} chars): {count_tokens(korean)} tokens")
+
+        messages = [{'role': 'system', 'content': english}, {'role': 'user', 'content': korean}]
+        print(f"  Messages: {count_message_tokens(messages)} tokens")
+
+        trimmed = truncate_to_tokens(research, 100)
+        print(f"  Truncated research: {count_tokens(research)} -> {count_tokens(trimmed)} tokens")
+
+        return 0 < count_tokens(trimmed) <= 100 and research.startswith(trimmed)
+
+    except Exception as e:
+        print(f"Token counter test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 테스트
+    test_token_counter()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Front Matter 코덱 벤치마크
+임시 디렉터리에 합성 포스트 코퍼스를 만들고, 기존 방식(파일 전체 읽기 + 순수 Python yaml.safe_load)과
+공용 코덱(헤더만 읽기 + libyaml C 로더)의 처리량(posts/s)을 비교
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+# 프로젝트 루트를 파이썬 패스에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from app.utils.front_matter import Loader, read_front_matter, render_post
+except ImportError:
+    print("[ERROR] Failed to import AutoBlog modules. Run from project root.")
+    sys.exit(1)
+
+
+def build_corpus(posts_dir: Path, count: int, body_paragraphs: int):
+    """합성 포스트 생성 (실제 포스트와 같은 Front Matter 구조)"""
+    paragraph = ("Remote work productivity depends on clear routines and the right collaboration tools. "
+                 "원격 근무 생산성은 명확한 루틴과 협업 도구에 달려 있습니다.\n\n")
+    body = "# Synthetic Post\n\n" + paragraph * body_paragraphs
+    for i in range(count):
+        data = {
+            'layout': 'post',
+            'title': f'Synthetic post {i}: 원격 근무 가이드',
+            'date': f'2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 09:00:00 +0900',
+            'author': 'AutoBlog',
+            'categories': ['productivity'],
+            'tags': ['remote work', 'productivity', f'tag-{i % 50}'],
+        }
+        (posts_dir / f"2025-01-01-synthetic-{i}.md").write_text(render_post(data, body), encoding='utf-8')
+
+
+def legacy_read(path: Path) -> dict:
+    """기존 방식: 파일 전체를 읽고 순수 Python 로더로 파싱"""
+    content = path.read_text(encoding='utf-8')
+    return yaml.safe_load(content.split('---', 2)[1]) or {}
+
+
+def measure(label: str, reader, paths) -> float:
+    start = time.perf_counter()
+    titles = sum(1 for path in paths if reader(path).get('title'))
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed
+    print(f"{label:<34} {elapsed:8.2f}s {rate:12,.0f} posts/s  ({titles} titles)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark front matter parsing over a synthetic corpus')
+    parser.add_argument('--count', type=int, default=50000, help='Number of synthetic posts')
+    parser.add_argument('--body-paragraphs', type=int, default=40, help='Body paragraphs per post')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        posts_dir = Path(tmp_dir)
+        print(f"Building {args.count} synthetic posts...")
+        build_corpus(posts_dir, args.count, args.body_paragraphs)
+        paths = sorted(posts_dir.glob('*.md'))
+
+        print(f"libyaml C loader available: {Loader is not yaml.SafeLoader}")
+        baseline = measure("full read + yaml.safe_load", legacy_read, paths)
+        codec = measure("header-only read + codec loader", read_front_matter, paths)
+        print(f"[OK] Speedup: {codec / baseline:.1f}x")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
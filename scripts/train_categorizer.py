@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+카테고리 분류 모델 학습 스크립트
+site/_posts Front Matter의 첫 번째 카테고리로 나이브 베이즈 분류기를 학습해 모델 파일로 저장
+--predict: 저장된 모델로 모든 포스트를 일괄 분류 (백필 확인용)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 패스에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from app.config import Config
+    from app.generators.category_model import NaiveBayesCategorizer, load_labeled_posts
+except ImportError:
+    print("[ERROR] Failed to import AutoBlog modules. Run from project root.")
+    sys.exit(1)
+
+
+def train(posts_dir: Path, model_path: Path, alpha: float) -> bool:
+    """학습 후 저장, 학습 데이터 정확도 출력"""
+    documents, labels = load_labeled_posts(posts_dir)
+    if len(set(labels)) < 2:
+        print(f"[ERROR] Need posts from at least 2 categories, found {len(documents)} posts in {len(set(labels))}")
+        return False
+
+    model = NaiveBayesCategorizer(alpha=alpha).fit(documents, labels)
+    model.save(model_path)
+
+    predictions = model.predict_batch(documents)
+    correct = sum(1 for (label, _), actual in zip(predictions, labels) if label == actual)
+    print(f"[OK] Trained on {len(documents)} posts, {len(model.classes)} categories: {', '.join(model.classes)}")
+    print(f"[OK] Training accuracy: {correct}/{len(documents)}")
+    print(f"[OK] Model saved to {model_path}")
+    return True
+
+
+def predict(posts_dir: Path, model_path: Path) -> bool:
+    """저장된 모델로 모든 포스트 일괄 분류"""
+    if not model_path.exists():
+        print(f"[ERROR] Model not found: {model_path}. Train it first.")
+        return False
+
+    model = NaiveBayesCategorizer.load(model_path)
+    paths = sorted(posts_dir.glob('*.md'))
+    documents = [path.read_text(encoding='utf-8') for path in paths]
+    for path, (label, probability) in zip(paths, model.predict_batch(documents)):
+        print(f"{label:<20} {probability:5.2f}  {path.name}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the post category classifier from site/_posts')
+    parser.add_argument('--posts-dir', type=Path, default=Config.POSTS_DIR, help='Posts directory')
+    parser.add_argument('--model', type=Path, default=Config.CATEGORY_MODEL_PATH, help='Model file path')
+    parser.add_argument('--alpha', type=float, default=0.5, help='Laplace smoothing')
+    parser.add_argument('--predict', action='store_true', help='Batch-classify all posts with the saved model')
+    args = parser.parse_args()
+
+    if args.predict:
+        return predict(args.posts_dir, args.model)
+    return train(args.posts_dir, args.model, args.alpha)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
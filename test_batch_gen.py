@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Batch API 생성 테스트 - 로컬 대체(stand-in) Batch 엔드포인트로 제출/폴링/결과 수집 검증
+실제 OpenAI API 키 없이 실행 가능
+"""
+
+import json
+import re
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import openai
+from openai import OpenAI
+
+from app.generators.batch_gen import BatchGenerator
+from app.generators.content_gen import ContentGenerator
+from app.generators.response_cache import LLMResponseCache
+from app.utils.retry_engine import RetryEngine, RetryPolicy
+
+
+class StandInBatchAPI:
+    """Files/Batches 엔드포인트를 흉내 내는 로컬 서버 상태"""
+
+    def __init__(self, fail_ids=(), fail_batch_create=False, stall=False):
+        self.files = {}
+        self.batches = {}
+        self.polls = {}
+        self.fail_ids = set(fail_ids)
+        self.fail_batch_create = fail_batch_create
+        self.stall = stall
+        self.batch_create_calls = 0
+        self.cancelled = []
+        self.lock = threading.RLock()
+
+    def add_file(self, content: str) -> dict:
+        with self.lock:
+            file_id = f"file-{len(self.files) + 1}"
+            self.files[file_id] = content
+        return {'id': file_id, 'object': 'file', 'bytes': len(content), 'created_at': 0,
+                'filename': f"{file_id}.jsonl", 'purpose': 'batch', 'status': 'processed'}
+
+    def run_batch(self, batch: dict):
+        """입력 파일의 각 요청에 대해 결과/에러 파일 생성"""
+        outputs, errors = [], []
+        for line in self.files[batch['input_file_id']].splitlines():
+            request = json.loads(line)
+            custom_id = request['custom_id']
+            if custom_id in self.fail_ids:
+                errors.append({'custom_id': custom_id, 'response': None,
+                               'error': {'code': 'server_error', 'message': 'stand-in failure'}})
+                continue
+            title = re.search(r'^- title: (.+)$', request['body']['messages'][-1]['content'], re.MULTILINE).group(1)
+            content = f"# {title}\n\n## 개요\n\n본문입니다.\n\n## 정리\n\n끝."
+            outputs.append({'custom_id': custom_id, 'error': None, 'response': {
+                'status_code': 200,
+                'body': {'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}}]}
+            }})
+        batch['output_file_id'] = self.add_file('\n'.join(json.dumps(o, ensure_ascii=False) for o in outputs))['id']
+        if errors:
+            batch['error_file_id'] = self.add_file('\n'.join(json.dumps(e) for e in errors))['id']
+        batch['status'] = 'completed'
+
+
+def make_handler(api: StandInBatchAPI):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, payload, status=200, raw=False):
+            body = payload.encode('utf-8') if raw else json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/octet-stream' if raw else 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.path == '/v1/files':
+                # multipart 본문에서 JSONL 줄만 추출
+                lines = [line for line in body.decode('utf-8').splitlines() if line.startswith('{"custom_id"')]
+                self._send(api.add_file('\n'.join(lines)))
+            elif self.path == '/v1/batches' and api.fail_batch_create:
+                with api.lock:
+                    api.batch_create_calls += 1
+                self._send({'error': {'message': 'stand-in server error', 'type': 'server_error'}}, status=500)
+            elif self.path.startswith('/v1/batches/') and self.path.endswith('/cancel'):
+                batch_id = self.path.split('/')[3]
+                with api.lock:
+                    api.cancelled.append(batch_id)
+                    api.batches[batch_id]['status'] = 'cancelled'
+                self._send(api.batches[batch_id])
+            elif self.path == '/v1/batches':
+                request = json.loads(body)
+                with api.lock:
+                    batch_id = f"batch-{len(api.batches) + 1}"
+                    api.batches[batch_id] = {
+                        'id': batch_id, 'object': 'batch', 'endpoint': request['endpoint'],
+                        'input_file_id': request['input_file_id'], 'completion_window': request['completion_window'],
+                        'status': 'validating', 'created_at': 0, 'output_file_id': None, 'error_file_id': None,
+                        'request_counts': {'total': 0, 'completed': 0, 'failed': 0}
+                    }
+                    api.polls[batch_id] = 0
+                self._send(api.batches[batch_id])
+            else:
+                self._send({'error': {'message': 'not found'}}, status=404)
+
+        def do_GET(self):
+            parts = self.path.strip('/').split('/')
+            if parts[:2] == ['v1', 'batches'] and len(parts) == 3:
+                batch = api.batches[parts[2]]
+                with api.lock:
+                    api.polls[parts[2]] += 1
+                    # 두 번째 폴링에서 완료 처리
+                    if api.polls[parts[2]] == 1 or api.stall:
+                        batch['status'] = 'in_progress'
+                    elif batch['status'] != 'completed':
+                        api.run_batch(batch)
+                self._send(batch)
+            elif parts[:2] == ['v1', 'files'] and len(parts) == 4 and parts[3] == 'content':
+                self._send(api.files[parts[2]], raw=True)
+            else:
+                self._send({'error': {'message': 'not found'}}, status=404)
+
+    return Handler
+
+
+@contextmanager
+def stand_in_generator(api: StandInBatchAPI, timeout: float = 10):
+    """로컬 Batch 엔드포인트에 연결된 BatchGenerator (재시도 대기 없음)"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(api))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        client = OpenAI(api_key='test-key', base_url=f"http://127.0.0.1:{server.server_port}/v1", max_retries=0)
+        generator = ContentGenerator(api_key='test-key', client=client,
+                                     response_cache=LLMResponseCache(mode='off'))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            batch_generator = BatchGenerator(generator, batch_dir=Path(tmp_dir), poll_interval=0.01, timeout=timeout)
+            batch_generator.retry_engine = RetryEngine('openai', RetryPolicy(max_attempts=3), sleep=lambda _: None)
+            yield batch_generator
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+TOPICS = [
+    {'title': '원격 근무 생산성 가이드', 'post_type': 'guide', 'keywords': ['원격 근무']},
+    {'title': '개발자 필수 도구 10선', 'post_type': 'listicle', 'keywords': ['개발 도구']},
+    {'title': 'AI 글쓰기 도구 비교', 'post_type': 'guide', 'keywords': ['AI']},
+]
+
+
+def run_batch_roundtrip():
+    """로컬 Batch 엔드포인트로 전체 흐름 실행 후 (결과, 서버 상태) 반환"""
+    api = StandInBatchAPI(fail_ids={'post-1'})
+    with stand_in_generator(api) as batch_generator:
+        contents = batch_generator.generate_posts(TOPICS)
+    return contents, api
+
+
+def test_batch_roundtrip():
+    """배치 제출 → 폴링 → 결과 수집"""
+    contents, api = run_batch_roundtrip()
+
+    assert contents['원격 근무 생산성 가이드'].startswith('# 원격 근무 생산성 가이드')
+    assert contents['AI 글쓰기 도구 비교'].startswith('# AI 글쓰기 도구 비교')
+    # 실패한 요청은 None으로 반환되어 실시간 생성으로 대체됨
+    assert contents['개발자 필수 도구 10선'] is None
+
+    # 제출된 배치 입력은 Chat Completions 요청 형식
+    submitted = [json.loads(line) for line in api.files['file-1'].splitlines()]
+    assert len(submitted) == 3
+    assert all(line['url'] == '/v1/chat/completions' and line['body']['model'] for line in submitted)
+    assert api.polls['batch-1'] >= 2
+
+
+def test_batch_server_error():
+    """/v1/batches가 500을 반환하면 재시도 후 예외 (파이프라인은 이를 잡아 실시간 생성으로 대체)"""
+    api = StandInBatchAPI(fail_batch_create=True)
+    with stand_in_generator(api) as batch_generator:
+        try:
+            batch_generator.generate_posts(TOPICS)
+        except openai.InternalServerError:
+            pass
+        else:
+            raise AssertionError("batch creation error was swallowed")
+
+    assert api.batch_create_calls == 3
+    assert not api.batches
+
+
+def test_batch_timeout_cancels():
+    """최대 대기 시간을 넘기면 배치를 취소한 뒤 TimeoutError"""
+    api = StandInBatchAPI(stall=True)
+    with stand_in_generator(api, timeout=0.05) as batch_generator:
+        try:
+            batch_generator.generate_posts(TOPICS)
+        except TimeoutError:
+            pass
+        else:
+            raise AssertionError("stalled batch did not time out")
+
+    assert api.cancelled == ['batch-1']
+    assert api.batches['batch-1']['status'] == 'cancelled'
+
+
+def main():
+    """Batch API 생성 테스트 실행"""
+    print("AutoBlog-Pipe Batch Generation Test (stand-in endpoint)")
+    print("=" * 60)
+
+    try:
+        test_batch_roundtrip()
+        print("OK Batch submit/poll/collect round trip succeeded")
+        test_batch_server_error()
+        print("OK Batch creation server error is raised after retries")
+        test_batch_timeout_cancels()
+        print("OK Timed-out batch is cancelled")
+        return True
+    except AssertionError as e:
+        print(f"ERROR Batch round trip produced unexpected results: {e}")
+        return False
+    except Exception as e:
+        print(f"ERROR Batch round trip failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
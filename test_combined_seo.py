@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+본문 + SEO 메타데이터 단일 호출 테스트 - 가짜 completion으로 JSON 스키마 검증·재시도·Front Matter 구성 검증
+실제 OpenAI API 키 없이 실행 가능
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app.generators.content_gen import ContentGenerator
+from app.generators.response_cache import LLMResponseCache
+from app.generators.seo_gen import SEOGenerator
+from app.generators.structured_post import POST_SCHEMA
+from app.utils.retry_engine import RetryEngine, RetryPolicy
+
+VALID_RESPONSE = json.dumps({
+    'content': "# 원격 근무 생산성 가이드\n\n## 소개\n\n" + "원격 근무 환경에서 집중력을 유지하는 방법을 정리합니다. " * 10
+               + "\n\n## 도구\n\n" + "협업 도구와 시간 관리 앱을 활용합니다. " * 10
+               + "\n\n## 결론\n\n" + "작은 습관부터 바꿔 보세요. " * 10,
+    'meta_description': '원격 근무에서 생산성을 높이는 실전 팁과 도구를 정리했습니다. 집중력 유지부터 협업 도구까지 지금 확인해보세요.',
+    'tags': ['원격 근무', '생산성', '협업 도구'],
+    'category': 'productivity',
+}, ensure_ascii=False)
+
+
+class FakeCompletions:
+    """첫 응답은 스키마 위반, 이후 올바른 JSON을 돌려주는 가짜 _generate_once"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, api_kwargs, route, draft_path=None):
+        self.requests.append(api_kwargs)
+        if len(self.requests) == 1:
+            return '{"content": "# 잘린 응답"}'
+        return VALID_RESPONSE
+
+
+def run_combined_post():
+    """가짜 completion으로 결합 모드 포스트 생성 후 (포스트, 가짜 객체) 반환"""
+    generator = ContentGenerator(api_key='test-key', client=object(), response_cache=LLMResponseCache(mode='off'))
+    generator.retry_engine = RetryEngine('openai', RetryPolicy(max_attempts=3), retry_on=(ValueError,),
+                                         sleep=lambda seconds: None)
+    fake = FakeCompletions()
+    generator._generate_once = fake
+
+    seo_generator = SEOGenerator(generator)
+    seo_generator.combined_generation = True
+    topic = {'title': '원격 근무 생산성 가이드', 'post_type': 'guide', 'keywords': ['원격 근무']}
+    return seo_generator.create_full_post(topic), fake
+
+
+def test_combined_seo_post():
+    """한 번의 구조화 응답으로 본문과 Front Matter 메타데이터 구성"""
+    full_post, fake = run_combined_post()
+
+    # 스키마 위반 응답은 재시도되고, 메타 설명용 두 번째 호출은 없음
+    assert len(fake.requests) == 2
+    assert all(request['response_format']['json_schema']['schema'] == POST_SCHEMA for request in fake.requests)
+
+    _, front_matter_yaml, body = full_post.split('---', 2)
+    front_matter = yaml.safe_load(front_matter_yaml)
+    assert front_matter['categories'] == ['productivity']
+    assert front_matter['excerpt'].startswith('원격 근무에서 생산성을 높이는')
+    assert front_matter['tags'] == ['원격 근무', '생산성', '협업 도구']
+    assert body.strip().startswith('# 원격 근무 생산성 가이드')
+
+
+def main():
+    """결합 모드 테스트 실행"""
+    print("AutoBlog-Pipe Combined SEO Generation Test (fake completions)")
+    print("=" * 60)
+
+    try:
+        test_combined_seo_post()
+        print("OK One structured call produced body and front matter metadata")
+        return True
+    except AssertionError as e:
+        print(f"ERROR Combined generation produced unexpected results: {e}")
+        return False
+    except Exception as e:
+        print(f"ERROR Combined generation failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
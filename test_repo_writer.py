@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+RepoWriter 저장 테스트 - 임시 Git 저장소에 포스트를 저장하고 Front Matter 병합 결과 검증
+실제 사이트 저장소나 OpenAI API 키 없이 실행 가능
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import git
+
+from app.publishers.repo_writer import RepoWriter
+from app.utils.front_matter import read_front_matter
+
+SEO_POST = """---
+title: "SEO 제목"
+date: 2020-01-01 00:00:00 +0900
+categories: [seo]
+tags: [seo-tag]
+description: "SEO 설명"
+---
+
+# 본문
+
+내용입니다.
+"""
+
+
+def save_in_temp_repo(**kwargs):
+    """임시 저장소에 SEO_POST를 저장하고 (Front Matter, 파일명) 반환"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        git.Repo.init(tmp_dir)
+        writer = RepoWriter(repo_path=tmp_dir, site_dir=str(Path(tmp_dir) / 'site'))
+        file_path = writer.save_post(SEO_POST, '테스트 포스트', **kwargs)
+        # 예약용 임시 파일은 남지 않고 포스트 하나만 생성됨
+        assert [path.name for path in writer.posts_dir.iterdir()] == [file_path.name]
+        return read_front_matter(file_path), file_path.name
+
+
+def test_explicit_fields_win():
+    """호출자가 넘긴 카테고리·태그·날짜는 본문 Front Matter보다 우선, 나머지 SEO 필드는 유지"""
+    front_matter, filename = save_in_temp_repo(date=datetime(2025, 3, 4, 5, 6, 7), category='tech', tags=['python'])
+
+    assert front_matter['title'] == '테스트 포스트'
+    assert front_matter['categories'] == ['tech']
+    assert front_matter['tags'] == ['python']
+    assert str(front_matter['date']).startswith('2025-03-04 05:06:07')
+    assert front_matter['description'] == 'SEO 설명'
+    assert front_matter['layout'] == 'post' and front_matter['author'] == 'AutoBot'
+    assert filename.startswith('2025-03-04-')
+
+
+def test_embedded_fields_fill_defaults():
+    """넘기지 않은 태그·날짜는 본문 Front Matter 값을 사용"""
+    front_matter, _ = save_in_temp_repo(category='tech')
+
+    assert front_matter['categories'] == ['tech']
+    assert front_matter['tags'] == ['seo-tag']
+    assert str(front_matter['date']).startswith('2020-01-01')
+
+
+def main():
+    """RepoWriter 저장 테스트 실행"""
+    print("AutoBlog-Pipe RepoWriter Save Test")
+    print("=" * 60)
+
+    try:
+        test_explicit_fields_win()
+        print("OK Caller-supplied category, tags and date override embedded front matter")
+        test_embedded_fields_fill_defaults()
+        print("OK Embedded front matter fills fields the caller did not pass")
+        return True
+    except AssertionError as e:
+        print(f"ERROR Saved front matter is not as expected: {e}")
+        return False
+    except Exception as e:
+        print(f"ERROR RepoWriter save test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
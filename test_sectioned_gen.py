@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+개요 → 섹션 병렬 생성 테스트 - 지연이 있는 가짜 completion으로 병렬 실행과 문서 병합 검증
+실제 OpenAI API 키 없이 실행 가능
+"""
+
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app.generators.content_gen import ContentGenerator
+from app.generators.response_cache import LLMResponseCache
+
+SECTION_DELAY = 0.3
+OUTLINE = "## 소개\n## 핵심 개념\n## 최근 동향\n## 활용 사례\n## 결론"
+
+
+class FakeCompletions:
+    """호출 유형별로 지연 후 응답하는 가짜 complete()"""
+
+    def __init__(self, outline_error=None):
+        self.outline_error = outline_error
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, api_kwargs, call_type='body'):
+        with self.lock:
+            self.calls.append(call_type)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if call_type == 'outline':
+                if self.outline_error is not None:
+                    raise self.outline_error
+                return OUTLINE
+            if call_type == 'body':
+                return "# AI 에이전트 입문\n\n## 소개\n\n" + "단일 호출로 생성한 본문입니다. " * 30
+            user_message = api_kwargs['messages'][-1]['content']
+            section = re.search(r'^- section: (.+)$', user_message, re.MULTILINE).group(1)
+            position = re.search(r'^- position: (.+)$', user_message, re.MULTILINE).group(1)
+            time.sleep(SECTION_DELAY)
+            body = f"## {section}\n\n" + f"{section}에 대한 설명입니다. " * 15
+            if 'last section' in position:
+                body += "\n\nTags: [AI, 에이전트, 자동화]"
+            return body
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def run_sectioned_generation(outline_error=None):
+    """가짜 completion으로 섹션 모드 생성 후 (본문, 소요 시간, 가짜 객체) 반환"""
+    generator = ContentGenerator(api_key='test-key', client=object(), response_cache=LLMResponseCache(mode='off'))
+    generator.section_workers = 5
+    fake = FakeCompletions(outline_error)
+    generator.complete = fake
+
+    start_time = time.monotonic()
+    content = generator.generate_sectioned('AI 에이전트 입문', 'Key Facts:\n- 에이전트는 도구를 호출한다')
+    return content, time.monotonic() - start_time, generator, fake
+
+
+def test_sectioned_generation():
+    """개요 1회 + 섹션 병렬 생성, 결과는 검증을 통과하는 하나의 문서"""
+    content, elapsed, generator, fake = run_sectioned_generation()
+
+    assert fake.calls[0] == 'outline' and fake.calls.count('section') == 5
+    # 섹션들이 동시에 실행되어 소요 시간이 가장 긴 섹션 수준
+    assert fake.max_active > 1
+    assert elapsed < SECTION_DELAY * 3
+
+    assert content.startswith('# AI 에이전트 입문\n')
+    headings = re.findall(r'^## (.+)$', content, re.MULTILINE)
+    assert headings == ['소개', '핵심 개념', '최근 동향', '활용 사례', '결론']
+    assert content.count('Tags:') == 1 and content.rstrip().endswith('Tags: [AI, 에이전트, 자동화]')
+    assert generator.validate_content(content)
+
+
+def test_outline_failure_falls_back():
+    """개요 호출이 실패하면 글 전체를 실패시키지 않고 단일 호출로 생성"""
+    content, _, _, fake = run_sectioned_generation(outline_error=ValueError("Empty response from OpenAI API"))
+
+    assert fake.calls == ['outline', 'body']
+    assert content.startswith('# AI 에이전트 입문\n') and '단일 호출로 생성한 본문' in content
+
+
+def main():
+    """섹션 병렬 생성 테스트 실행"""
+    print("AutoBlog-Pipe Sectioned Generation Test (fake completions)")
+    print("=" * 60)
+
+    try:
+        test_sectioned_generation()
+        print("OK Outline + parallel sections produced a valid post")
+        test_outline_failure_falls_back()
+        print("OK Failed outline call falls back to a single completion")
+        return True
+    except AssertionError as e:
+        print(f"ERROR Sectioned generation produced unexpected results: {e}")
+        return False
+    except Exception as e:
+        print(f"ERROR Sectioned generation failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+제목 유사도 인덱스 테스트 - 무작위 제목 코퍼스에서 전체 difflib 비교와 같은 판정인지 검증(속성 테스트)하고 속도 비교
+실제 _posts나 OpenAI API 키 없이 실행 가능
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.post_index import normalize_title
+from app.utils.title_similarity import TitleSimilarityIndex, title_ratio
+
+THRESHOLD = 0.7
+WORDS = ("ai agents future remote work productivity guide best tools trends cloud gaming electric vehicles "
+         "smart home gadgets machine learning quantum computing sustainable technology 5g iot devices "
+         "camping tips review 2025 open source model privacy security startup funding 원격 근무 생산성 인공지능").split()
+
+
+def random_title(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 8))).title()
+
+
+def mutate(title: str, rng: random.Random) -> str:
+    """기존 제목을 조금 바꿔 임계값 근처의 질의 생성 (문자 삽입·삭제·치환, 단어 추가)"""
+    chars = list(title)
+    for _ in range(rng.randint(0, 6)):
+        operation = rng.random()
+        position = rng.randrange(len(chars) + 1)
+        if operation < 0.3:
+            chars.insert(position, rng.choice('abcdefghij -!'))
+        elif operation < 0.6 and position < len(chars):
+            del chars[position]
+        elif position < len(chars):
+            chars[position] = rng.choice('klmnopqrst ')
+    mutated = ''.join(chars)
+    if rng.random() < 0.3:
+        mutated = f"{mutated} {rng.choice(WORDS)}"
+    return mutated
+
+
+def build_corpus(size: int, seed: int):
+    rng = random.Random(seed)
+    titles = [random_title(rng) for _ in range(size)]
+    queries = [mutate(rng.choice(titles), rng) if rng.random() < 0.6 else random_title(rng) for _ in range(size // 4)]
+    return titles, queries
+
+
+def brute_force(query: str, titles) -> bool:
+    """기존 방식: 모든 제목과 title_ratio 계산"""
+    return any(title_ratio(query, title) >= THRESHOLD for title in titles)
+
+
+def test_same_decisions():
+    """속성 테스트: 인덱스 판정 == 전체 difflib 비교 판정 (여러 시드, 경계 근처 질의 포함)"""
+    for seed in range(3):
+        titles, queries = build_corpus(400, seed)
+        normalized = [normalize_title(title) for title in titles]
+        index = TitleSimilarityIndex(normalized)
+        matches = 0
+        for query in map(normalize_title, queries + ['', titles[0]]):
+            found = index.find_similar(query, THRESHOLD)
+            assert (found is not None) == brute_force(query, normalized), query
+            if found is not None:
+                matches += 1
+                assert found[1] == title_ratio(query, normalized[found[0]]) >= THRESHOLD
+        assert 0 < matches < len(queries)
+
+    # 공통 3-gram이 없어도 0.7 이상일 수 있는 경우도 놓치지 않음
+    assert TitleSimilarityIndex(["abcd"]).find_similar("abxcd", THRESHOLD) is not None
+
+
+def benchmark(size: int = 20000, query_count: int = 50):
+    """전체 difflib 비교 대비 속도 (질의당 ms)"""
+    titles, queries = build_corpus(size, seed=42)
+    normalized = [normalize_title(title) for title in titles]
+    queries = [normalize_title(query) for query in queries[:query_count]]
+
+    start = time.perf_counter()
+    index = TitleSimilarityIndex(normalized)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    baseline = [brute_force(query, normalized) for query in queries]
+    baseline_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    start = time.perf_counter()
+    indexed = [index.find_similar(query, THRESHOLD) is not None for query in queries]
+    indexed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    print(f"  Corpus: {size} titles, index built in {build_seconds:.2f}s")
+    print(f"  difflib scan: {baseline_ms:.2f}ms/query, index: {indexed_ms:.2f}ms/query "
+          f"({baseline_ms / indexed_ms:.0f}x), same decisions: {baseline == indexed}")
+    return baseline == indexed
+
+
+def main():
+    """제목 유사도 인덱스 테스트 실행"""
+    print("AutoBlog-Pipe Title Similarity Index Test")
+    print("=" * 60)
+
+    try:
+        test_same_decisions()
+        print("OK Index decisions match a full difflib scan at the 0.7 threshold")
+        return benchmark()
+    except AssertionError as e:
+        print(f"ERROR Index decision differs from difflib scan: {e}")
+        return False
+    except Exception as e:
+        print(f"ERROR Title similarity test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)